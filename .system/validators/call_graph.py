@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+Call Graph
+
+Project-wide GDScript call graph used to find every function that runs on
+a hot path. The performance checks used to look only at the literal bodies
+of _process()/_physics_process(), so a get_node() or .instantiate() inside
+a helper called every frame went unnoticed.
+
+Edges are resolved from the parsed statement tree (gdscript_parser.py):
+- Same script:    helper() / self.helper()   (also inherited via `extends`)
+- class_name:     Pathfinding.find(...)      (static call on a global class)
+- Typed variable: var target: Enemy ... target.take_damage(...)
+- preload:        const Pool = preload("res://.../pool.gd") ... Pool.get(...)
+- Autoload:       CombatService.resolve(...) (singletons from project.godot)
+- By name:        call_deferred("deactivate") / call("reset")
+
+Calls that cannot be resolved statically (untyped variables, signals,
+call()/callv()) are ignored - the graph under-approximates.
+
+Usage:
+    from call_graph import build_call_graph
+
+    graph = build_call_graph(model)
+    hot = graph.hot_paths({"_process", "_physics_process"})
+    for (rel_path, func), chain in hot.items():
+        print(rel_path, func, format_chain(chain))
+"""
+
+import re
+from collections import deque
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from gdscript_parser import ANNOTATION, NAME, STRING, Call, FunctionSpan, Statement
+from project_model import ProjectModel, SourceFile
+
+# (project-relative script path, function name)
+FunctionKey = Tuple[Path, str]
+
+CLASS_NAME_PATTERN = re.compile(r'^class_name\s+(\w+)', re.MULTILINE)
+EXTENDS_NAME_PATTERN = re.compile(r'^extends\s+(\w+)', re.MULTILINE)
+EXTENDS_PATH_PATTERN = re.compile(r'^extends\s+"res://([^"]+)"', re.MULTILINE)
+PRELOAD_CONST_PATTERN = re.compile(r'^\s*const\s+(\w+)\s*(?::\s*\w+\s*)?=\s*(?:pre)?load\(\s*"res://([^"]+\.gd)"\s*\)', re.MULTILINE)
+# Methods that invoke another method by name given as a string literal
+DISPATCH_METHODS = {"call", "call_deferred"}
+
+AUTOLOAD_PATTERN = re.compile(r'^(\w+)\s*=\s*"\*?res://([^"]+\.gd)"', re.MULTILINE)
+
+
+class ScriptInfo:
+    """Declarations of one script needed to resolve calls."""
+    def __init__(self, source: SourceFile):
+        self.source = source
+        self.rel_path = source.rel_path
+        self.functions: Set[str] = {span.name for span in source.index.functions}
+
+        match = CLASS_NAME_PATTERN.search(source.content)
+        self.class_name: Optional[str] = match.group(1) if match else None
+
+        self.base_name: Optional[str] = None   # extends ClassName
+        self.base_path: Optional[Path] = None  # extends "res://..."
+        path_match = EXTENDS_PATH_PATTERN.search(source.content)
+        if path_match:
+            self.base_path = Path(path_match.group(1))
+        else:
+            name_match = EXTENDS_NAME_PATTERN.search(source.content)
+            if name_match:
+                self.base_name = name_match.group(1)
+
+        # const Name = preload("res://x.gd")
+        self.preloads: Dict[str, Path] = {
+            name: Path(path) for name, path in PRELOAD_CONST_PATTERN.findall(source.content)
+        }
+
+        # var name: Type / var name := Type.new() (any scope - names rarely collide)
+        self.var_types: Dict[str, str] = {}
+        for statement in source.parsed.walk():
+            if statement.kind == "var":
+                var_name, type_name = _declared_type(statement)
+                if var_name and type_name:
+                    self.var_types[var_name] = type_name
+
+
+def _declared_type(statement: Statement) -> Tuple[Optional[str], Optional[str]]:
+    """(variable, type name) from `var x: T`, `var x := T.new()` or `var x = T.new()`."""
+    tokens = [t for t in statement.tokens if t.kind != ANNOTATION]
+    values = [t.value for t in tokens]
+    try:
+        start = values.index("var")
+    except ValueError:
+        return None, None
+    if start + 1 >= len(tokens) or tokens[start + 1].kind != NAME:
+        return None, None
+    var_name = values[start + 1]
+    rest = values[start + 2:]
+
+    # var x: Type
+    if len(rest) >= 2 and rest[0] == ":" and tokens[start + 3].kind == NAME:
+        return var_name, rest[1]
+    # var x := Type.new() / var x = Type.new()
+    if len(rest) >= 4 and rest[0] in (":=", "=") and rest[2] == "." and rest[3] == "new":
+        return var_name, rest[1]
+    return var_name, None
+
+
+def string_dispatch_calls(statement: Statement) -> List[Call]:
+    """Calls made by name: call_deferred("deactivate"), self.call("reset")."""
+    calls = []
+    tokens = statement.tokens
+    for index, token in enumerate(tokens[:-2]):
+        if token.kind != NAME or token.value not in DISPATCH_METHODS or tokens[index + 1].value != "(":
+            continue
+        target = tokens[index + 2]
+        if target.kind != STRING:
+            continue
+        receiver = None
+        if index > 1 and tokens[index - 1].value == ".":
+            receiver = tokens[index - 2].value
+        calls.append(Call(target.value.strip("\"'"), receiver, token.line))
+    return calls
+
+
+class CallGraph:
+    """Resolved call edges between functions across the project."""
+    def __init__(self, model: ProjectModel):
+        self.model = model
+        self.scripts: Dict[Path, ScriptInfo] = {}
+        self.classes: Dict[str, Path] = {}
+        self.autoloads: Dict[str, Path] = {}
+        self.edges: Dict[FunctionKey, List[Tuple[FunctionKey, int]]] = {}
+
+        for source in model.gd_files():
+            info = ScriptInfo(source)
+            self.scripts[info.rel_path] = info
+            if info.class_name:
+                self.classes[info.class_name] = info.rel_path
+
+        project_file = model.get(Path("project.godot"))
+        if project_file is not None:
+            for name, path in AUTOLOAD_PATTERN.findall(project_file.content):
+                self.autoloads[name] = Path(path)
+
+        for info in self.scripts.values():
+            self._add_edges(info)
+
+    def _base(self, info: ScriptInfo) -> Optional[ScriptInfo]:
+        if info.base_path is not None:
+            return self.scripts.get(info.base_path)
+        if info.base_name is not None and info.base_name in self.classes:
+            return self.scripts.get(self.classes[info.base_name])
+        return None
+
+    def _defining_script(self, rel_path: Optional[Path], func: str) -> Optional[Path]:
+        """Script that defines `func` for an object of script `rel_path` (follows extends)."""
+        seen: Set[Path] = set()
+        info = self.scripts.get(rel_path) if rel_path is not None else None
+        while info is not None and info.rel_path not in seen:
+            if func in info.functions:
+                return info.rel_path
+            seen.add(info.rel_path)
+            info = self._base(info)
+        return None
+
+    def _script_for_type(self, info: ScriptInfo, type_name: str) -> Optional[Path]:
+        if type_name in info.preloads:
+            return info.preloads[type_name]
+        return self.classes.get(type_name)
+
+    def _resolve(self, info: ScriptInfo, receiver: Optional[str], func: str) -> Optional[Path]:
+        if receiver is None or receiver == "self":
+            return self._defining_script(info.rel_path, func)
+        if receiver in info.var_types:
+            return self._defining_script(self._script_for_type(info, info.var_types[receiver]), func)
+        if receiver in info.preloads:
+            return self._defining_script(info.preloads[receiver], func)
+        if receiver in self.classes:
+            return self._defining_script(self.classes[receiver], func)
+        if receiver in self.autoloads:
+            return self._defining_script(self.autoloads[receiver], func)
+        return None
+
+    def resolve_call(self, rel_path: Path, call: Call) -> Optional[FunctionKey]:
+        """Function a call made in script `rel_path` lands in, or None if unknown."""
+        info = self.scripts.get(rel_path)
+        if info is None:
+            return None
+        target = self._resolve(info, call.receiver, call.name)
+        return (target, call.name) if target is not None else None
+
+    def _add_edges(self, info: ScriptInfo) -> None:
+        for span in info.source.index.functions:
+            caller = (info.rel_path, span.name)
+            edges = self.edges.setdefault(caller, [])
+            for statement in span.statement.body():
+                for call in statement.calls + string_dispatch_calls(statement):
+                    callee = self.resolve_call(info.rel_path, call)
+                    if callee is not None and callee != caller:
+                        edges.append((callee, call.line))
+
+    def function(self, key: FunctionKey) -> Optional[FunctionSpan]:
+        """Span of a graph node (first definition if the name repeats)."""
+        info = self.scripts.get(key[0])
+        return info.source.function(key[1]) if info is not None else None
+
+    def hot_paths(self, roots: Iterable[str]) -> Dict[FunctionKey, List[FunctionKey]]:
+        """
+        Every function reachable from a callback named in `roots`, mapped to
+        the shortest call chain that reaches it (root first, itself last).
+        """
+        root_names = set(roots)
+        return self.hot_paths_from(
+            (info.rel_path, name)
+            for info in self.scripts.values()
+            for name in sorted(root_names & info.functions)
+        )
+
+    def hot_paths_from(self, roots: Iterable[FunctionKey]) -> Dict[FunctionKey, List[FunctionKey]]:
+        """Like hot_paths(), starting from explicit (script, function) roots."""
+        chains: Dict[FunctionKey, List[FunctionKey]] = {}
+        queue: deque = deque()
+
+        for key in roots:
+            if key not in chains:
+                chains[key] = [key]
+                queue.append(key)
+
+        while queue:
+            caller = queue.popleft()
+            for callee, _line in self.edges.get(caller, ()):
+                if callee not in chains:
+                    chains[callee] = chains[caller] + [callee]
+                    queue.append(callee)
+
+        return chains
+
+
+def hot_chains_for(hot: Dict[FunctionKey, List[FunctionKey]], rel_path: Path) -> Dict[str, List[FunctionKey]]:
+    """Hot functions of one script: function name -> call chain."""
+    return {func: chain for (path, func), chain in hot.items() if path == rel_path}
+
+
+def format_chain(chain: List[FunctionKey]) -> str:
+    """
+    `_process() → update_ai() → enemy.gd:find_target()`
+
+    Functions outside the chain's first script are prefixed with their file;
+    so is the callback itself when the chain ends in another script.
+    """
+    if not chain:
+        return ""
+    origin = chain[0][0]
+    parts = []
+    for position, (rel_path, func) in enumerate(chain):
+        show_file = rel_path != origin or (position == 0 and chain[-1][0] != origin)
+        parts.append(f"{rel_path.name}:{func}()" if show_file else f"{func}()")
+    return " → ".join(parts)
+
+
+_GRAPHS: Dict[int, CallGraph] = {}
+
+
+def build_call_graph(model: ProjectModel) -> CallGraph:
+    """Build the call graph for `model`, or return the one already built."""
+    if id(model) not in _GRAPHS:
+        _GRAPHS[id(model)] = CallGraph(model)
+    return _GRAPHS[id(model)]
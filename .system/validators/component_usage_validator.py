@@ -20,7 +20,9 @@ Runs during pre-commit to prevent dead code and false refactor claims.
 import re
 import sys
 from pathlib import Path
-from typing import List, Tuple, Dict
+from typing import List, Tuple, Dict, Optional, Set
+
+from project_model import ProjectModel, SourceFile, load_project_model
 
 # ANSI colors
 RED = '\033[0;31m'
@@ -29,10 +31,10 @@ YELLOW = '\033[1;33m'
 CYAN = '\033[0;36m'
 NC = '\033[0m'
 
-PROJECT_ROOT = Path(__file__).parent.parent.parent
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
 
 
-def discover_component_scenes() -> List[Path]:
+def discover_component_scenes(model: ProjectModel) -> List[Path]:
     """
     Discover component scenes (in scenes/ui/ and scenes/components/).
     These are scenes that should be used as reusable components.
@@ -40,19 +42,15 @@ def discover_component_scenes() -> List[Path]:
     component_scenes = []
 
     # Check scenes/ui/ for UI components
-    ui_dir = PROJECT_ROOT / "scenes" / "ui"
-    if ui_dir.exists():
-        component_scenes.extend(ui_dir.glob("*.tscn"))
+    component_scenes.extend(s.path for s in model.glob("scenes/ui/*.tscn"))
 
     # Check scenes/components/ if it exists
-    components_dir = PROJECT_ROOT / "scenes" / "components"
-    if components_dir.exists():
-        component_scenes.extend(components_dir.glob("*.tscn"))
+    component_scenes.extend(s.path for s in model.glob("scenes/components/*.tscn"))
 
     return sorted(component_scenes)
 
 
-def find_scene_usage(scene_path: Path) -> Tuple[List[Path], List[Path], bool]:
+def find_scene_usage(scene_path: Path, scripts: List[SourceFile]) -> Tuple[List[Path], List[Path], bool]:
     """
     Find where a scene is used in the codebase.
 
@@ -66,14 +64,11 @@ def find_scene_usage(scene_path: Path) -> Tuple[List[Path], List[Path], bool]:
     files_with_instantiate = []
     used_for_scene_change = False
 
-    # Search all .gd files
-    scripts_dir = PROJECT_ROOT / "scripts"
-    if not scripts_dir.exists():
-        return (files_with_preload, files_with_instantiate, used_for_scene_change)
-
-    for script_file in scripts_dir.rglob("*.gd"):
+    # Search all .gd files (already read once by the project model)
+    for script in scripts:
+        script_file = script.path
         try:
-            content = script_file.read_text()
+            content = script.content
 
             # Check for scene change usage (not a component usage)
             if f'change_scene_to_file("{res_path}")' in content:
@@ -105,7 +100,19 @@ def find_scene_usage(scene_path: Path) -> Tuple[List[Path], List[Path], bool]:
     return (files_with_preload, files_with_instantiate, used_for_scene_change)
 
 
-def validate_component_usage() -> Tuple[bool, List[Tuple[Path, str]]]:
+def find_scene_instances(model: ProjectModel) -> Set[str]:
+    """res:// paths of scenes instanced by a node of another scene."""
+    instanced = set()
+    for scene in model.scene_files():
+        parsed = scene.scene
+        for node in parsed.nodes:
+            scene_path = parsed.instanced_scene(node)
+            if scene_path:
+                instanced.add(scene_path)
+    return instanced
+
+
+def validate_component_usage(model: ProjectModel) -> Tuple[bool, List[Tuple[Path, str]]]:
     """
     Validate that components are properly used.
 
@@ -114,14 +121,16 @@ def validate_component_usage() -> Tuple[bool, List[Tuple[Path, str]]]:
     warnings = []
     errors = []
 
-    component_scenes = discover_component_scenes()
+    component_scenes = discover_component_scenes(model)
+    scripts = model.glob("scripts/**/*.gd")
+    instanced = find_scene_instances(model)
 
     if not component_scenes:
         return (True, [])
 
     for scene_path in component_scenes:
         relative_path = scene_path.relative_to(PROJECT_ROOT)
-        files_with_preload, files_with_instantiate, used_for_scene_change = find_scene_usage(scene_path)
+        files_with_preload, files_with_instantiate, used_for_scene_change = find_scene_usage(scene_path, scripts)
 
         # Skip scenes used for scene transitions (not components)
         if used_for_scene_change:
@@ -129,10 +138,12 @@ def validate_component_usage() -> Tuple[bool, List[Tuple[Path, str]]]:
 
         # Case 1: Component never used (WARNING)
         if not files_with_preload and not files_with_instantiate:
-            # Skip common UI scenes that are instanced in .tscn files
+            # Skip UI scenes that are instanced in .tscn files, not code
             scene_name = scene_path.stem
             if scene_name in ['hud', 'wave_complete_screen', 'debug_weapon_switcher']:
-                continue  # These are instanced in .tscn files, not code
+                continue
+            if model.get(scene_path).res_path in instanced:
+                continue
 
             warnings.append((
                 scene_path,
@@ -155,11 +166,12 @@ def validate_component_usage() -> Tuple[bool, List[Tuple[Path, str]]]:
     return (len(errors) == 0, warnings, errors)
 
 
-def main() -> int:
+def main(model: Optional[ProjectModel] = None) -> int:
     """Main validation function"""
     print(f"{CYAN}🔍 Validating component usage...{NC}\n")
 
-    all_valid, warnings, errors = validate_component_usage()
+    model = model or load_project_model(PROJECT_ROOT)
+    all_valid, warnings, errors = validate_component_usage(model)
 
     # Display warnings
     if warnings:
@@ -22,9 +22,11 @@ Exit Codes:
 import sys
 import re
 from pathlib import Path
-from typing import Dict, Set, List, Tuple
+from typing import Dict, Set, List, Tuple, Optional
 from collections import defaultdict
 
+from project_model import ProjectModel, SourceFile, load_project_model
+
 # ANSI colors
 RED = '\033[0;31m'
 GREEN = '\033[0;32m'
@@ -34,29 +36,26 @@ NC = '\033[0m'
 
 
 class DataModelValidator:
-    def __init__(self, project_root: Path):
+    def __init__(self, project_root: Path, model: Optional[ProjectModel] = None):
         self.project_root = project_root
+        self.model = model or load_project_model(project_root)
         self.service_models: Dict[str, Set[str]] = {}
         self.field_accesses: Dict[Path, List[Tuple[int, str, str]]] = defaultdict(list)
         self.issues: List[Tuple[Path, int, str, str, str]] = []
 
     def extract_service_data_models(self):
         """Extract data model field names from service files"""
-        services_dir = self.project_root / "scripts" / "services"
-        if not services_dir.exists():
-            return
-
-        for service_file in services_dir.glob("*_service.gd"):
-            service_name = service_file.stem
+        for service_file in self.model.glob("scripts/services/*_service.gd"):
+            service_name = service_file.path.stem
             fields = self._extract_fields_from_service(service_file)
             if fields:
                 self.service_models[service_name] = fields
 
-    def _extract_fields_from_service(self, service_file: Path) -> Set[str]:
+    def _extract_fields_from_service(self, service_file: SourceFile) -> Set[str]:
         """Extract field names from dictionary assignments in a service"""
         fields = set()
         try:
-            content = service_file.read_text()
+            content = service_file.content
 
             # Pattern 1: Dictionary key-value pairs like "field": value (handles multiline)
             # Match any "field_name": pattern within the content
@@ -74,29 +73,19 @@ class DataModelValidator:
             fields.update(comment_fields)
 
         except Exception as e:
-            print(f"{YELLOW}⚠️  Could not read {service_file}: {e}{NC}")
+            print(f"{YELLOW}⚠️  Could not read {service_file.path}: {e}{NC}")
 
         return fields
 
     def scan_field_accesses(self):
         """Scan all GDScript files for Dictionary .get() calls"""
-        for gd_file in self.project_root.rglob("*.gd"):
-            # Skip addons
-            if "addons" in gd_file.parts:
-                continue
-
-            try:
-                content = gd_file.read_text()
-                lines = content.split('\n')
-
-                for line_num, line in enumerate(lines, 1):
-                    # Pattern: object.get("field_name", default)
-                    matches = re.findall(r'(\w+)\.get\(["\'](\w+)["\']', line)
-                    for obj, field in matches:
-                        self.field_accesses[gd_file].append((line_num, obj, field))
-
-            except Exception as e:
-                print(f"{YELLOW}⚠️  Could not read {gd_file}: {e}{NC}")
+        # addons/ is excluded by the project model
+        for gd_file in self.model.gd_files():
+            for line_num, line in enumerate(gd_file.lines, 1):
+                # Pattern: object.get("field_name", default)
+                matches = re.findall(r'(\w+)\.get\(["\'](\w+)["\']', line)
+                for obj, field in matches:
+                    self.field_accesses[gd_file.path].append((line_num, obj, field))
 
     def cross_reference_fields(self):
         """Cross-reference field accesses against service data models"""
@@ -182,12 +171,12 @@ class DataModelValidator:
         return True  # Don't block commits
 
 
-def main():
-    project_root = Path(__file__).parent.parent.parent
+def main(model: Optional[ProjectModel] = None):
+    project_root = Path(__file__).resolve().parent.parent.parent
 
     print(f"{CYAN}Validating data model consistency...{NC}")
 
-    validator = DataModelValidator(project_root)
+    validator = DataModelValidator(project_root, model)
 
     # Step 1: Extract service data models
     validator.extract_service_data_models()
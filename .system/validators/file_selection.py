@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+File Selection (staged-files incremental mode)
+
+Decides which files the per-file validators analyse. By default that is the
+files staged for commit (`git diff --cached`) plus their reverse dependencies
+in the project model (scripts and scenes that preload, load or extend a
+staged file), so a commit touching one script checks a handful of files
+instead of the whole tree.
+
+Selection rules:
+- `--full`          -> every file (CI uses this)
+- explicit paths    -> those files plus their reverse dependencies
+- nothing given     -> staged files plus reverse dependencies; falls back to
+                       every file when nothing is staged or git is unavailable
+
+Staged deletions (and the old side of renames) count as changed: the deleted
+file cannot be loaded, but the scripts and scenes that still extend or
+reference it are selected, so a dangling `extends`/res:// reference is
+caught in staged mode and not only by --full.
+
+Usage (inside a validator):
+    from file_selection import FileSelection, selection_from_argv
+
+    def main(model=None, selection: Optional[FileSelection] = None) -> int:
+        model = model or load_project_model(PROJECT_ROOT)
+        selection = selection or selection_from_argv(model)
+        for source in model.gd_files():
+            if not selection.includes(source):
+                continue
+            ...
+
+    python3 .system/validators/godot_performance_validator.py            # Staged files
+    python3 .system/validators/godot_performance_validator.py --full     # Whole project
+    python3 .system/validators/godot_performance_validator.py scripts/entities/enemy.gd
+"""
+
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+from typing import Iterable, List, Optional, Set
+
+from project_model import CLASS_NAME_PATTERN, ProjectModel, SourceFile
+
+
+class FileSelection:
+    """Set of project-relative paths to analyse (None means every file)."""
+    def __init__(self, paths: Optional[Set[Path]] = None, requested: int = 0):
+        self.paths = paths
+        self.requested = requested  # Files named explicitly / staged
+
+    @property
+    def full(self) -> bool:
+        return self.paths is None
+
+    def includes(self, source: SourceFile) -> bool:
+        return self.paths is None or source.rel_path in self.paths
+
+    def describe(self) -> str:
+        if self.paths is None:
+            return "all files"
+        dependents = len(self.paths) - self.requested
+        return f"{self.requested} changed file(s) + {max(dependents, 0)} dependent(s)"
+
+
+def staged_paths(root: Path) -> Optional[List[Path]]:
+    """
+    Files staged for commit (added/copied/modified/renamed/deleted, plus the
+    old path of a rename), or None if git fails.
+    """
+    try:
+        result = subprocess.run(
+            ["git", "diff", "--cached", "--name-status", "--diff-filter=ACMRD", "-z"],
+            cwd=root,
+            capture_output=True,
+            text=True,
+            timeout=30
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    if result.returncode != 0:
+        return None
+
+    # -z --name-status: "M\0path\0", "R100\0old\0new\0"
+    fields = [field for field in result.stdout.split('\0') if field]
+    paths: List[Path] = []
+    i = 0
+    while i < len(fields):
+        status = fields[i]
+        if status[:1] in ("R", "C"):
+            old, new = fields[i + 1:i + 3]
+            if status[0] == "R":
+                paths.append(Path(old))
+            paths.append(Path(new))
+            i += 3
+        else:
+            paths.extend(Path(name) for name in fields[i + 1:i + 2])
+            i += 2
+    return paths
+
+
+def removed_class_names(root: Path, paths: Iterable[Path]) -> Set[str]:
+    """`class_name`s declared at HEAD by scripts in `paths` that no longer exist."""
+    names: Set[str] = set()
+    for path in paths:
+        if path.suffix != ".gd" or (root / path).exists():
+            continue
+        try:
+            result = subprocess.run(
+                ["git", "show", f"HEAD:{path.as_posix()}"],
+                cwd=root,
+                capture_output=True,
+                text=True,
+                timeout=30
+            )
+        except (OSError, subprocess.TimeoutExpired):
+            continue
+        match = CLASS_NAME_PATTERN.search(result.stdout) if result.returncode == 0 else None
+        if match:
+            names.add(match.group(1))
+    return names
+
+
+def select_files(model: ProjectModel, files: Optional[Iterable[Path]] = None, full: bool = False) -> FileSelection:
+    """Build the selection for `files` (default: staged files)."""
+    if full:
+        return FileSelection()
+
+    if files is None:
+        files = staged_paths(model.root)
+        if not files:
+            # Clean index (manual run, CI checkout) - check everything
+            return FileSelection()
+
+    requested: Set[Path] = set()
+    for path in files:
+        path = Path(path)
+        if path.is_absolute():
+            try:
+                path = path.resolve().relative_to(model.root)
+            except ValueError:
+                continue  # Outside the project
+        requested.add(path)
+
+    # Subclasses of a deleted script are found by its old class_name
+    dependents = model.dependents(requested, removed_class_names(model.root, requested))
+    return FileSelection(requested | dependents, len(requested))
+
+
+def add_selection_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the shared `files...` / `--full` arguments to a validator's parser."""
+    parser.add_argument('files', nargs='*', type=Path,
+                        help='Files to check (default: staged files and their dependents)')
+    parser.add_argument('--full', action='store_true',
+                        help='Check the whole project instead of staged files')
+
+
+def selection_from_args(model: ProjectModel, args: argparse.Namespace) -> FileSelection:
+    return select_files(model, args.files or None, args.full)
+
+
+def selection_from_argv(model: ProjectModel, argv: Optional[List[str]] = None) -> FileSelection:
+    """Selection for validators without their own argument parser."""
+    parser = argparse.ArgumentParser(add_help=True)
+    add_selection_arguments(parser)
+    args = parser.parse_args(sys.argv[1:] if argv is None else argv)
+    return selection_from_args(model, args)
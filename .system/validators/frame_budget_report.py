@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+"""
+Frame Budget Report
+
+Static per-frame cost estimate for the entity scripts. For each entity it
+counts the operations _physics_process()/_process() perform every frame -
+including everything they call, via the same call graph the performance
+validator uses for hot-path detection (call_graph.py) - and multiplies by
+the number of instances expected on screen. The ranked report shows which
+entity type dominates the 16.6 ms frame before profiling on device.
+
+Operation categories (unit costs in OP_COSTS_US):
+- node_lookup:     get_node(), $Path, find_child()
+- group_query:     get_nodes_in_group(), get_first_node_in_group(), ...
+- allocation:      X.new(), instantiate(), duplicate(), [] / {} literals
+- signal_emit:     sig.emit(), emit_signal()
+- array_scan:      for loops, find()/has()/filter()/sort()/...
+- distance_check:  distance_to(), length(), ...
+- physics_query:   move_and_slide(), move_and_collide(), intersect_*()
+
+Weighting (an estimate, not a profile):
+- Each loop multiplies its body by LOOP_ITERATIONS
+- Each enclosing if/elif/else/match multiplies by BRANCH_WEIGHT
+- Calls that cannot be resolved statically cost nothing
+
+Usage:
+    python3 .system/validators/frame_budget_report.py
+    python3 .system/validators/frame_budget_report.py --count enemy=500 --count projectile=2000
+    python3 .system/validators/frame_budget_report.py --count scripts/entities/demo_player.gd=1
+
+Informational only - not part of the pre-commit hook.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from project_model import ProjectModel, load_project_model
+from gdscript_parser import BRANCH_KINDS, LOOP_KINDS, NODE_PATH, OP, Statement
+from call_graph import CallGraph, FunctionKey, build_call_graph, string_dispatch_calls
+from godot_performance_validator import PROCESS_FUNCS
+
+# ANSI colors
+RED = '\033[0;31m'
+GREEN = '\033[0;32m'
+YELLOW = '\033[1;33m'
+CYAN = '\033[0;36m'
+NC = '\033[0m'
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+
+FRAME_BUDGET_MS = 16.6  # 60 FPS
+
+# Entity script -> expected live instances (override with --count)
+ENTITY_COUNTS: Dict[str, int] = {
+    "scripts/entities/enemy.gd": 300,
+    "scripts/entities/projectile.gd": 1000,
+    "scripts/entities/drop_pickup.gd": 200,
+    "scripts/entities/player.gd": 1,
+}
+
+# Rough per-operation cost on a mid-range phone (µs). Relative magnitudes
+# matter more than absolute values - the report ranks entities.
+OP_COSTS_US: Dict[str, float] = {
+    "node_lookup": 0.6,
+    "group_query": 3.0,
+    "allocation": 1.5,
+    "signal_emit": 0.8,
+    "array_scan": 1.0,
+    "distance_check": 0.05,
+    "physics_query": 8.0,
+}
+
+CALL_CATEGORIES: Dict[str, str] = {
+    "get_node": "node_lookup",
+    "get_node_or_null": "node_lookup",
+    "find_child": "node_lookup",
+    "get_nodes_in_group": "group_query",
+    "get_first_node_in_group": "group_query",
+    "is_in_group": "group_query",
+    "call_group": "group_query",
+    "instantiate": "allocation",
+    "duplicate": "allocation",
+    "emit": "signal_emit",
+    "emit_signal": "signal_emit",
+    "find": "array_scan",
+    "has": "array_scan",
+    "count": "array_scan",
+    "erase": "array_scan",
+    "filter": "array_scan",
+    "map": "array_scan",
+    "reduce": "array_scan",
+    "any": "array_scan",
+    "all": "array_scan",
+    "sort": "array_scan",
+    "sort_custom": "array_scan",
+    "distance_to": "distance_check",
+    "distance_squared_to": "distance_check",
+    "length": "distance_check",
+    "length_squared": "distance_check",
+    "move_and_slide": "physics_query",
+    "move_and_collide": "physics_query",
+    "intersect_ray": "physics_query",
+    "intersect_shape": "physics_query",
+    "intersect_point": "physics_query",
+}
+
+LOOP_ITERATIONS = 8     # Assumed iterations of a loop body per frame
+BRANCH_WEIGHT = 0.5     # Assumed chance a conditional block runs
+MAX_CALL_DEPTH = 12     # Stop following very deep call chains
+
+# `[` / `{` after a value is an index; after an operator or keyword, a literal
+_VALUE_END = {")", "]", "}"}
+_LITERAL_AFTER = {"in", "return", "and", "or", "not"}
+
+# (rel_path, line, category) -> weighted operations
+Sites = Dict[Tuple[Path, int, str], float]
+
+
+class FunctionCost:
+    """Weighted operation counts of one function call, callees included."""
+    def __init__(self):
+        self.ops: Dict[str, float] = {}
+        self.sites: Sites = {}
+
+    def add(self, rel_path: Path, line: int, category: str, weight: float) -> None:
+        self.ops[category] = self.ops.get(category, 0.0) + weight
+        key = (rel_path, line, category)
+        self.sites[key] = self.sites.get(key, 0.0) + weight
+
+    def merge(self, other: "FunctionCost", weight: float) -> None:
+        for category, count in other.ops.items():
+            self.ops[category] = self.ops.get(category, 0.0) + count * weight
+        for key, count in other.sites.items():
+            self.sites[key] = self.sites.get(key, 0.0) + count * weight
+
+    @property
+    def micros(self) -> float:
+        return sum(OP_COSTS_US[category] * count for category, count in self.ops.items())
+
+
+class EntityBudget:
+    """Estimated frame cost of one entity type."""
+    def __init__(self, rel_path: Path, instances: int, callbacks: List[str], cost: FunctionCost):
+        self.rel_path = rel_path
+        self.instances = instances
+        self.callbacks = callbacks
+        self.cost = cost
+
+    @property
+    def name(self) -> str:
+        return self.rel_path.stem
+
+    @property
+    def per_instance_us(self) -> float:
+        return self.cost.micros
+
+    @property
+    def frame_ms(self) -> float:
+        return self.per_instance_us * self.instances / 1000.0
+
+
+def statement_operations(statement: Statement) -> List[Tuple[int, str]]:
+    """(line, category) of every costed operation on one logical line."""
+    found = []
+    if statement.kind in LOOP_KINDS:
+        found.append((statement.line, "array_scan"))
+
+    for call in statement.calls:
+        if call.name == "new" and call.receiver is not None:
+            found.append((call.line, "allocation"))
+        elif call.name in CALL_CATEGORIES:
+            found.append((call.line, CALL_CATEGORIES[call.name]))
+
+    previous = None
+    for token in statement.tokens:
+        if token.kind == NODE_PATH:
+            found.append((token.line, "node_lookup"))
+        elif token.kind == OP and token.value in ("[", "{"):
+            # Literal unless it follows a value (a[0], f()[0], x.y[0])
+            if previous is None or previous.value in _LITERAL_AFTER or (
+                previous.kind == OP and previous.value not in _VALUE_END
+            ):
+                found.append((token.line, "allocation"))
+        previous = token
+    return found
+
+
+class FrameCostEstimator:
+    """Per-call costs of project functions, following the call graph."""
+    def __init__(self, graph: CallGraph):
+        self.graph = graph
+        self._costs: Dict[FunctionKey, FunctionCost] = {}
+
+    def cost(self, key: FunctionKey, active: Optional[Set[FunctionKey]] = None) -> FunctionCost:
+        if key in self._costs:
+            return self._costs[key]
+        active = set() if active is None else active
+        result = FunctionCost()
+        span = self.graph.function(key)
+        if span is None or key in active or len(active) >= MAX_CALL_DEPTH:
+            return result  # Unknown or recursive - not cached, depends on the path
+
+        active.add(key)
+        for child in span.statement.children:
+            self._add_statement(key, child, 1.0, result, active)
+        active.discard(key)
+        self._costs[key] = result
+        return result
+
+    def _add_statement(self, key: FunctionKey, statement: Statement, weight: float,
+                       result: FunctionCost, active: Set[FunctionKey]) -> None:
+        rel_path = key[0]
+        for line, category in statement_operations(statement):
+            result.add(rel_path, line, category, weight)
+
+        for call in statement.calls + string_dispatch_calls(statement):
+            callee = self.graph.resolve_call(rel_path, call)
+            if callee is not None and callee != key:
+                result.merge(self.cost(callee, active), weight)
+
+        if statement.kind in LOOP_KINDS:
+            body_weight = weight * LOOP_ITERATIONS
+        elif statement.kind in BRANCH_KINDS:
+            body_weight = weight * BRANCH_WEIGHT
+        else:
+            body_weight = weight
+        for child in statement.children:
+            self._add_statement(key, child, body_weight, result, active)
+
+
+def estimate(model: ProjectModel, counts: Dict[str, int]) -> List[EntityBudget]:
+    """Budgets for each entity script in `counts`, most expensive first."""
+    graph = build_call_graph(model)
+    estimator = FrameCostEstimator(graph)
+    budgets = []
+
+    for rel, instances in counts.items():
+        rel_path = Path(rel)
+        source = model.get(rel_path)
+        if source is None:
+            print(f"{YELLOW}⚠️  Entity script not found: {rel}{NC}")
+            continue
+
+        callbacks = [name for name in sorted(PROCESS_FUNCS) if source.function(name)]
+        cost = FunctionCost()
+        for name in callbacks:
+            cost.merge(estimator.cost((rel_path, name)), 1.0)
+        budgets.append(EntityBudget(rel_path, instances, callbacks, cost))
+
+    return sorted(budgets, key=lambda b: b.frame_ms, reverse=True)
+
+
+def parse_counts(overrides: List[str]) -> Dict[str, int]:
+    """Apply `--count name=N` overrides (name = entity stem or script path)."""
+    counts = dict(ENTITY_COUNTS)
+    stems = {Path(rel).stem: rel for rel in counts}
+    for override in overrides:
+        name, sep, value = override.partition("=")
+        if not sep or not value.strip().isdigit():
+            raise ValueError(f"Expected NAME=COUNT, got '{override}'")
+        rel = stems.get(name, name)
+        counts[rel] = int(value)
+    return counts
+
+
+def _site_label(graph: CallGraph, rel_path: Path, line: int, origin: Path) -> str:
+    span = graph.scripts[rel_path].source.index.function_at(line) if rel_path in graph.scripts else None
+    func = f" {span.name}()" if span is not None else ""
+    prefix = "" if rel_path == origin else f"{rel_path.name}:"
+    return f"{prefix}{line}{func}"
+
+
+def print_report(budgets: List[EntityBudget], graph: CallGraph, top: int) -> None:
+    total_ms = sum(b.frame_ms for b in budgets)
+
+    print(f"\n{CYAN}📊 Estimated per-frame cost (budget {FRAME_BUDGET_MS} ms){NC}\n")
+    print(f"  {'#':>2}  {'Entity':<14} {'Instances':>9} {'µs/instance':>12} {'ms/frame':>9} {'% budget':>9}")
+    for rank, budget in enumerate(budgets, start=1):
+        share = budget.frame_ms / FRAME_BUDGET_MS * 100
+        color = RED if share >= 50 else YELLOW if share >= 20 else NC
+        print(f"  {rank:>2}  {budget.name:<14} {budget.instances:>9} "
+              f"{budget.per_instance_us:>12.2f} {color}{budget.frame_ms:>9.2f} {share:>8.1f}%{NC}")
+    print(f"      {'Total':<14} {'':>9} {'':>12} {total_ms:>9.2f} {total_ms / FRAME_BUDGET_MS * 100:>8.1f}%")
+
+    for budget in budgets:
+        if not budget.callbacks:
+            print(f"\n{YELLOW}{budget.rel_path}:{NC} no per-frame callback")
+            continue
+        print(f"\n{YELLOW}{budget.rel_path}{NC} ({', '.join(f'{c}()' for c in budget.callbacks)})")
+
+        ops = budget.cost.ops
+        for category in sorted(ops, key=lambda c: OP_COSTS_US[c] * ops[c], reverse=True):
+            micros = OP_COSTS_US[category] * ops[category]
+            print(f"  {category:<15} {ops[category]:>8.1f} ops  {micros:>8.2f} µs")
+
+        sites = sorted(budget.cost.sites.items(),
+                       key=lambda item: OP_COSTS_US[item[0][2]] * item[1], reverse=True)
+        if sites:
+            print(f"  {CYAN}Top sites:{NC}")
+        for (rel_path, line, category), count in sites[:top]:
+            label = _site_label(graph, rel_path, line, budget.rel_path)
+            print(f"    {label}: {category} ×{count:.1f} ({OP_COSTS_US[category] * count:.2f} µs)")
+
+    if budgets:
+        heaviest = budgets[0]
+        print(f"\n{CYAN}💡 {heaviest.name} dominates the frame "
+              f"({heaviest.frame_ms:.2f} ms of {total_ms:.2f} ms estimated){NC}")
+    if total_ms > FRAME_BUDGET_MS:
+        print(f"{RED}⚠️  Estimated entity cost exceeds the {FRAME_BUDGET_MS} ms frame budget{NC}")
+    print(f"{CYAN}📚 Static estimate - confirm with the profiler on device "
+          f"(loops ×{LOOP_ITERATIONS}, branches ×{BRANCH_WEIGHT}){NC}")
+
+
+def main(model: Optional[ProjectModel] = None, argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Estimate per-frame cost of entity scripts")
+    parser.add_argument("--count", action="append", default=[], metavar="NAME=N",
+                        help="Expected instances, e.g. enemy=300 or scripts/entities/x.gd=50")
+    parser.add_argument("--top", type=int, default=5, help="Costliest sites shown per entity")
+    args = parser.parse_args(argv)
+
+    try:
+        counts = parse_counts(args.count)
+    except ValueError as e:
+        print(f"{RED}❌ {e}{NC}")
+        return 1
+
+    model = model or load_project_model(PROJECT_ROOT)
+    budgets = estimate(model, counts)
+    print_report(budgets, build_call_graph(model), args.top)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,442 @@
+#!/usr/bin/env python3
+"""
+GDScript Parser
+
+Small tokenizer and lightweight AST for GDScript, shared by the validators so
+checks stop re-implementing "find the func, track indentation until the next
+declaration" with regexes over raw lines.
+
+What it understands:
+- Tokens: names, numbers, strings (incl. triple-quoted, &"StringName",
+  ^"NodePath", r"raw"), $Node/Paths, @annotations, operators and comments.
+  Strings and comments never leak into code checks.
+- Logical lines: bracketed expressions and backslash continuations spanning
+  several physical lines are one statement.
+- Statements: a tree built from indentation (func, class, if/elif/else,
+  for/while, match, var, ... and plain expressions), with the calls each
+  statement makes.
+
+It is not a full grammar - expressions are kept as token lists - but it is
+enough for structural checks like "calls inside _process()" or "string
+concatenation inside a loop".
+
+Usage:
+    from gdscript_parser import parse
+
+    script = parse(source.content)      # or source.parsed via the project model
+    for span in script.index.spans({"_process", "_physics_process"}):
+        for statement in span.statement.body():
+            for call in statement.calls:
+                print(call.line, call.receiver, call.name)
+"""
+
+import re
+from typing import Dict, Iterable, Iterator, List, Optional, Set
+
+# Token kinds
+NAME = "name"
+NUMBER = "number"
+STRING = "string"
+NODE_PATH = "node_path"      # $Path/To/Node, $"Path", $%Unique
+ANNOTATION = "annotation"    # @onready, @export, ...
+OP = "op"
+COMMENT = "comment"
+NEWLINE = "newline"
+
+_STRING_BODY = (
+    r'"""(?:\\.|[^\\])*?"""'
+    r"|'''(?:\\.|[^\\])*?'''"
+    r'|"(?:\\.|[^"\\\n])*"'
+    r"|'(?:\\.|[^'\\\n])*'"
+)
+
+TOKEN_PATTERN = re.compile(
+    r'(?P<newline>\r?\n)'
+    r'|(?P<ws>[ \t]+)'
+    r'|(?P<comment>#[^\n]*)'
+    rf'|(?P<string>(?:[rR]|&|\^)?(?:{_STRING_BODY}))'
+    rf'|(?P<node_path>\$(?:{_STRING_BODY}|%?[A-Za-z_]\w*(?:/%?[A-Za-z_]\w*)*))'
+    r'|(?P<annotation>@[A-Za-z_]\w*)'
+    r'|(?P<number>0[xX][0-9a-fA-F_]+|0[bB][01_]+|(?:\d[\d_]*(?:\.[\d_]*)?|\.\d[\d_]*)(?:[eE][+-]?\d+)?)'
+    r'|(?P<name>[A-Za-z_]\w*)'
+    r'|(?P<op>\*\*=|<<=|>>=|\*\*|<<|>>|==|!=|<=|>=|&&|\|\||->|:=|\+=|-=|\*=|/=|%=|&=|\|=|\^=|\.\.'
+    r'|[-+*/%<>=!&|^~.,:;()\[\]{}\\])'
+    r'|(?P<other>.)',
+    re.DOTALL
+)
+
+OPEN_BRACKETS = {"(", "[", "{"}
+CLOSE_BRACKETS = {")", "]", "}"}
+
+# Statement kinds taken from the leading keyword
+STATEMENT_KEYWORDS = {
+    "func", "class", "class_name", "extends", "signal", "enum", "var", "const",
+    "if", "elif", "else", "for", "while", "match", "return", "pass", "break",
+    "continue", "await",
+}
+LOOP_KINDS = {"for", "while"}
+BRANCH_KINDS = {"if", "elif", "else", "match"}
+
+
+class Token:
+    """One lexical token (line is 1-indexed, col is 0-indexed)."""
+    __slots__ = ("kind", "value", "line", "col")
+
+    def __init__(self, kind: str, value: str, line: int, col: int):
+        self.kind = kind
+        self.value = value
+        self.line = line
+        self.col = col
+
+    def __repr__(self) -> str:
+        return f"Token({self.kind}, {self.value!r}, {self.line}:{self.col})"
+
+
+class Call:
+    """A call expression: `receiver.name(...)` or `name(...)`."""
+    __slots__ = ("name", "receiver", "line")
+
+    def __init__(self, name: str, receiver: Optional[str], line: int):
+        self.name = name
+        self.receiver = receiver  # Token text before the dot, or None
+        self.line = line
+
+    def __repr__(self) -> str:
+        target = f"{self.receiver}.{self.name}" if self.receiver else self.name
+        return f"Call({target}() @ {self.line})"
+
+
+class Statement:
+    """One logical line plus the block nested under it."""
+    def __init__(self, kind: str, tokens: List[Token], indent: int, annotations: List[str]):
+        self.kind = kind
+        self.tokens = tokens          # Code tokens of this logical line (no comments)
+        self.indent = indent          # Indentation of the first physical line
+        self.annotations = annotations
+        self.children: List["Statement"] = []
+        self.parent: Optional["Statement"] = None
+        self._calls: Optional[List[Call]] = None
+
+    @property
+    def line(self) -> int:
+        """First physical line of the statement."""
+        return self.tokens[0].line
+
+    @property
+    def last_line(self) -> int:
+        """Last physical line of this logical line (not of its block)."""
+        return self.tokens[-1].line
+
+    @property
+    def end_line(self) -> int:
+        """Last physical line of the statement including its nested block."""
+        if self.children:
+            return self.children[-1].end_line
+        return self.last_line
+
+    @property
+    def calls(self) -> List[Call]:
+        """Calls made on this logical line (nested block excluded)."""
+        if self._calls is None:
+            self._calls = _extract_calls(self.tokens)
+        return self._calls
+
+    @property
+    def name(self) -> Optional[str]:
+        """Declared name for func/class/var/const/signal/enum statements."""
+        for index, token in enumerate(self.tokens):
+            if token.kind == NAME and token.value == self.kind and index + 1 < len(self.tokens):
+                following = self.tokens[index + 1]
+                return following.value if following.kind == NAME else None
+        return None
+
+    def walk(self) -> Iterator["Statement"]:
+        """This statement and every statement nested under it, in order."""
+        yield self
+        for child in self.children:
+            yield from child.walk()
+
+    def body(self) -> Iterator["Statement"]:
+        """Every statement nested under this one (excluding itself)."""
+        for child in self.children:
+            yield from child.walk()
+
+    def ancestors(self) -> Iterator["Statement"]:
+        node = self.parent
+        while node is not None:
+            yield node
+            node = node.parent
+
+    def enclosing(self, kinds: set, stop: Optional["Statement"] = None) -> Optional["Statement"]:
+        """Nearest ancestor of one of `kinds`, not looking past `stop`."""
+        for node in self.ancestors():
+            if node is stop:
+                return None
+            if node.kind in kinds:
+                return node
+        return None
+
+    def __repr__(self) -> str:
+        return f"Statement({self.kind}, {self.line}-{self.end_line})"
+
+
+class FunctionSpan:
+    """Line span of one function (1-indexed, inclusive)."""
+    def __init__(self, statement: Statement):
+        self.statement = statement
+        self.name = statement.name or ""
+        self.start_line = statement.line      # Line of the `func` declaration
+        self.end_line = statement.end_line    # Last line of the body
+        self.indent = statement.indent        # Indentation of the `func` keyword
+
+    def __contains__(self, line_num: int) -> bool:
+        """True for lines of the body (the declaration line excluded)."""
+        return self.start_line < line_num <= self.end_line
+
+    def __repr__(self) -> str:
+        return f"FunctionSpan({self.name!r}, {self.start_line}-{self.end_line})"
+
+
+class LoopSpan:
+    """Line span of one for/while loop."""
+    def __init__(self, statement: Statement, depth: int, function: Optional[FunctionSpan]):
+        self.statement = statement
+        self.kind = statement.kind
+        self.start_line = statement.line
+        self.end_line = statement.end_line
+        self.depth = depth            # 1 = outermost loop, 2 = nested once, ...
+        self.function = function      # Enclosing function, if any
+
+    def __repr__(self) -> str:
+        return f"LoopSpan({self.kind}, {self.start_line}-{self.end_line}, depth={self.depth})"
+
+
+class CodeIndex:
+    """
+    Per-file lookup tables built in one walk of the statement tree:
+    function name -> spans, loop spans with nesting depth, and per-line
+    "which function / how many loops deep" answers.
+
+    Checks query this instead of rescanning lines, so a new hot-path rule
+    costs O(matches) rather than another pass over the file.
+    """
+    def __init__(self, statements: List[Statement], line_count: int):
+        self.functions: List[FunctionSpan] = []
+        self.loops: List[LoopSpan] = []
+        self._by_name: Dict[str, List[FunctionSpan]] = {}
+        # Index 0 unused so lists can be addressed by 1-indexed line number
+        self._function_at: List[Optional[FunctionSpan]] = [None] * (line_count + 2)
+        self._loop_depth: List[int] = [0] * (line_count + 2)
+
+        for statement in statements:
+            self._visit(statement, None, 0)
+
+    def _visit(self, statement: Statement, function: Optional[FunctionSpan], depth: int) -> None:
+        if statement.kind == "func":
+            function = FunctionSpan(statement)
+            self.functions.append(function)
+            self._by_name.setdefault(function.name, []).append(function)
+            # Inner functions are visited later and overwrite their own lines
+            for line_num in range(function.start_line, function.end_line + 1):
+                self._function_at[line_num] = function
+            depth = 0
+        elif statement.kind in LOOP_KINDS:
+            depth += 1
+            self.loops.append(LoopSpan(statement, depth, function))
+            for line_num in range(statement.last_line + 1, statement.end_line + 1):
+                self._loop_depth[line_num] = max(self._loop_depth[line_num], depth)
+
+        for child in statement.children:
+            self._visit(child, function, depth)
+
+    def function(self, name: str) -> Optional[FunctionSpan]:
+        """First function with the given name, or None."""
+        spans = self._by_name.get(name)
+        return spans[0] if spans else None
+
+    def spans(self, names: Iterable[str]) -> List[FunctionSpan]:
+        """Every function whose name is in `names`, in file order."""
+        found = [span for name in names for span in self._by_name.get(name, ())]
+        return sorted(found, key=lambda span: span.start_line)
+
+    def lines_in(self, names: Iterable[str]) -> Set[int]:
+        """Body line numbers of every function named in `names`."""
+        lines: Set[int] = set()
+        for span in self.spans(names):
+            lines.update(range(span.start_line + 1, span.end_line + 1))
+        return lines
+
+    def function_at(self, line_num: int) -> Optional[FunctionSpan]:
+        """Innermost function containing the line, or None at class level."""
+        if 0 < line_num < len(self._function_at):
+            return self._function_at[line_num]
+        return None
+
+    def loop_depth(self, line_num: int) -> int:
+        """How many loop bodies the line is nested in (0 = not in a loop)."""
+        if 0 < line_num < len(self._loop_depth):
+            return self._loop_depth[line_num]
+        return 0
+
+    @property
+    def outer_loops(self) -> List[LoopSpan]:
+        """Loops not nested in another loop of the same function."""
+        return [loop for loop in self.loops if loop.depth == 1]
+
+
+class GDScript:
+    """Parsed GDScript file."""
+    def __init__(self, tokens: List[Token], statements: List[Statement]):
+        self.tokens = tokens          # Every token, including comments
+        self.statements = statements  # Top-level statements
+        self._index: Optional[CodeIndex] = None
+
+    def walk(self) -> Iterator[Statement]:
+        for statement in self.statements:
+            yield from statement.walk()
+
+    @property
+    def index(self) -> CodeIndex:
+        """Function/loop index, built on first use."""
+        if self._index is None:
+            line_count = self.tokens[-1].line if self.tokens else 0
+            self._index = CodeIndex(self.statements, line_count)
+        return self._index
+
+
+def tokenize(text: str) -> List[Token]:
+    """Split GDScript source into tokens (whitespace dropped)."""
+    tokens: List[Token] = []
+    line = 1
+    line_start = 0
+
+    for match in TOKEN_PATTERN.finditer(text):
+        kind = match.lastgroup
+        value = match.group()
+        start = match.start()
+
+        if kind == "ws":
+            continue
+        if kind == "newline":
+            tokens.append(Token(NEWLINE, value, line, start - line_start))
+            line += 1
+            line_start = match.end()
+            continue
+        if kind == "other":
+            kind = OP
+
+        tokens.append(Token(kind, value, line, start - line_start))
+
+        # Multi-line strings advance the line counter
+        newlines = value.count('\n')
+        if newlines:
+            line += newlines
+            line_start = start + value.rindex('\n') + 1
+
+    return tokens
+
+
+def _logical_lines(tokens: List[Token]) -> Iterator[List[Token]]:
+    """Group code tokens into logical lines (brackets and `\\` join lines)."""
+    current: List[Token] = []
+    depth = 0
+    continued = False
+
+    for token in tokens:
+        if token.kind == COMMENT:
+            continue
+        if token.kind == NEWLINE:
+            if depth > 0 or continued:
+                continued = False
+                continue
+            if current:
+                yield current
+                current = []
+            continue
+
+        if token.kind == OP:
+            if token.value == "\\":
+                continued = True
+                continue
+            if token.value in OPEN_BRACKETS:
+                depth += 1
+            elif token.value in CLOSE_BRACKETS:
+                depth = max(depth - 1, 0)
+        continued = False
+        current.append(token)
+
+    if current:
+        yield current
+
+
+def _statement_kind(tokens: List[Token]) -> tuple:
+    """(kind, annotations) for a logical line."""
+    annotations = []
+    index = 0
+    while index < len(tokens) and tokens[index].kind == ANNOTATION:
+        annotations.append(tokens[index].value)
+        index += 1
+        # Skip annotation arguments: @export_range(0, 10)
+        if index < len(tokens) and tokens[index].value == "(":
+            depth = 0
+            while index < len(tokens):
+                if tokens[index].value == "(":
+                    depth += 1
+                elif tokens[index].value == ")":
+                    depth -= 1
+                    if depth == 0:
+                        index += 1
+                        break
+                index += 1
+
+    if index >= len(tokens):
+        return "annotation", annotations
+
+    first = tokens[index]
+    if first.kind == NAME and first.value == "static" and index + 1 < len(tokens):
+        first = tokens[index + 1]
+    if first.kind == NAME and first.value in STATEMENT_KEYWORDS:
+        return first.value, annotations
+    return "expr", annotations
+
+
+def _extract_calls(tokens: List[Token]) -> List[Call]:
+    calls = []
+    for index, token in enumerate(tokens[:-1]):
+        if token.kind != NAME or tokens[index + 1].value != "(" or token.value == "func":
+            continue
+        previous = tokens[index - 1] if index > 0 else None
+        if previous is not None and previous.kind == NAME and previous.value == "func":
+            continue  # Declaration (or lambda), not a call
+        receiver = None
+        if previous is not None and previous.value == "." and index > 1:
+            receiver = tokens[index - 2].value
+        calls.append(Call(token.value, receiver, token.line))
+    return calls
+
+
+def parse(text: str) -> GDScript:
+    """Parse GDScript source into statements nested by indentation."""
+    tokens = tokenize(text)
+
+    # Indentation is measured on the physical line, as the validators always have
+    lines = text.split('\n')
+    root: List[Statement] = []
+    stack: List[Statement] = []
+
+    for line_tokens in _logical_lines(tokens):
+        physical = lines[line_tokens[0].line - 1]
+        indent = len(physical) - len(physical.lstrip())
+        kind, annotations = _statement_kind(line_tokens)
+        statement = Statement(kind, line_tokens, indent, annotations)
+
+        while stack and stack[-1].indent >= indent:
+            stack.pop()
+        if stack:
+            statement.parent = stack[-1]
+            stack[-1].children.append(statement)
+        else:
+            root.append(statement)
+        stack.append(statement)
+
+    return GDScript(tokens, root)
@@ -21,9 +21,14 @@ Exit Codes:
 import sys
 import re
 from pathlib import Path
-from typing import List, Tuple, Dict
+from typing import List, Tuple, Dict, Optional
 from collections import defaultdict
 
+from project_model import ProjectModel, SourceFile, load_project_model
+from gdscript_parser import BRANCH_KINDS, CodeIndex, NAME, NODE_PATH, Statement
+from validator_cache import ResultCache
+from file_selection import FileSelection, selection_from_argv
+
 # ANSI colors
 RED = '\033[0;31m'
 GREEN = '\033[0;32m'
@@ -31,7 +36,10 @@ YELLOW = '\033[1;33m'
 CYAN = '\033[0;36m'
 NC = '\033[0m'
 
-PROJECT_ROOT = Path(__file__).parent.parent.parent
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+
+# Engine callbacks that run every frame
+PROCESS_FUNCS = {"_process", "_physics_process"}
 
 
 class AntiPattern:
@@ -68,107 +76,33 @@ def check_get_parent_chains(lines: List[str]) -> List[AntiPattern]:
     return patterns
 
 
-def check_get_node_in_process(content: str, lines: List[str]) -> List[AntiPattern]:
+def check_get_node_in_process(index: CodeIndex) -> List[AntiPattern]:
     """
     Detect get_node() calls inside _process() or _physics_process().
 
     These should be cached in _ready() with @onready instead.
     """
     patterns = []
-
-    # Find _process and _physics_process function bodies
-    process_funcs = []
-
-    # Match function definitions
-    func_pattern = r'^\s*func\s+(_process|_physics_process)\s*\([^)]*\)'
-
-    i = 0
-    while i < len(lines):
-        line = lines[i]
-
-        if re.match(func_pattern, line):
-            # Found a process function, scan its body
-            func_start = i + 1
-            indent_level = len(line) - len(line.lstrip())
-
-            # Find end of function (next line with same or less indentation that starts a new func/class/etc)
-            j = func_start
-            while j < len(lines):
-                current_line = lines[j]
-
-                # Skip empty lines and comments
-                if not current_line.strip() or current_line.strip().startswith('#'):
-                    j += 1
-                    continue
-
-                current_indent = len(current_line) - len(current_line.lstrip())
-
-                # If we hit same or lower indentation with a new declaration, function ended
-                if current_indent <= indent_level and re.match(r'^\s*(func|class|signal|var|const|enum)\s', current_line):
-                    break
-
-                # Check for get_node() in this line
-                if 'get_node(' in current_line or '$' in current_line:
-                    # Check if it's a get_node call (not just in a string or comment)
-                    if not re.search(r'#.*get_node\(', current_line):  # Not in comment
-                        patterns.append(AntiPattern(
-                            line_num=j + 1,
-                            pattern_type="get_node_in_process",
-                            details="get_node() call in _process() or _physics_process()",
-                            severity="warning"
-                        ))
-
-                j += 1
-
-            i = j
-        else:
-            i += 1
+    flagged_lines = set()
+
+    for func in index.spans(PROCESS_FUNCS):
+        for statement in func.statement.body():
+            # get_node() calls and the $ operator (strings/comments are separate tokens)
+            lines = [call.line for call in statement.calls if call.name == "get_node"]
+            lines += [token.line for token in statement.tokens if token.kind == NODE_PATH]
+            for line_num in sorted(set(lines) - flagged_lines):
+                flagged_lines.add(line_num)
+                patterns.append(AntiPattern(
+                    line_num=line_num,
+                    pattern_type="get_node_in_process",
+                    details="get_node() call in _process() or _physics_process()",
+                    severity="warning"
+                ))
 
     return patterns
 
 
-def _find_ready_function_lines(lines: List[str]) -> set:
-    """
-    Return set of line numbers (1-indexed) that are inside _ready() function.
-
-    This allows us to detect if a variable assignment happens within _ready(),
-    which is equally safe as using @onready.
-    """
-    ready_lines = set()
-    in_ready = False
-    ready_indent = 0
-
-    for line_num, line in enumerate(lines, start=1):
-        # Check for _ready() function definition
-        if re.match(r'^\s*func\s+_ready\s*\(', line):
-            in_ready = True
-            ready_indent = len(line) - len(line.lstrip())
-            continue
-
-        if in_ready:
-            # Skip empty lines and comments
-            stripped = line.strip()
-            if not stripped or stripped.startswith('#'):
-                ready_lines.add(line_num)
-                continue
-
-            current_indent = len(line) - len(line.lstrip())
-
-            # If we hit same or lower indentation with content, function ended
-            if current_indent <= ready_indent:
-                # Check if this is a new function/class/etc definition
-                if re.match(r'^\s*(func|class|signal|@)', line):
-                    in_ready = False
-                    continue
-
-            # Still inside _ready()
-            if in_ready:
-                ready_lines.add(line_num)
-
-    return ready_lines
-
-
-def check_missing_onready(lines: List[str]) -> List[AntiPattern]:
+def check_missing_onready(lines: List[str], index: CodeIndex) -> List[AntiPattern]:
     """
     Detect node references assigned from scene tree that should use @onready.
 
@@ -180,8 +114,8 @@ def check_missing_onready(lines: List[str]) -> List[AntiPattern]:
     """
     patterns = []
 
-    # Find _ready() function line boundaries
-    ready_lines = _find_ready_function_lines(lines)
+    # _ready() body lines, from the per-file function index
+    ready_lines = index.lines_in({"_ready"})
 
     # Find var declarations without @onready that look like node references
     var_pattern = r'^\s*var\s+(\w+)\s*:\s*(Node|Node2D|Node3D|Control|CanvasItem|Sprite2D|AnimatedSprite2D|CollisionShape2D|Area2D|CharacterBody2D|Label|Button|Panel|Timer|AudioStreamPlayer\w*|Camera2D|Camera3D|TileMap|RigidBody2D|StaticBody2D|GPUParticles2D|CPUParticles2D|Line2D|Polygon2D|ColorRect|TextureRect|NinePatchRect|RichTextLabel|ItemList|Tree|TabContainer|ScrollContainer|VBoxContainer|HBoxContainer|GridContainer|MarginContainer|CenterContainer)'
@@ -279,7 +213,7 @@ def check_export_without_type(lines: List[str]) -> List[AntiPattern]:
     return patterns
 
 
-def check_animation_in_process(content: str, lines: List[str]) -> List[AntiPattern]:
+def check_animation_in_process(index: CodeIndex) -> List[AntiPattern]:
     """
     Detect animation.play() calls inside _process() without state checks.
 
@@ -287,61 +221,60 @@ def check_animation_in_process(content: str, lines: List[str]) -> List[AntiPatte
     """
     patterns = []
 
-    # Find _process and _physics_process function bodies
-    func_pattern = r'^\s*func\s+(_process|_physics_process)\s*\([^)]*\)'
-
-    i = 0
-    while i < len(lines):
-        line = lines[i]
-
-        if re.match(func_pattern, line):
-            # Found a process function, scan its body
-            func_start = i + 1
-            indent_level = len(line) - len(line.lstrip())
-
-            j = func_start
-            while j < len(lines):
-                current_line = lines[j]
-
-                # Skip empty lines and comments
-                if not current_line.strip() or current_line.strip().startswith('#'):
-                    j += 1
-                    continue
+    for func in index.spans(PROCESS_FUNCS):
+        for statement in func.statement.body():
+            play_calls = [call for call in statement.calls if call.name == "play" and call.receiver is not None]
+            if not play_calls:
+                continue
 
-                current_indent = len(current_line) - len(current_line.lstrip())
+            # Only animation players (name or $Path mentions "animation")
+            if not any(
+                token.kind in (NAME, NODE_PATH) and 'animation' in token.value.lower()
+                for token in statement.tokens
+            ):
+                continue
 
-                # If we hit same or lower indentation with a new declaration, function ended
-                if current_indent <= indent_level and re.match(r'^\s*(func|class|signal|var|const|enum)\s', current_line):
-                    break
+            if _is_state_guarded(statement, func.statement):
+                continue
 
-                # Check for .play() calls (animation or audio)
-                if '.play(' in current_line and 'animation' in current_line.lower():
-                    # Check if it's guarded by a condition
-                    # Look back a few lines for an if statement
-                    is_guarded = False
-                    for k in range(max(0, j - 3), j):
-                        if 'if ' in lines[k] or 'elif ' in lines[k]:
-                            is_guarded = True
-                            break
-
-                    if not is_guarded:
-                        patterns.append(AntiPattern(
-                            line_num=j + 1,
-                            pattern_type="animation_in_process",
-                            details="Animation play() in _process() without state guard",
-                            severity="warning"
-                        ))
-
-                j += 1
-
-            i = j
-        else:
-            i += 1
+            patterns.append(AntiPattern(
+                line_num=play_calls[0].line,
+                pattern_type="animation_in_process",
+                details="Animation play() in _process() without state guard",
+                severity="warning"
+            ))
 
     return patterns
 
 
-def check_add_child_before_position(lines: List[str]) -> List[AntiPattern]:
+def _is_state_guarded(statement: Statement, func: Statement) -> bool:
+    """
+    True if the statement only runs behind a condition: it is an inline
+    `if ...: play()`, sits inside an if/elif/else/match block, or follows an
+    early-return state check (`if state == current: return`) in the same block.
+    """
+    if statement.kind in BRANCH_KINDS:
+        return True
+    if statement.enclosing(BRANCH_KINDS, stop=func) is not None:
+        return True
+    siblings = statement.parent.children if statement.parent is not None else []
+    for sibling in siblings:
+        if sibling is statement:
+            break
+        if sibling.kind in BRANCH_KINDS and _returns(sibling):
+            return True
+    return False
+
+
+def _returns(statement: Statement) -> bool:
+    """True if the statement (or its block) contains a return."""
+    return any(
+        node.kind == "return" or any(t.kind == NAME and t.value == "return" for t in node.tokens)
+        for node in statement.walk()
+    )
+
+
+def check_add_child_before_position(lines: List[str], index: CodeIndex) -> List[AntiPattern]:
     """
     Detect add_child() calls where the node's position is set AFTER adding to tree.
 
@@ -410,16 +343,14 @@ def check_add_child_before_position(lines: List[str]) -> List[AntiPattern]:
             if position_set_before:
                 continue
 
-            # Look forward up to 20 lines for position assignment to this variable
-            # Stop if we encounter a new function definition (different scope)
-            for i in range(1, min(21, len(lines) - line_num + 1)):
+            # Look forward up to 20 lines for position assignment to this variable,
+            # but not past the end of the enclosing function (different scope)
+            func = index.function_at(line_num)
+            scope_end = func.end_line if func is not None else len(lines)
+            for i in range(1, min(21, scope_end - line_num + 1)):
                 future_line_num = line_num + i
                 future_line = lines[future_line_num - 1]
 
-                # Stop if we hit a new function definition (scope boundary)
-                if re.match(r'^\s*func\s+', future_line):
-                    break
-
                 # Check for position or global_position assignment
                 position_pattern = rf'{re.escape(node_var)}\s*\.\s*(position|global_position)\s*='
 
@@ -435,60 +366,68 @@ def check_add_child_before_position(lines: List[str]) -> List[AntiPattern]:
     return patterns
 
 
-def validate_file(file_path: Path) -> List[AntiPattern]:
+def validate_file(source: SourceFile) -> List[AntiPattern]:
     """Run all anti-pattern checks on a GDScript file."""
     try:
-        content = file_path.read_text(encoding='utf-8')
-        lines = content.split('\n')
+        lines = source.lines
+        index = source.index  # Function/loop spans shared by the checks below
 
         all_patterns = []
 
         # Run all checks
         all_patterns.extend(check_get_parent_chains(lines))
-        all_patterns.extend(check_get_node_in_process(content, lines))
-        all_patterns.extend(check_missing_onready(lines))
+        all_patterns.extend(check_get_node_in_process(index))
+        all_patterns.extend(check_missing_onready(lines, index))
         all_patterns.extend(check_export_without_type(lines))
-        all_patterns.extend(check_animation_in_process(content, lines))
-        all_patterns.extend(check_add_child_before_position(lines))
+        all_patterns.extend(check_animation_in_process(index))
+        all_patterns.extend(check_add_child_before_position(lines, index))
 
         return all_patterns
 
     except Exception as e:
-        print(f"{YELLOW}⚠️  Could not read {file_path}: {e}{NC}")
+        print(f"{YELLOW}⚠️  Could not check {source.path}: {e}{NC}")
         return []
 
 
-def main():
+def main(model: Optional[ProjectModel] = None, selection: Optional[FileSelection] = None):
     """Check all GDScript files for anti-patterns."""
 
     print(f"{CYAN}Checking for Godot anti-patterns...{NC}")
 
+    model = model or load_project_model(PROJECT_ROOT)
+    selection = selection or selection_from_argv(model)
+    cache = ResultCache("godot_antipatterns_validator", Path(__file__))
+
     file_patterns: Dict[Path, List[AntiPattern]] = defaultdict(list)
     checked_files = 0
     error_count = 0
     warning_count = 0
 
-    # Check all .gd files in project
-    for gd_file in PROJECT_ROOT.rglob("*.gd"):
-        # Skip addons directory
-        if "addons" in gd_file.parts:
+    # Check all .gd files in project (addons/ excluded by the model)
+    for source in model.gd_files():
+        # Skip test files (community anti-patterns don't apply to test code)
+        if "_test.gd" in source.name or "test_" in source.name:
             continue
 
-        # Skip test files (community anti-patterns don't apply to test code)
-        if "_test.gd" in gd_file.name or "test_" in gd_file.name:
+        if not selection.includes(source):
             continue
 
         checked_files += 1
-        patterns = validate_file(gd_file)
+        patterns = cache.lookup(source, AntiPattern)
+        if patterns is None:
+            patterns = validate_file(source)
+            cache.store(source, patterns)
 
         if patterns:
-            file_patterns[gd_file] = patterns
+            file_patterns[source.path] = patterns
             for pattern in patterns:
                 if pattern.severity == "error":
                     error_count += 1
                 else:
                     warning_count += 1
 
+    cache.save(prune=selection.full)
+
     # Report results
     if not file_patterns:
         print(f"{GREEN}✅ No anti-patterns detected ({checked_files} files checked){NC}")
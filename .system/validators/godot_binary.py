@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Godot Binary Discovery
+
+Shared lookup of the Godot executable for the validators that launch it
+(scene instantiation, GUT runner, runtime load check, headless worker), so
+they agree on which binary to use on macOS workstations and Linux build boxes.
+
+Lookup order:
+1. GODOT_BIN environment variable (explicit override)
+2. `godot`/`godot4`/`Godot` on PATH (Linux installs, Homebrew, CI images)
+3. The usual macOS application bundles
+
+Also holds the editor class-cache scan that headless test runs need before
+custom `class_name` resources (WeaponResource, ...) resolve. The scan costs an
+editor boot, so class_cache_changes() first compares the project's class_name
+declarations with .godot/global_script_class_cache.cfg and the scan only runs
+when a class was added, removed, renamed, moved or now extends another base.
+
+Usage:
+    from godot_binary import find_godot_binary
+
+    try:
+        godot_bin = find_godot_binary()
+    except FileNotFoundError as e:
+        ...  # str(e) explains how to point the validators at Godot
+"""
+
+import os
+import re
+import shutil
+import subprocess
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from project_model import ProjectModel, SourceFile
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+
+# Executable names searched on PATH, in order
+PATH_NAMES = ["godot", "godot4", "Godot"]
+
+# Application bundles checked when nothing is on PATH
+COMMON_PATHS = [
+    '/Applications/Godot.app/Contents/MacOS/Godot',
+    '/Applications/Godot_mono.app/Contents/MacOS/Godot',
+    os.path.expanduser('~/Applications/Godot.app/Contents/MacOS/Godot'),
+]
+
+# Process names of an interactive Godot (editor or running game)
+PROCESS_NAMES = ["Godot", "godot"]
+
+CLASS_CACHE_PATH = PROJECT_ROOT / ".godot" / "global_script_class_cache.cfg"
+
+# One `{ "base": &"Node", "class": &"Name", ..., "path": "res://..." }` entry of the class cache
+CACHE_CLASS_PATTERN = re.compile(r'"class":\s*&?"(\w+)"')
+CACHE_PATH_PATTERN = re.compile(r'"path":\s*"([^"]+)"')
+CACHE_BASE_PATTERN = re.compile(r'"base":\s*&?"(\w+)"')
+
+# `extends Node2D`, `extends "res://scripts/base.gd"`
+SCRIPT_EXTENDS_PATTERN = re.compile(r'^extends\s+(?:"([^"]+)"|\'([^\']+)\'|(\w+))', re.MULTILINE)
+
+# Base Godot records for a script without `extends`
+DEFAULT_BASE = "RefCounted"
+
+
+def find_godot_binary() -> str:
+    """Path of the Godot executable (raises FileNotFoundError if there is none)."""
+    # Check environment variable first
+    godot_path = os.environ.get('GODOT_BIN')
+    if godot_path and os.path.exists(godot_path):
+        return godot_path
+
+    for name in PATH_NAMES:
+        found = shutil.which(name)
+        if found:
+            return found
+
+    for path in COMMON_PATHS:
+        if os.path.exists(path):
+            return path
+
+    raise FileNotFoundError(
+        "Godot binary not found. Set GODOT_BIN environment variable, put godot on PATH "
+        "or install Godot to /Applications/"
+    )
+
+
+def is_godot_running(exclude: Iterable[int] = ()) -> bool:
+    """
+    Check if Godot is already running (an open editor would lock the project).
+
+    `exclude` lists pids that do not count, e.g. the validators' own
+    headless worker.
+    """
+    excluded = {int(pid) for pid in exclude}
+    for name in PROCESS_NAMES:
+        try:
+            result = subprocess.run(
+                ["pgrep", "-x", name],
+                capture_output=True,
+                text=True
+            )
+        except OSError:
+            return False
+        pids = [int(pid) for pid in result.stdout.split() if pid.isdigit()]
+        if any(pid not in excluded for pid in pids):
+            return True
+    return False
+
+
+def cached_classes(path: Path = CLASS_CACHE_PATH) -> Optional[Dict[str, Tuple[str, Optional[str]]]]:
+    """class_name -> (res:// path, base) recorded in the class cache (None if there is none)."""
+    try:
+        text = path.read_text(encoding='utf-8')
+    except (OSError, UnicodeDecodeError):
+        return None
+
+    classes: Dict[str, Tuple[str, Optional[str]]] = {}
+    for entry in text.split("}"):
+        class_match = CACHE_CLASS_PATTERN.search(entry)
+        path_match = CACHE_PATH_PATTERN.search(entry)
+        if class_match and path_match:
+            base_match = CACHE_BASE_PATTERN.search(entry)
+            classes[class_match.group(1)] = (path_match.group(1), base_match.group(1) if base_match else None)
+    return classes
+
+
+def cached_class_names(path: Path = CLASS_CACHE_PATH) -> Optional[Dict[str, str]]:
+    """class_name -> res:// path recorded in the class cache (None if there is none)."""
+    classes = cached_classes(path)
+    return None if classes is None else {name: entry[0] for name, entry in classes.items()}
+
+
+def declared_base(model: ProjectModel, source: SourceFile, class_paths: Dict[str, str]) -> Optional[str]:
+    """
+    The base Godot records for a script's class: the `extends` class name, or
+    for `extends "res://..."` the global class (else native base) of that
+    script, followed up the chain. None if the chain cannot be resolved.
+    """
+    seen = set()
+    while source is not None and source.rel_path not in seen:
+        seen.add(source.rel_path)
+        match = SCRIPT_EXTENDS_PATTERN.search(source.content)
+        if match is None:
+            return DEFAULT_BASE
+        if match.group(3):
+            return match.group(3)
+        target = match.group(1) or match.group(2)
+        if not target.startswith("res://"):
+            return None  # Relative path: not worth resolving here
+        name = class_paths.get(target)
+        if name is not None:
+            return name
+        source = model.get_res(target)
+    return None
+
+
+def class_cache_changes(model: ProjectModel, path: Path = CLASS_CACHE_PATH) -> List[str]:
+    """
+    How the project's class_name declarations differ from the class cache.
+
+    Returns: [] when the cache is current, otherwise one line per change
+    ("added X", "removed Y", "moved Z: old -> new", "rebased W: A -> B").
+    """
+    cached = cached_classes(path)
+    if cached is None:
+        return ["no class cache"]
+
+    class_paths = model.class_names()
+    declared = {name: f"res://{rel_path.as_posix()}" for name, rel_path in class_paths.items()}
+    names_by_path = {res_path: name for name, res_path in declared.items()}
+    changes = []
+    for name in sorted(declared.keys() - cached.keys()):
+        changes.append(f"added {name}")
+    for name in sorted(cached.keys() - declared.keys()):
+        changes.append(f"removed {name}")
+    for name in sorted(declared.keys() & cached.keys()):
+        cached_path, cached_base = cached[name]
+        if declared[name] != cached_path:
+            changes.append(f"moved {name}: {cached_path} -> {declared[name]}")
+            continue
+        source = model.get(class_paths[name])
+        base = declared_base(model, source, names_by_path) if source is not None else None
+        if base is not None and cached_base is not None and base != cached_base:
+            changes.append(f"rebased {name}: extends {cached_base} -> {base}")
+    return changes
+
+
+def scan_class_cache(godot_bin: str, timeout: int = 60) -> subprocess.CompletedProcess:
+    """
+    Run the editor headless for a couple of frames so it scans the project and
+    writes .godot/global_script_class_cache.cfg (custom class_name types are
+    unknown to headless runs without it).
+    """
+    # NOTE: Use --quit-after 2 instead of --quit to allow import threads to complete
+    # See: https://github.com/godotengine/godot/issues/77508
+    return subprocess.run(
+        [
+            godot_bin,
+            "--headless",
+            "--editor",
+            "--path", str(PROJECT_ROOT),
+            "--quit-after", "2"  # Wait 2 frames for import threads to complete
+        ],
+        capture_output=True,
+        text=True,
+        timeout=timeout
+    )
+
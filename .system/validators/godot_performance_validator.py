@@ -12,6 +12,18 @@ Checks for:
 4. Untyped loops (WARNING)
 5. String concatenation in loops (WARNING)
 
+Pooling candidates (project-wide, informational):
+  instantiate()/new() sites are paired with the queue_free()/free() sites
+  that release them, their churn frequency is estimated from the call graph
+  (per-frame, per-hit, per-wave) and the results are ranked as object-pool
+  candidates.
+
+Checks 1 and 2 also cover helpers reached from those callbacks through the
+project call graph (see call_graph.py); such findings are reported with the
+call chain, e.g. `_process() → update_ai() → enemy.gd:find_target()`.
+Instantiation in a helper is a WARNING rather than BLOCKING since the
+graph cannot tell whether the call actually happens every frame.
+
 Exit Codes:
   0 - No performance issues detected
   1 - Critical performance issues found (blocking)
@@ -19,10 +31,18 @@ Exit Codes:
 
 import sys
 import re
+import hashlib
 from pathlib import Path
-from typing import List, Tuple, Dict
+from typing import List, Tuple, Dict, Optional
 from collections import defaultdict
 
+from project_model import ProjectModel, SourceFile, load_project_model
+from gdscript_parser import CodeIndex, FunctionSpan, NAME, NODE_PATH, OP, STRING, Statement
+from call_graph import (CallGraph, FunctionKey, build_call_graph, format_chain,
+                        hot_chains_for, string_dispatch_calls)
+from validator_cache import ResultCache
+from file_selection import FileSelection, selection_from_argv
+
 # ANSI colors
 RED = '\033[0;31m'
 GREEN = '\033[0;32m'
@@ -30,7 +50,27 @@ YELLOW = '\033[1;33m'
 CYAN = '\033[0;36m'
 NC = '\033[0m'
 
-PROJECT_ROOT = Path(__file__).parent.parent.parent
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+
+# Engine callbacks that run every frame / every input event
+PROCESS_FUNCS = {"_process", "_physics_process"}
+HOT_PATH_FUNCS = PROCESS_FUNCS | {"_input", "_unhandled_input"}
+
+# Hot functions of one script: function name -> call chain from a callback
+HotChains = Dict[str, List[FunctionKey]]
+
+# Churn tiers for pooling candidates, most frequent first: (tier, weight, roots).
+# Roots are engine callbacks or function names matching the pattern; every
+# function reachable from a root inherits its tier.
+CHURN_TIERS = [
+    ("per-frame", 60, PROCESS_FUNCS),
+    ("per-hit", 10, re.compile(r'hit|damage|collision|attack|fire|shoot|explode|die|death|_on_\w*(?:body|area)_entered')),
+    ("per-wave", 1, re.compile(r'wave|spawn')),
+]
+POOL_LOOP_FACTOR = 8     # Instantiation inside a loop happens this many times more
+FREE_METHODS = {"queue_free", "free"}
+
+PRELOAD_SCENE_PATTERN = re.compile(r'^\s*const\s+(\w+)\s*(?::\s*\w+\s*)?=\s*(?:pre)?load\(\s*"res://([^"]+\.tscn)"\s*\)', re.MULTILINE)
 
 
 class PerformanceIssue:
@@ -42,112 +82,78 @@ class PerformanceIssue:
         self.severity = severity  # "error" or "warning"
 
 
-def check_node_instantiation_in_process(content: str, lines: List[str]) -> List[PerformanceIssue]:
+def _hot_spans(index: CodeIndex, roots: set, chains: Optional[HotChains]) -> List[Tuple[FunctionSpan, Optional[str]]]:
     """
-    Detect Node.new() or instantiate() calls inside _process() or _physics_process().
-
-    This causes frame stutters and should use object pooling instead.
+    Functions to inspect: the callbacks themselves (chain None) plus every
+    function in `chains` reached from a callback through other calls.
     """
-    issues = []
-
-    # Find _process and _physics_process function bodies
-    func_pattern = r'^\s*func\s+(_process|_physics_process)\s*\([^)]*\)'
-
-    i = 0
-    while i < len(lines):
-        line = lines[i]
-
-        if re.match(func_pattern, line):
-            # Found a process function, scan its body
-            func_start = i + 1
-            indent_level = len(line) - len(line.lstrip())
+    spans = [(func, None) for func in index.spans(roots)]
+    for func in index.spans(set(chains or ()) - roots):
+        spans.append((func, format_chain(chains[func.name])))
+    return spans
 
-            j = func_start
-            while j < len(lines):
-                current_line = lines[j]
 
-                # Skip empty lines and comments
-                if not current_line.strip() or current_line.strip().startswith('#'):
-                    j += 1
-                    continue
-
-                current_indent = len(current_line) - len(current_line.lstrip())
-
-                # If we hit same or lower indentation with a new declaration, function ended
-                if current_indent <= indent_level and re.match(r'^\s*(func|class|signal|var|const|enum)\s', current_line):
-                    break
+def check_node_instantiation_in_process(index: CodeIndex, chains: Optional[HotChains] = None) -> List[PerformanceIssue]:
+    """
+    Detect Node.new() or instantiate() calls inside _process() or _physics_process(),
+    or inside a function they (transitively) call.
 
-                # Check for Node.new() or .instantiate()
-                if 'Node.new()' in current_line or 'Node2D.new()' in current_line or '.instantiate()' in current_line:
-                    # Make sure it's not in a comment
-                    if not re.search(r'#.*\.instantiate\(', current_line):
+    This causes frame stutters and should use object pooling instead.
+    """
+    issues = []
+    flagged_lines = set()
+
+    for func, chain in _hot_spans(index, PROCESS_FUNCS, chains):
+        for statement in func.statement.body():
+            for call in statement.calls:
+                is_node_new = call.name == "new" and (call.receiver or "").endswith(("Node", "Node2D"))
+                is_instantiate = call.name == "instantiate" and call.receiver is not None
+                if (is_node_new or is_instantiate) and call.line not in flagged_lines:
+                    flagged_lines.add(call.line)
+                    if chain is None:
                         issues.append(PerformanceIssue(
-                            line_num=j + 1,
+                            line_num=call.line,
                             issue_type="node_instantiation_in_process",
                             details="Node instantiation in _process() causes frame stutters",
                             severity="error"
                         ))
-
-                j += 1
-
-            i = j
-        else:
-            i += 1
+                    else:
+                        issues.append(PerformanceIssue(
+                            line_num=call.line,
+                            issue_type="node_instantiation_in_process",
+                            details=f"Node instantiation reachable from per-frame callback: {chain}",
+                            severity="warning"
+                        ))
 
     return issues
 
 
-def check_get_node_in_hot_paths(content: str, lines: List[str]) -> List[PerformanceIssue]:
+def check_get_node_in_hot_paths(index: CodeIndex, chains: Optional[HotChains] = None) -> List[PerformanceIssue]:
     """
-    Detect get_node() calls inside _process(), _physics_process(), or loops.
+    Detect get_node() calls inside _process(), _physics_process(), input
+    callbacks, or any function they (transitively) call.
 
     These should be cached with @onready.
     """
     issues = []
-
-    # Find hot path functions
-    func_pattern = r'^\s*func\s+(_process|_physics_process|_input|_unhandled_input)\s*\([^)]*\)'
-
-    i = 0
-    while i < len(lines):
-        line = lines[i]
-
-        if re.match(func_pattern, line):
-            # Found a hot path function, scan its body
-            func_start = i + 1
-            indent_level = len(line) - len(line.lstrip())
-
-            j = func_start
-            while j < len(lines):
-                current_line = lines[j]
-
-                # Skip empty lines and comments
-                if not current_line.strip() or current_line.strip().startswith('#'):
-                    j += 1
-                    continue
-
-                current_indent = len(current_line) - len(current_line.lstrip())
-
-                # If we hit same or lower indentation with a new declaration, function ended
-                if current_indent <= indent_level and re.match(r'^\s*(func|class|signal|var|const|enum)\s', current_line):
-                    break
-
-                # Check for get_node() or $ operator (shorthand for get_node)
-                if 'get_node(' in current_line or re.search(r'\$[A-Z]', current_line):
-                    # Make sure it's not in a comment
-                    if not re.search(r'#.*get_node\(', current_line):
-                        issues.append(PerformanceIssue(
-                            line_num=j + 1,
-                            issue_type="get_node_in_hot_path",
-                            details="get_node() in hot path (should use @onready)",
-                            severity="warning"
-                        ))
-
-                j += 1
-
-            i = j
-        else:
-            i += 1
+    flagged_lines = set()
+
+    for func, chain in _hot_spans(index, HOT_PATH_FUNCS, chains):
+        details = "get_node() in hot path (should use @onready)"
+        if chain is not None:
+            details = f"get_node() in hot path via {chain} (should use @onready)"
+        for statement in func.statement.body():
+            # get_node() calls and the $ operator (shorthand for get_node)
+            lines = [call.line for call in statement.calls if call.name == "get_node"]
+            lines += [token.line for token in statement.tokens if token.kind == NODE_PATH]
+            for line_num in sorted(set(lines) - flagged_lines):
+                flagged_lines.add(line_num)
+                issues.append(PerformanceIssue(
+                    line_num=line_num,
+                    issue_type="get_node_in_hot_path",
+                    details=details,
+                    severity="warning"
+                ))
 
     return issues
 
@@ -177,62 +183,42 @@ def check_untyped_loops(lines: List[str]) -> List[PerformanceIssue]:
     return issues
 
 
-def check_string_concatenation_in_loops(content: str, lines: List[str]) -> List[PerformanceIssue]:
+def check_string_concatenation_in_loops(index: CodeIndex) -> List[PerformanceIssue]:
     """
     Detect string concatenation (+ operator) inside loops.
 
     This allocates new strings per concatenation; use string formatting instead.
     """
     issues = []
-
-    # Find loops
-    i = 0
-    while i < len(lines):
-        line = lines[i]
-
-        # Check for loop start
-        if re.match(r'^\s*(for|while)\s+', line):
-            loop_start = i + 1
-            indent_level = len(line) - len(line.lstrip())
-
-            j = loop_start
-            while j < len(lines):
-                current_line = lines[j]
-
-                # Skip empty lines and comments
-                if not current_line.strip() or current_line.strip().startswith('#'):
-                    j += 1
+    flagged_lines = set()
+
+    # Outermost loops only - their bodies already include any nested loops
+    for loop in index.outer_loops:
+        for statement in loop.statement.body():
+            tokens = statement.tokens
+            for position, token in enumerate(tokens):
+                if token.kind != OP or token.value != "+":
                     continue
-
-                current_indent = len(current_line) - len(current_line.lstrip())
-
-                # If we hit same or lower indentation, loop ended
-                if current_indent <= indent_level:
-                    break
-
-                # Check for string concatenation with +
-                # Look for patterns like "string" + var or var + "string"
-                # Match: "..." + or '...' + or + "..." or + '...'
-                # Don't match: "+" or '+' (literal strings containing plus)
-                # Use negative lookbehind (?<!["']) to avoid matching + inside strings
-                if re.search(r'"[^"]*"\s*\+|\'[^\']*\'\s*\+|(?<!["\'])\+\s*["\']', current_line):
-                    issues.append(PerformanceIssue(
-                        line_num=j + 1,
-                        issue_type="string_concat_in_loop",
-                        details="String concatenation in loop (use % formatting)",
-                        severity="warning"
-                    ))
-
-                j += 1
-
-            i = j
-        else:
-            i += 1
+                # A string literal on either side of + (strings containing "+" are single tokens)
+                before = tokens[position - 1] if position > 0 else None
+                after = tokens[position + 1] if position + 1 < len(tokens) else None
+                literal = before if before is not None and before.kind == STRING else after
+                if literal is None or literal.kind != STRING:
+                    continue
+                if token.line in flagged_lines:
+                    continue
+                flagged_lines.add(token.line)
+                issues.append(PerformanceIssue(
+                    line_num=token.line,
+                    issue_type="string_concat_in_loop",
+                    details="String concatenation in loop (use % formatting)",
+                    severity="warning"
+                ))
 
     return issues
 
 
-def check_excessive_physics_layers(file_path: Path) -> List[PerformanceIssue]:
+def check_excessive_physics_layers(source: SourceFile) -> List[PerformanceIssue]:
     """
     Check if scene uses more than 8 physics layers.
 
@@ -241,19 +227,21 @@ def check_excessive_physics_layers(file_path: Path) -> List[PerformanceIssue]:
     issues = []
 
     # Only check .tscn files
-    if file_path.suffix != '.tscn':
+    if source.suffix != '.tscn':
         return issues
 
     try:
-        content = file_path.read_text(encoding='utf-8')
-
         # Count unique collision_layer and collision_mask values
-        layer_matches = re.findall(r'collision_layer\s*=\s*(\d+)', content)
-        mask_matches = re.findall(r'collision_mask\s*=\s*(\d+)', content)
+        values = []
+        parsed = source.scene
+        for section in list(parsed.nodes) + list(parsed.sub_resources.values()):
+            for key in ("collision_layer", "collision_mask"):
+                value = section.properties.get(key, "")
+                if value.isdigit():
+                    values.append(int(value))
 
         all_layers = set()
-        for match in layer_matches + mask_matches:
-            layer_value = int(match)
+        for layer_value in values:
             # Count which bits are set (which layers are used)
             for bit in range(32):
                 if layer_value & (1 << bit):
@@ -273,67 +261,282 @@ def check_excessive_physics_layers(file_path: Path) -> List[PerformanceIssue]:
     return issues
 
 
-def validate_file(file_path: Path) -> List[PerformanceIssue]:
-    """Run all performance checks on a file."""
+class PoolCandidate:
+    """An instantiation site whose instances churn often enough to pool."""
+    def __init__(self, rel_path: Path, line_num: int, function: str, target: str, tier: str,
+                 chain: List[FunctionKey], loop_depth: int, free_sites: List[str], score: float):
+        self.rel_path = rel_path
+        self.line_num = line_num
+        self.function = function
+        self.target = target            # e.g. "ENEMY_SCENE.instantiate()"
+        self.tier = tier                # "per-frame", "per-hit", "per-wave"
+        self.chain = chain
+        self.loop_depth = loop_depth
+        self.free_sites = free_sites    # e.g. ["enemy.gd:366 queue_free()"]
+        self.score = score
+
+
+def _is_test_file(source: SourceFile) -> bool:
+    return "_test.gd" in source.name or "test_" in source.name
+
+
+def _bound_variable(statement: Statement) -> Optional[str]:
+    """Variable assigned by `var x = ...` or `x = ...`, if any."""
+    if statement.kind == "var":
+        return statement.name
+    tokens = statement.tokens
+    if len(tokens) > 2 and tokens[0].kind == NAME and tokens[1].value in ("=", ":="):
+        return tokens[0].value
+    return None
+
+
+def _free_lines(statement: Statement, receivers: set) -> List[int]:
+    """
+    Lines freeing an object held by one of `receivers` (None = self):
+    x.queue_free(), x.call_deferred("queue_free"), connect(x.queue_free).
+    """
+    lines = [call.line for call in statement.calls + string_dispatch_calls(statement)
+             if call.name in FREE_METHODS and call.receiver in receivers]
+
+    # Callable references: finished.connect(x.queue_free)
+    tokens = statement.tokens
+    for index, token in enumerate(tokens):
+        if token.kind != NAME or token.value not in FREE_METHODS or index < 2:
+            continue
+        if tokens[index - 1].value != "." or tokens[index - 2].value not in receivers:
+            continue
+        if index + 1 < len(tokens) and tokens[index + 1].value == "(":
+            continue  # Direct call, counted above
+        lines.append(token.line)
+    return lines
+
+
+def _self_free_sites(source: SourceFile) -> List[str]:
+    """Where a script frees its own node (queue_free() / call_deferred("queue_free"))."""
+    sites = []
+    for statement in source.parsed.walk():
+        for line_num in _free_lines(statement, {None, "self"}):
+            sites.append(f"{source.name}:{line_num} queue_free()")
+    return sites
+
+
+def _churn_tiers(graph: CallGraph, model: ProjectModel) -> List[Tuple[str, int, Dict[FunctionKey, List[FunctionKey]]]]:
+    """(tier, weight, reachable functions -> chain) for every CHURN_TIERS entry."""
+    production = {source.rel_path for source in model.gd_files() if not _is_test_file(source)}
+    tiers = []
+    for tier, weight, roots in CHURN_TIERS:
+        keys = [
+            (rel_path, span.name)
+            for rel_path in sorted(production)
+            for span in graph.scripts[rel_path].source.index.functions
+            if (span.name in roots if isinstance(roots, set) else roots.search(span.name))
+        ]
+        tiers.append((tier, weight, graph.hot_paths_from(keys)))
+    return tiers
+
+
+def find_pool_candidates(model: ProjectModel, graph: Optional[CallGraph] = None) -> List[PoolCandidate]:
+    """
+    Pair instantiate()/new() sites with the sites that free their instances,
+    estimate how often they churn and rank them as object-pool candidates.
+
+    - `X.instantiate()` is always a site; `X.new()` only when the instance is
+      freed somewhere (plain Resources/Objects are not pool material)
+    - Free sites: the same variable freed in the creating function, or the
+      instantiated scene's root script (or the created class) freeing itself
+    - Sites only reached from setup/UI code are not reported
+    """
+    graph = graph or build_call_graph(model)
+    tiers = _churn_tiers(graph, model)
+    self_free: Dict[Path, List[str]] = {}
+    candidates = []
+
+    for source in model.gd_files():
+        if _is_test_file(source):
+            continue
+        scenes = dict(PRELOAD_SCENE_PATTERN.findall(source.content))
+        info = graph.scripts[source.rel_path]
+
+        for span in source.index.functions:
+            key = (source.rel_path, span.name)
+            tier = next(((name, weight, chains[key]) for name, weight, chains in tiers if key in chains), None)
+            if tier is None:
+                continue
+            statements = list(span.statement.body())
+
+            for statement in statements:
+                for call in statement.calls:
+                    if call.name not in ("instantiate", "new") or not call.receiver:
+                        continue
+                    if call.name == "new" and not call.receiver[0].isupper():
+                        continue
+
+                    # Script whose node frees itself when done
+                    script: Optional[Path] = None
+                    if call.receiver in scenes:
+                        scene = model.get(Path(scenes[call.receiver]))
+                        root_script = scene.scene.root_script if scene is not None else None
+                        script = Path(root_script.replace("res://", "", 1)) if root_script else None
+                    elif call.receiver in info.preloads:
+                        script = info.preloads[call.receiver]
+                    elif call.receiver in graph.classes:
+                        script = graph.classes[call.receiver]
+
+                    free_sites: List[str] = []
+                    variable = _bound_variable(statement)
+                    if variable:
+                        for other in statements:
+                            free_sites.extend(f"{source.name}:{line_num} {variable}.queue_free()"
+                                              for line_num in _free_lines(other, {variable}))
+                    if script is not None and model.get(script) is not None:
+                        if script not in self_free:
+                            self_free[script] = _self_free_sites(model.get(script))
+                        free_sites.extend(self_free[script])
+
+                    if call.name == "new" and not free_sites:
+                        continue
+
+                    name, weight, chain = tier
+                    loop_depth = source.index.loop_depth(call.line)
+                    score = weight * POOL_LOOP_FACTOR ** loop_depth * (2 if free_sites else 1)
+                    candidates.append(PoolCandidate(
+                        rel_path=source.rel_path,
+                        line_num=call.line,
+                        function=span.name,
+                        target=f"{call.receiver}.{call.name}()",
+                        tier=name,
+                        chain=chain,
+                        loop_depth=loop_depth,
+                        free_sites=free_sites,
+                        score=score
+                    ))
+
+    return sorted(candidates, key=lambda c: (-c.score, c.rel_path, c.line_num))
+
+
+def print_pool_candidates(candidates: List[PoolCandidate], limit: int = 10) -> None:
+    """Ranked pooling report (informational, never blocks)."""
+    print(f"{CYAN}♻️  Object pool candidates ({len(candidates)} instantiation site(s) with churn, ranked):{NC}\n")
+    for rank, candidate in enumerate(candidates[:limit], start=1):
+        loop = f", in loop ×{POOL_LOOP_FACTOR ** candidate.loop_depth}" if candidate.loop_depth else ""
+        print(f"  {rank}. {candidate.rel_path}:{candidate.line_num} {candidate.target} "
+              f"[{candidate.tier}{loop}]")
+        if len(candidate.chain) > 1:
+            print(f"     via {format_chain(candidate.chain)}")
+        if candidate.free_sites:
+            more = f" (+{len(candidate.free_sites) - 2} more)" if len(candidate.free_sites) > 2 else ""
+            print(f"     freed at {', '.join(candidate.free_sites[:2])}{more}")
+        else:
+            print("     no matching free site found")
+    if len(candidates) > limit:
+        print(f"  ... {len(candidates) - limit} more")
+    print(f"\n  {CYAN}💡 Reuse instances from a pool instead of instantiate()/queue_free(). "
+          f"See docs/godot-performance-patterns.md#object-pooling-patterns{NC}")
+
+
+def validate_file(source: SourceFile, process_chains: Optional[HotChains] = None,
+                  hot_chains: Optional[HotChains] = None) -> List[PerformanceIssue]:
+    """
+    Run all performance checks on a file.
+
+    `process_chains` / `hot_chains` name the file's functions reachable from
+    _process()/_physics_process() and from any hot-path callback respectively.
+    """
     try:
-        content = file_path.read_text(encoding='utf-8')
-        lines = content.split('\n')
+        lines = source.lines
 
         all_issues = []
 
         # Only run script checks on .gd files
-        if file_path.suffix == '.gd':
-            all_issues.extend(check_node_instantiation_in_process(content, lines))
-            all_issues.extend(check_get_node_in_hot_paths(content, lines))
+        if source.suffix == '.gd':
+            index = source.index
+            all_issues.extend(check_node_instantiation_in_process(index, process_chains))
+            all_issues.extend(check_get_node_in_hot_paths(index, hot_chains))
             all_issues.extend(check_untyped_loops(lines))
-            all_issues.extend(check_string_concatenation_in_loops(content, lines))
+            all_issues.extend(check_string_concatenation_in_loops(index))
 
         # Run scene checks on .tscn files
-        if file_path.suffix == '.tscn':
-            all_issues.extend(check_excessive_physics_layers(file_path))
+        if source.suffix == '.tscn':
+            all_issues.extend(check_excessive_physics_layers(source))
 
         return all_issues
 
     except Exception as e:
-        print(f"{YELLOW}⚠️  Could not read {file_path}: {e}{NC}")
+        print(f"{YELLOW}⚠️  Could not check {source.path}: {e}{NC}")
         return []
 
 
-def main():
+def _chains_digest(*chain_maps: HotChains) -> str:
+    """Cache dependency digest of a file's hot-function call chains."""
+    hasher = hashlib.sha256()
+    for chains in chain_maps:
+        for name in sorted(chains):
+            hasher.update(f"{name}={format_chain(chains[name])};".encode('utf-8'))
+        hasher.update(b"|")
+    return hasher.hexdigest()
+
+
+def main(model: Optional[ProjectModel] = None, selection: Optional[FileSelection] = None):
     """Check all GDScript and scene files for performance issues."""
 
     print(f"{CYAN}Checking for Godot performance anti-patterns...{NC}")
 
+    model = model or load_project_model(PROJECT_ROOT)
+    selection = selection or selection_from_argv(model)
+    cache = ResultCache("godot_performance_validator", Path(__file__))
+
+    # Functions reachable from per-frame / input callbacks, project-wide
+    graph = build_call_graph(model)
+    process_hot = graph.hot_paths(PROCESS_FUNCS)
+    hot = graph.hot_paths(HOT_PATH_FUNCS)
+
     file_issues: Dict[Path, List[PerformanceIssue]] = defaultdict(list)
     checked_files = 0
     error_count = 0
     warning_count = 0
 
-    # Check all .gd and .tscn files in project
-    for pattern in ['*.gd', '*.tscn']:
-        for file in PROJECT_ROOT.rglob(pattern):
-            # Skip addons directory
-            if "addons" in file.parts:
+    # Check all .gd and .tscn files in project (addons/ excluded by the model)
+    for sources in [model.gd_files(), model.scene_files()]:
+        for source in sources:
+            # Skip test files for .gd
+            if source.suffix == '.gd' and _is_test_file(source):
                 continue
 
-            # Skip test files for .gd
-            if file.suffix == '.gd' and ("_test.gd" in file.name or "test_" in file.name):
+            if not selection.includes(source):
                 continue
 
             checked_files += 1
-            issues = validate_file(file)
+            process_chains = hot_chains_for(process_hot, source.rel_path)
+            hot_chains = hot_chains_for(hot, source.rel_path)
+            # Findings depend on which functions other scripts make hot
+            deps = _chains_digest(process_chains, hot_chains)
+            issues = cache.lookup(source, PerformanceIssue, deps)
+            if issues is None:
+                issues = validate_file(source, process_chains, hot_chains)
+                cache.store(source, issues, deps)
 
             if issues:
-                file_issues[file] = issues
+                file_issues[source.path] = issues
                 for issue in issues:
                     if issue.severity == "error":
                         error_count += 1
                     else:
                         warning_count += 1
 
+    cache.save(prune=selection.full)
+
+    # Pooling candidates are ranked project-wide, reported for selected files
+    candidates = [
+        candidate for candidate in find_pool_candidates(model, graph)
+        if selection.full or selection.includes(model.get(candidate.rel_path))
+    ]
+
     # Report results
     if not file_issues:
         print(f"{GREEN}✅ No performance issues detected ({checked_files} files checked){NC}")
+        if candidates:
+            print()
+            print_pool_candidates(candidates)
         return 0
 
     # Show warnings
@@ -358,11 +561,16 @@ def main():
                         print(f"  {CYAN}💡 Fix: Add type hint: for item: Type in collection{NC}")
                     elif issue.issue_type == "string_concat_in_loop":
                         print(f"  {CYAN}💡 Fix: Use formatting: 'Text: %s' % value{NC}")
+                    elif issue.issue_type == "node_instantiation_in_process":
+                        print(f"  {CYAN}💡 Fix: Use object pooling. See docs/godot-performance-patterns.md{NC}")
                     elif issue.issue_type == "excessive_physics_layers":
                         print(f"  {CYAN}💡 Fix: Consolidate to ≤8 layers for better performance{NC}")
 
                 print()
 
+    if candidates:
+        print_pool_candidates(candidates)
+
     # Show errors (blocking)
     if error_count > 0:
         print(f"\n{RED}❌ Found {error_count} critical performance issue(s):{NC}\n")
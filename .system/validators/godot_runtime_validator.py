@@ -10,11 +10,18 @@ This catches issues that static analysis (gdlint) cannot detect:
 - Invalid enum/constant references
 
 This is the MISSING VALIDATOR that would have caught the Logger bug.
+
+Reuses the headless Godot worker when one is running (godot_worker.py):
+every script is recompiled there instead of booting a fresh engine.
 """
 
 import subprocess
 import sys
 from pathlib import Path
+from typing import Optional
+
+from godot_binary import find_godot_binary, is_godot_running
+from godot_worker import WorkerError, connect_worker, running_worker_pid
 
 # ANSI colors
 RED = '\033[0;31m'
@@ -23,60 +30,60 @@ YELLOW = '\033[1;33m'
 NC = '\033[0m'
 
 PROJECT_ROOT = Path(__file__).parent.parent.parent
-GODOT_EXECUTABLE = "/Applications/Godot.app/Contents/MacOS/Godot"
-
-
-def check_godot_installed():
-    """Check if Godot is installed."""
-    if not Path(GODOT_EXECUTABLE).exists():
-        print(f"{YELLOW}⚠️  Godot not found at {GODOT_EXECUTABLE}, skipping runtime validation{NC}")
-        return False
-    return True
 
 
-def is_godot_running():
-    """Check if Godot is already running (would block headless check)."""
+def find_godot() -> Optional[str]:
+    """Godot binary, or None (with a notice) if it is not installed."""
     try:
-        result = subprocess.run(
-            ["pgrep", "-x", "Godot"],
-            capture_output=True,
-            text=True
-        )
-        return result.returncode == 0
-    except:
-        return False
+        return find_godot_binary()
+    except FileNotFoundError as e:
+        print(f"{YELLOW}⚠️  {e} - skipping runtime validation{NC}")
+        return None
+
+
+def load_project_output(godot_bin: str) -> str:
+    """Engine output from loading the project (worker job or a fresh headless run)."""
+    worker = connect_worker(godot_bin)
+    if worker is not None:
+        print(f"Recompiling scripts in Godot worker (pid {worker.pid})...")
+        try:
+            _, output = worker.run("load_project", timeout=30)
+            return output
+        except WorkerError as e:
+            print(f"{YELLOW}⚠️  Godot worker failed ({e}), starting Godot directly{NC}")
 
+    print(f"Running Godot headless load test...")
 
-def validate_godot_loads():
+    # Run Godot in headless mode with --quit flag
+    # This will load the project and immediately exit
+    # If there are parse errors, they'll appear in stderr
+    result = subprocess.run(
+        [
+            godot_bin,
+            "--headless",
+            "--quit",
+            "--path", str(PROJECT_ROOT)
+        ],
+        capture_output=True,
+        text=True,
+        timeout=30  # 30 second timeout
+    )
+    return result.stdout + result.stderr
+
+
+def validate_godot_loads(godot_bin: str):
     """
     Attempt to load the project in Godot headless mode.
     Returns True if successful, False if parse errors detected.
     """
     # Skip validation if Godot is already running (would lock)
-    if is_godot_running():
+    if is_godot_running(exclude=[running_worker_pid() or 0]):
         print(f"{YELLOW}⚠️  Godot is running - skipping runtime validation{NC}")
         print(f"   (Close Godot to enable runtime validation on commit)")
         return True
 
-    print(f"Running Godot headless load test...")
-
     try:
-        # Run Godot in headless mode with --quit flag
-        # This will load the project and immediately exit
-        # If there are parse errors, they'll appear in stderr
-        result = subprocess.run(
-            [
-                GODOT_EXECUTABLE,
-                "--headless",
-                "--quit",
-                "--path", str(PROJECT_ROOT)
-            ],
-            capture_output=True,
-            text=True,
-            timeout=30  # 30 second timeout
-        )
-
-        output = result.stdout + result.stderr
+        output = load_project_output(godot_bin)
 
         # Check for parse errors
         error_indicators = [
@@ -117,11 +124,12 @@ def validate_godot_loads():
 
 def main():
     """Run Godot runtime validation."""
-    if not check_godot_installed():
+    godot_bin = find_godot()
+    if godot_bin is None:
         # If Godot not installed, skip validation (don't fail)
         return 0
 
-    if not validate_godot_loads():
+    if not validate_godot_loads(godot_bin):
         print(f"\n{YELLOW}💡 Fix: Restart Godot and check the Output panel for errors{NC}")
         return 1
 
@@ -7,17 +7,60 @@ Runs GUT tests in headless mode during pre-commit to catch test failures.
 Uses GUT (Godot Unit Test) framework for proper test isolation, assertions,
 and lifecycle hooks. Replaces manual test scene orchestration.
 
-UPDATED: Now supports cached test results when Godot is running.
-If test_results.txt is fresh (<5 minutes), trusts cached results.
-Otherwise, requires closing Godot or running tests manually.
+UPDATED: Results are cached by content. A run is keyed by the digest of every
+script, scene, resource, data file and project.godot (test_results_db.tree_key);
+when the tree is byte-identical to a previous passing run that covered the
+selected tests, its results are reused at any age and the tests are not run.
+When Godot is running and there are no results for this exact tree, close
+Godot or run the tests in the editor.
+
+Results are read from GUT's JUnit report (test_results.xml), not scraped from
+the console, and every run is recorded in the results database
+(test_results_db.py); test_results.txt is still written as a summary.
+
+Tests run in the headless Godot worker when one is running (godot_worker.py),
+which skips the engine boot and class-cache scan.
+
+Pre-commit runs only the test files affected by the staged changes
+(test_impact.py, via GUT's -gtest); --full (CI) runs the whole suite, as do
+changes whose impact cannot be resolved.
+
+Without the worker, the selected test files are split into shards balanced
+by their last recorded durations and run in parallel headless Godot
+processes (gut_shards.py, --shards N); the shard reports are merged back into
+test_results.xml.
+
+Each run's per-test times go into the timing history; tests and suites much
+slower than their rolling median are flagged after the run, and
+--slowest N lists the slowest tests so the suite stays inside the hook timeout.
+
+Failures are indexed per run (test_triage.py); each failing test is labelled
+new / recurring / flaky, and --triage shows the full classification.
 """
 
+import argparse
+import os
+import sqlite3
 import subprocess
 import sys
+import tempfile
 import time
 from pathlib import Path
+from typing import List, Optional
 import re
 
+from godot_binary import (CLASS_CACHE_PATH, class_cache_changes, find_godot_binary,
+                          is_godot_running, scan_class_cache)
+from file_selection import FileSelection
+from godot_worker import WorkerError, connect_worker, running_worker_pid
+from gut_shards import default_shard_count, merge_junit_reports, plan_shards, run_shards
+from project_model import ProjectModel, load_project_model
+from test_impact import TEST_GLOB, select_tests, to_res_path
+from test_results_db import (TEST_RESULTS_XML, ResultsDatabase, RunSummary, TestReport, parse_junit,
+                             print_slowest, print_timing_regressions, result_key_files, tree_key)
+from validator_cache import cache_enabled
+from test_triage import parse_gut_console, parse_gut_stats, print_triage, triage
+
 # ANSI colors
 RED = '\033[0;31m'
 GREEN = '\033[0;32m'
@@ -26,7 +69,6 @@ CYAN = '\033[0;36m'
 NC = '\033[0m'
 
 PROJECT_ROOT = Path(__file__).parent.parent.parent
-GODOT_EXECUTABLE = "/Applications/Godot.app/Contents/MacOS/Godot"
 
 # GUT CLI script path
 GUT_CLI_SCRIPT = "res://addons/gut/gut_cmdln.gd"
@@ -38,130 +80,164 @@ TEST_DIR = "res://scripts/tests/"
 TEST_RESULTS_FILE = PROJECT_ROOT / "test_results.txt"
 TEST_LOG_FILE = PROJECT_ROOT / "test_run.log"
 
-# Freshness threshold (5 minutes)
-FRESHNESS_THRESHOLD_SECONDS = 300
+# Hook timeout for a GUT run, and the share of it that triggers a warning
+TEST_TIMEOUT_SECONDS = 60
+TIMEOUT_WARNING_RATIO = 0.75
 
 
-def check_test_results_freshness() -> tuple[bool, dict]:
+def cached_results(model: ProjectModel, files: List[str],
+                   key: str) -> tuple[Optional[RunSummary], Optional[RunSummary]]:
     """
-    Check if test_results.txt exists and is fresh (< 5 minutes).
-    Returns (is_fresh: bool, stats: dict)
+    Latest passing and latest failing run of exactly this tree (`key`) that
+    covered every one of `files`. A test_results.xml written since the last
+    run (GUT panel, manual run) is recorded first.
+    Returns (passing: RunSummary or None, failing: RunSummary or None)
     """
-    if not TEST_RESULTS_FILE.exists():
-        return False, {}
-
-    # Check file age
-    age_seconds = time.time() - TEST_RESULTS_FILE.stat().st_mtime
-    if age_seconds > FRESHNESS_THRESHOLD_SECONDS:
-        return False, {}
-
-    # Parse results
-    stats = {}
     try:
-        with open(TEST_RESULTS_FILE) as f:
-            for line in f:
-                line = line.strip()
-                if ': ' in line:
-                    key, value = line.split(': ', 1)
-                    stats[key] = value
-    except Exception as e:
-        print(f"{YELLOW}⚠️  Warning: Could not parse test_results.txt: {e}{NC}")
-        return False, {}
-
-    # Verify required fields
-    if not all(k in stats for k in ['timestamp', 'passed', 'failed', 'total']):
-        return False, {}
-
-    return True, stats
-
-
-def is_godot_running():
-    """Check if Godot is already running (would block headless tests)."""
+        with ResultsDatabase() as db:
+            db.import_report(model=model)
+            return db.cached_run(key, files, "PASS"), db.cached_run(key, files, "FAIL")
+    except sqlite3.Error as e:
+        print(f"{YELLOW}⚠️  Warning: Could not read the test results database: {e}{NC}")
+        return None, None
+
+
+def refresh_class_cache(godot_bin: str, model: ProjectModel) -> None:
+    """Run the editor class scan, unless the class cache already matches the scripts."""
+    changes = class_cache_changes(model)
+    if not changes:
+        print(f"{GREEN}✓ Class cache is current ({len(model.class_names())} classes) - skipping scan{NC}", flush=True)
+        return
+
+    # Run Godot in editor mode to scan and register all class_name scripts
+    # This ensures custom Resource classes like WeaponResource are available in headless mode
+    shown = ", ".join(changes[:3]) + (f", +{len(changes) - 3} more" if len(changes) > 3 else "")
+    print(f"{CYAN}Scanning project to register custom classes ({shown})...{NC}", flush=True)
+    scan_class_cache(godot_bin)
+
+    # Verify class cache was created
+    if CLASS_CACHE_PATH.exists():
+        print(f"{GREEN}✓ Class cache created successfully{NC}", flush=True)
+    else:
+        print(f"{YELLOW}⚠️  Warning: Class cache not found at {CLASS_CACHE_PATH}{NC}", flush=True)
+
+
+def gut_test_arguments(tests: Optional[List[str]]) -> List[str]:
+    """GUT CLI arguments selecting the whole suite or just `tests`."""
+    if tests is None:
+        return [f"-gdir={TEST_DIR}"]
+    # "-gdir=" clears the directories from .gutconfig.json
+    return ["-gdir=", f"-gtest={','.join(tests)}"]
+
+
+def gut_command(godot_bin: str, tests: Optional[List[str]], junit_path: Optional[Path] = None) -> List[str]:
+    """Headless GUT command line for the suite (or `tests`)."""
+    command = [
+        godot_bin,
+        "--headless",
+        "--path", str(PROJECT_ROOT),
+        "-s", GUT_CLI_SCRIPT,
+        *gut_test_arguments(tests),
+        "-gexit"
+    ]
+    if junit_path is not None:
+        command.append(f"-gjunit_xml_file={junit_path}")
+    return command
+
+
+def run_headless(godot_bin: str, tests: Optional[List[str]] = None) -> str:
+    """Run the suite (or `tests`) in a fresh headless Godot; returns its output."""
+    print(f"{CYAN}Running tests with registered classes...{NC}", flush=True)
+
+    # Now run the actual tests with classes properly registered
+    result = subprocess.run(
+        gut_command(godot_bin, tests),
+        capture_output=True,
+        text=True,
+        timeout=TEST_TIMEOUT_SECONDS
+    )
+    return result.stdout + result.stderr
+
+
+def run_sharded(godot_bin: str, tests: List[str], shard_count: int) -> tuple[str, bool]:
+    """
+    Run `tests` split across parallel headless Godot processes.
+    Returns (output: str, complete: bool) - output is every shard's output in
+    turn; complete is False if a shard timed out or wrote no report
+    """
     try:
-        result = subprocess.run(
-            ["pgrep", "-x", "Godot"],
-            capture_output=True,
-            text=True
-        )
-        return result.returncode == 0
-    except:
-        return False
+        with ResultsDatabase() as db:
+            durations = db.suite_durations() or None  # None: last test_results.xml
+    except sqlite3.Error:
+        durations = None
+    shards = plan_shards(tests, shard_count, durations)
+    print(f"{CYAN}Running {len(tests)} test file(s) in {len(shards)} parallel shard(s)...{NC}", flush=True)
+
+    # Shard HOME/XDG trees and reports are removed once the reports are merged
+    with tempfile.TemporaryDirectory(prefix="gut_shards_") as work_dir:
+        results = run_shards(lambda shard, junit_path: gut_command(godot_bin, shard, junit_path), shards,
+                             Path(work_dir), TEST_TIMEOUT_SECONDS)
+        complete = True
+        sections = []
+        for result in results:
+            report = parse_junit(result.junit_path)
+            if result.returncode is None or report is None:
+                complete = False
+                print(f"  {RED}Shard {result.index + 1}: {len(result.tests)} file(s), "
+                      f"{'timed out' if result.returncode is None else 'no report'}{NC}", flush=True)
+            else:
+                shard_stats = report.stats()
+                print(f"  Shard {result.index + 1}: {len(result.tests)} file(s), "
+                      f"{shard_stats['passed']}/{shard_stats['total']} passed in {result.elapsed:.1f}s", flush=True)
+            sections.append(f"===== Shard {result.index + 1}/{len(results)}: "
+                            f"{', '.join(result.tests)} =====\n{result.output}")
 
+        if not merge_junit_reports([result.junit_path for result in results]):
+            print(f"{YELLOW}⚠️  Warning: No shard wrote a JUnit report{NC}", flush=True)
+    return "\n".join(sections), complete
 
-def run_gut_tests() -> tuple[bool, str, dict]:
+
+def run_gut_tests(godot_bin: str, model: ProjectModel, tests: Optional[List[str]] = None,
+                  shard_count: int = 1, key: Optional[str] = None) -> tuple[bool, str, dict, Optional[TestReport]]:
     """
-    Run all GUT tests in headless mode.
-    Returns (success: bool, output: str, stats: dict)
+    Run all GUT tests (or just the `tests` scripts) in headless mode.
+    `key` is the tree_key of the files under test, stored with the run.
+    Returns (success: bool, output: str, stats: dict, report: TestReport or None)
     """
+    started = time.time()
     try:
-        # First, run Godot in editor mode to scan and register all class_name scripts
-        # This ensures custom Resource classes like WeaponResource are available in headless mode
-        # NOTE: Use --quit-after 2 instead of --quit to allow import threads to complete
-        # See: https://github.com/godotengine/godot/issues/77508
-        print(f"{CYAN}Scanning project to register custom classes...{NC}", flush=True)
-        scan_result = subprocess.run(
-            [
-                GODOT_EXECUTABLE,
-                "--headless",
-                "--editor",
-                "--path", str(PROJECT_ROOT),
-                "--quit-after", "2"  # Wait 2 frames for import threads to complete
-            ],
-            capture_output=True,
-            text=True,
-            timeout=60
-        )
-
-        # Verify class cache was created
-        cache_path = PROJECT_ROOT / ".godot" / "global_script_class_cache.cfg"
-        if cache_path.exists():
-            print(f"{GREEN}✓ Class cache created successfully{NC}", flush=True)
+        output = None
+        complete = True
+        worker = connect_worker(godot_bin, model)
+        if worker is not None:
+            print(f"{CYAN}Running tests in Godot worker (pid {worker.pid})...{NC}", flush=True)
+            try:
+                _, output = worker.run("test", timeout=TEST_TIMEOUT_SECONDS, dirs=[TEST_DIR], tests=tests or [])
+            except WorkerError as e:
+                print(f"{YELLOW}⚠️  Godot worker failed ({e}), starting Godot directly{NC}", flush=True)
+
+        if output is None:
+            refresh_class_cache(godot_bin, model)
+            files = tests if tests is not None else [to_res_path(t.rel_path) for t in model.glob(TEST_GLOB)]
+            if shard_count > 1 and len(files) > 1:
+                output, complete = run_sharded(godot_bin, files, shard_count)
+            else:
+                output = run_headless(godot_bin, tests)
+
+        # GUT writes test_results.xml at the end of every run (.gutconfig.json)
+        report = parse_junit(TEST_RESULTS_XML)
+        if report is not None and (report.mtime or 0) < started - 1:
+            report = None  # Left over from an earlier run
+        source = "junit"
+        if report is not None:
+            stats = report.stats()
         else:
-            print(f"{YELLOW}⚠️  Warning: Class cache not found at {cache_path}{NC}", flush=True)
-
-        print(f"{CYAN}Running tests with registered classes...{NC}", flush=True)
-
-        # Now run the actual tests with classes properly registered
-        result = subprocess.run(
-            [
-                GODOT_EXECUTABLE,
-                "--headless",
-                "--path", str(PROJECT_ROOT),
-                "-s", GUT_CLI_SCRIPT,
-                f"-gdir={TEST_DIR}",
-                "-gexit"
-            ],
-            capture_output=True,
-            text=True,
-            timeout=60  # 60 second timeout for all tests
-        )
-
-        output = result.stdout + result.stderr
-
-        # Parse GUT output for test statistics
-        # GUT prints totals section like:
-        # Tests               411
-        # Passing Tests       393
-        # Risky/Pending        18
-        stats = {"passed": 0, "failed": 0, "total": 0}
-
-        # Look for GUT's totals section
-        total_match = re.search(r'Tests\s+(\d+)', output)
-        passed_match = re.search(r'Passing Tests\s+(\d+)', output)
-        pending_match = re.search(r'Risky/Pending\s+(\d+)', output)
-
-        if total_match and passed_match:
-            stats["total"] = int(total_match.group(1))
-            stats["passed"] = int(passed_match.group(1))
-
-            # Calculate failed tests (exclude pending/risky tests)
-            # Failed = Total - Passing - Pending
-            pending = int(pending_match.group(1)) if pending_match else 0
-            stats["failed"] = stats["total"] - stats["passed"] - pending
-        elif passed_match:  # Fallback: only "Passing Tests" found
-            stats["passed"] = int(passed_match.group(1))
-            stats["total"] = stats["passed"]  # Assume all tests passed
-            stats["failed"] = 0
+            # No report (Godot crashed or timed out) - use GUT's console summary
+            stats = parse_gut_stats(output)
+            report = parse_gut_console(output) if stats["total"] else None
+            source = "console"
+        if not complete:
+            stats["failed"] = max(stats["failed"], 1)
 
         # Check for "Nothing was run" (no tests found - OK during migration)
         # GUT outputs this with ANSI codes, so check for substring
@@ -173,6 +249,22 @@ def run_gut_tests() -> tuple[bool, str, dict]:
         # Note: Godot may return non-zero exit code due to warnings (e.g., RID leaks)
         # but functional tests still pass. We accept this as success.
         success = (stats["failed"] == 0 and stats["total"] > 0) or nothing_ran
+        scope = 'full' if tests is None else f'{len(tests)} test file(s)'
+
+        elapsed = time.time() - started
+        if report is not None:
+            try:
+                with ResultsDatabase() as db:
+                    run_id = db.record_run(report, scope, 'PASS' if success else 'FAIL', elapsed,
+                                           stats=stats, source=source, key=key)
+                    regressions = db.timing_regressions(run_id)
+                if regressions:
+                    print_timing_regressions(regressions)
+            except sqlite3.Error as e:
+                print(f"{YELLOW}⚠️  Warning: Could not record results: {e}{NC}")
+        if elapsed > TEST_TIMEOUT_SECONDS * TIMEOUT_WARNING_RATIO:
+            print(f"{YELLOW}⏱️  Tests took {elapsed:.0f}s of the {TEST_TIMEOUT_SECONDS}s hook timeout - "
+                  f"see --slowest 20{NC}")
 
         # Write results to test_results.txt for caching
         try:
@@ -183,6 +275,7 @@ def run_gut_tests() -> tuple[bool, str, dict]:
                 f.write(f"failed: {stats['failed']}\n")
                 f.write(f"total: {stats['total']}\n")
                 f.write(f"status: {'PASS' if success else 'FAIL'}\n")
+                f.write(f"scope: {scope}\n")
         except Exception as e:
             print(f"{YELLOW}⚠️  Warning: Could not write test_results.txt: {e}{NC}")
 
@@ -193,65 +286,101 @@ def run_gut_tests() -> tuple[bool, str, dict]:
         except Exception as e:
             print(f"{YELLOW}⚠️  Warning: Could not write test_run.log: {e}{NC}")
 
-        return success, output, stats
+        return success, output, stats, report
 
     except subprocess.TimeoutExpired:
-        return False, "Tests timed out after 60 seconds", {"passed": 0, "failed": 0, "total": 0}
+        return False, f"Tests timed out after {TEST_TIMEOUT_SECONDS} seconds", {"passed": 0, "failed": 0, "total": 0}, None
     except Exception as e:
-        return False, f"Failed to run tests: {e}", {"passed": 0, "failed": 0, "total": 0}
-
-
-def main():
-    """Run all GUT tests and report results."""
-
-    # If Godot is running, check for fresh cached results
-    if is_godot_running():
-        print(f"{CYAN}Godot is running - checking for cached test results...{NC}")
-
-        fresh, stats = check_test_results_freshness()
+        return False, f"Failed to run tests: {e}", {"passed": 0, "failed": 0, "total": 0}, None
+
+
+def main(model: Optional[ProjectModel] = None, selection: Optional[FileSelection] = None):
+    """Run the GUT tests affected by the change and report results."""
+    parser = argparse.ArgumentParser(description="Run GUT tests headless")
+    parser.add_argument('files', nargs='*', type=Path,
+                        help='Changed files to select tests for (default: staged files)')
+    parser.add_argument('--full', action='store_true', help='Run the whole suite')
+    parser.add_argument('--shards', type=int, default=int(os.environ.get("GUT_SHARDS", 0)) or default_shard_count(),
+                        help='Parallel headless Godot processes (default: GUT_SHARDS or one per core, max 4)')
+    parser.add_argument('--slowest', type=int, metavar='N',
+                        help='Show the N slowest tests from the timing history and exit')
+    parser.add_argument('--triage', action='store_true',
+                        help='Classify the last run\'s failures as new, recurring or flaky and exit')
+    args = parser.parse_args()
+
+    if args.slowest or args.triage:
+        with ResultsDatabase() as db:
+            db.import_report()
+            if args.slowest:
+                print_slowest(db, args.slowest)
+            if args.triage:
+                result = triage(db)
+                if result is None:
+                    print(f"{YELLOW}No recorded test runs{NC}")
+                else:
+                    print_triage(result)
+        return 0
 
-        if fresh:
-            # Fresh results available - trust them
-            age_seconds = int(time.time() - TEST_RESULTS_FILE.stat().st_mtime)
-            print(f"{GREEN}✓ Using cached test results (age: {age_seconds}s){NC}")
-            print(f"  Timestamp: {stats.get('timestamp')}")
-            print(f"  Passed: {stats.get('passed')}/{stats.get('total')}")
-            print()
+    model = model or load_project_model(PROJECT_ROOT)
+    full = args.full or (selection is not None and selection.full)
+    selected, reason = select_tests(model, args.files or None, full)
+    if selected is None:
+        tests = None
+        files = [to_res_path(test.rel_path) for test in model.glob(TEST_GLOB)]
+        print(f"{CYAN}Selected the full suite ({reason}){NC}")
+    elif not selected:
+        print(f"{GREEN}✅ No tests affected ({reason}) - skipping GUT run{NC}")
+        return 0
+    else:
+        tests = files = [to_res_path(test) for test in selected]
+        print(f"{CYAN}Selected affected tests only ({reason}):{NC}")
+        for test in tests:
+            print(f"  {test}")
+
+    # Results of a previous run on exactly this tree
+    key = tree_key(result_key_files(model))
+    passing, failing = cached_results(model, files, key)
+    godot_running = is_godot_running(exclude=[running_worker_pid() or 0])
+
+    if passing is not None and (cache_enabled() or godot_running):
+        print(f"{GREEN}✓ Tree unchanged since passing run #{passing.id} ({passing.when}, {passing.scope}) "
+              f"- reusing its results{NC}")
+        print(f"  Passed: {passing.passed}/{passing.total}")
+        return 0
 
-            # Check if tests are passing
-            failed = int(stats.get('failed', 0))
-            if failed > 0:
-                print(f"{RED}❌ Cached tests show {failed} failure(s){NC}")
-                print(f"  Fix tests and rerun in Godot Editor")
-                print(f"  Or view failures: cat test_run.log")
-                return 1
+    if godot_running:
+        print(f"{CYAN}Godot is running - cannot run tests headless{NC}")
+        if failing is not None:
+            print(f"{RED}❌ Run #{failing.id} ({failing.when}) of this exact tree shows "
+                  f"{failing.failed} failure(s){NC}")
+            print(f"  Fix tests and rerun in Godot Editor")
+            print(f"  Or view failures: python3 .system/validators/godot_test_runner.py --triage")
+            return 1
 
-            return 0
-        else:
-            # No fresh results - must run tests or close Godot
-            if TEST_RESULTS_FILE.exists():
-                age_seconds = int(time.time() - TEST_RESULTS_FILE.stat().st_mtime)
-                age_minutes = age_seconds // 60
-                print(f"{YELLOW}⚠️  Cached results are stale (age: {age_minutes}m {age_seconds % 60}s > 5m threshold){NC}")
-            else:
-                print(f"{YELLOW}⚠️  No cached test results found{NC}")
+        print(f"{YELLOW}⚠️  No test results for the current tree (a test, script, scene or resource "
+              f"changed since the last run){NC}")
+        print()
+        print(f"{RED}❌ Cannot verify tests: Godot is running AND no results for this tree{NC}")
+        print()
+        print(f"  {CYAN}Fix Option 1:{NC} Run tests in Godot Editor (GUT panel)")
+        print(f"               This updates test_results.xml")
+        print()
+        print(f"  {CYAN}Fix Option 2:{NC} Close Godot and retry commit")
+        print(f"               Tests will run automatically in headless mode")
+        print()
+        print(f"  {YELLOW}Bypass (NOT recommended):{NC} git commit --no-verify")
+        print()
+        return 1
 
-            print()
-            print(f"{RED}❌ Cannot verify tests: Godot is running AND no fresh results{NC}")
-            print()
-            print(f"  {CYAN}Fix Option 1:{NC} Run tests in Godot Editor (GUT panel)")
-            print(f"               This updates test_results.txt and test_run.log")
-            print()
-            print(f"  {CYAN}Fix Option 2:{NC} Close Godot and retry commit")
-            print(f"               Tests will run automatically in headless mode")
-            print()
-            print(f"  {YELLOW}Bypass (NOT recommended):{NC} git commit --no-verify")
-            print()
-            return 1
+    try:
+        godot_bin = find_godot_binary()
+    except FileNotFoundError as e:
+        print(f"{RED}❌ {str(e)}{NC}")
+        return 1
 
     print(f"{CYAN}Running GUT tests in headless mode...{NC}")
 
-    success, output, stats = run_gut_tests()
+    success, output, stats, report = run_gut_tests(godot_bin, model, tests, args.shards, key)
 
     # Print summary
     print()
@@ -272,20 +401,31 @@ def main():
         print(f"{RED}❌ {stats['failed']} of {stats['total']} tests failed{NC}")
         print()
 
-        # Print relevant failure output
-        # Look for test failure indicators in GUT output
-        lines = output.split('\n')
-        in_failure_section = False
-
-        for line in lines:
-            # Detect failure markers in GUT output
-            if 'FAILED' in line or 'ERROR' in line or 'Assertion failed' in line:
-                in_failure_section = True
-
-            # Print failure-related lines
-            if in_failure_section or re.search(r'test_\w+.*FAILED', line):
-                if line.strip():
-                    print(f"  {line}")
+        if report is not None and report.failures:
+            try:
+                with ResultsDatabase() as db:
+                    result = triage(db)
+            except sqlite3.Error:
+                result = None
+            for failure in report.failures:
+                label = f" {YELLOW}[{result.label((failure.suite, failure.name))}]{NC}" if result else ""
+                print(f"  {RED}✗{NC} {failure.suite} :: {failure.name}{label}")
+                for line in (failure.message or "").splitlines():
+                    if line.strip():
+                        print(f"      {line.strip()}")
+            print(f"\n{CYAN}   Failure history: python3 .system/validators/godot_test_runner.py --triage{NC}")
+        else:
+            # No report (Godot crashed or timed out) - show failure lines from the console output
+            in_failure_section = False
+            for line in output.split('\n'):
+                # Detect failure markers in GUT output
+                if 'FAILED' in line or 'ERROR' in line or 'Assertion failed' in line:
+                    in_failure_section = True
+
+                # Print failure-related lines
+                if in_failure_section or re.search(r'test_\w+.*FAILED', line):
+                    if line.strip():
+                        print(f"  {line}")
 
         print(f"\n{YELLOW}💡 Fix: Run tests in Godot editor with GUT panel (bottom panel){NC}")
         print(f"{CYAN}   Or run: godot --headless -s {GUT_CLI_SCRIPT} -gdir={TEST_DIR} -gexit{NC}")
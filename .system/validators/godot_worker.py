@@ -0,0 +1,498 @@
+#!/usr/bin/env python3
+"""
+Godot Headless Worker
+
+A long-lived headless Godot process that keeps the project loaded and runs
+validator jobs on request, so the Godot-driven validators (scene
+instantiation, GUT runner, runtime load check) stop paying for an engine
+boot - and the test runner for an editor class-cache scan - on every commit.
+
+Jobs are JSON lines over a loopback socket (127.0.0.1, random port, per-start
+token); the worker answers each with one JSON line. Engine output printed
+while a job runs (GUT's report, parse errors) is appended to the worker log
+and handed back with the result, so callers parse it exactly like the output
+of a cold `godot --headless` run.
+
+Jobs:
+    ping          -> {}
+    load_project  -> {"failed": [res_path, ...]}          Recompile every script
+    instantiate   -> {"failed": [...], "timings": {...}}  scenes=[...], repeat=N
+    test          -> {"total", "passed", "failed", "pending"}  dirs=[...] or tests=[...]
+
+Before each job the worker reloads the scripts/scenes/resources that changed
+on disk. Adding, removing or renaming a class_name (or editing project.godot)
+needs a fresh class cache, so clients restart the worker when the project's
+class declarations no longer match the ones it was started with.
+
+Validators use the worker when one is running and fall back to a cold start
+otherwise (GODOT_WORKER=0 disables it).
+
+Usage:
+    python3 godot_worker.py start     # Refresh the class cache, start the worker
+    python3 godot_worker.py status
+    python3 godot_worker.py stop
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import secrets
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from godot_binary import class_cache_changes, find_godot_binary, scan_class_cache
+from project_model import ProjectModel, load_project_model
+
+# ANSI colors
+RED = '\033[0;31m'
+GREEN = '\033[0;32m'
+YELLOW = '\033[1;33m'
+CYAN = '\033[0;36m'
+NC = '\033[0m'
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+
+CACHE_DIR = PROJECT_ROOT / ".system" / "cache"
+STATE_PATH = CACHE_DIR / "godot_worker.json"
+LOG_PATH = CACHE_DIR / "godot_worker.log"
+
+STARTUP_TIMEOUT = 60
+CONNECT_TIMEOUT = 5
+READY_MARKER = "[GodotWorker] READY"
+
+# Generated worker script. Kept outside the project tree so the validators'
+# project walk (and Godot's own import) never see it.
+WORKER_SCRIPT = """extends SceneTree
+
+# Validator job worker (generated by .system/validators/godot_worker.py)
+
+const PORT = %%PORT%%
+const TOKEN = "%%TOKEN%%"
+const WATCH_EXTENSIONS = ["gd", "tscn", "tres"]
+
+var _server := TCPServer.new()
+var _peer: StreamPeerTCP = null
+var _buffer := ""
+var _mtimes := {}
+var _busy := false
+
+
+func _initialize():
+\tif _server.listen(PORT, "127.0.0.1") != OK:
+\t\tprinterr("[GodotWorker] Could not listen on port " + str(PORT))
+\t\tquit(1)
+\t\treturn
+\t_mtimes = _scan_mtimes("res://", {})
+\tprint("[GodotWorker] READY " + str(PORT))
+
+
+func _process(_delta):
+\tif _peer == null and _server.is_connection_available():
+\t\t_peer = _server.take_connection()
+\t\t_buffer = ""
+\tif _peer == null or _busy:
+\t\treturn false
+\t_peer.poll()
+\tif _peer.get_status() != StreamPeerTCP.STATUS_CONNECTED:
+\t\t_peer = null
+\t\treturn false
+\tvar available = _peer.get_available_bytes()
+\tif available > 0:
+\t\t_buffer += _peer.get_utf8_string(available)
+\tvar newline = _buffer.find("\\n")
+\tif newline >= 0:
+\t\tvar line = _buffer.substr(0, newline)
+\t\t_buffer = _buffer.substr(newline + 1)
+\t\t_busy = true
+\t\t_handle(line)
+\treturn false
+
+
+func _handle(line: String) -> void:
+\tvar request = JSON.parse_string(line)
+\tvar response = {"ok": false}
+\tif typeof(request) != TYPE_DICTIONARY or request.get("token") != TOKEN:
+\t\tresponse["error"] = "invalid request"
+\telse:
+\t\tresponse["id"] = request.get("id")
+\t\t_reload_changed()
+\t\tvar job = request.get("job", "")
+\t\tvar params = request.get("params", {})
+\t\tmatch job:
+\t\t\t"ping":
+\t\t\t\tresponse["result"] = {}
+\t\t\t"load_project":
+\t\t\t\tresponse["result"] = _load_project()
+\t\t\t"instantiate":
+\t\t\t\tresponse["result"] = _instantiate(params.get("scenes", []), int(params.get("repeat", 0)))
+\t\t\t"test":
+\t\t\t\tresponse["result"] = await _run_tests(params.get("dirs", []), params.get("tests", []))
+\t\t\t"quit":
+\t\t\t\tresponse["result"] = {}
+\t\t\t_:
+\t\t\t\tresponse["error"] = "unknown job: " + str(job)
+\t\tresponse["ok"] = response.has("result")
+\t\tif job == "quit":
+\t\t\t_send(response)
+\t\t\tquit(0)
+\t\t\treturn
+\t_send(response)
+\t_busy = false
+
+
+func _send(response: Dictionary) -> void:
+\tif _peer != null:
+\t\t_peer.put_data((JSON.stringify(response) + "\\n").to_utf8_buffer())
+
+
+func _scan_mtimes(dir: String, found: Dictionary) -> Dictionary:
+\tfor sub in DirAccess.get_directories_at(dir):
+\t\tif sub.begins_with(".") or (dir == "res://" and sub == "addons"):
+\t\t\tcontinue
+\t\t_scan_mtimes(dir.path_join(sub), found)
+\tfor file in DirAccess.get_files_at(dir):
+\t\tif file.get_extension() in WATCH_EXTENSIONS:
+\t\t\tvar path = dir.path_join(file)
+\t\t\tfound[path] = FileAccess.get_modified_time(path)
+\treturn found
+
+
+# Bring cached scripts and resources up to date with the files on disk
+func _reload_changed() -> void:
+\tvar current = _scan_mtimes("res://", {})
+\tfor path in current:
+\t\tif _mtimes.get(path, -1) == current[path] or not ResourceLoader.has_cached(path):
+\t\t\tcontinue
+\t\tif path.ends_with(".gd"):
+\t\t\tvar script: GDScript = load(path)
+\t\t\tscript.source_code = FileAccess.get_file_as_string(path)
+\t\t\tscript.reload(true)
+\t\telse:
+\t\t\tResourceLoader.load(path, "", ResourceLoader.CACHE_MODE_REPLACE)
+\t_mtimes = current
+
+
+func _load_project() -> Dictionary:
+\tvar failed = []
+\tfor path in _mtimes:
+\t\tif not path.ends_with(".gd"):
+\t\t\tcontinue
+\t\tvar script = ResourceLoader.load(path, "", ResourceLoader.CACHE_MODE_IGNORE)
+\t\tif script == null or not script.can_instantiate():
+\t\t\tprinterr("ERROR: Failed to load script " + path)
+\t\t\tfailed.append(path)
+\treturn {"failed": failed}
+
+
+func _instantiate(scenes: Array, repeat: int) -> Dictionary:
+\tvar failed = []
+\tvar timings = {}
+\tfor path in scenes:
+\t\tvar samples = {
+\t\t\t"cold_load_us": [], "cold_instantiate_us": [],
+\t\t\t"warm_load_us": [], "warm_instantiate_us": [],
+\t\t}
+\t\t# A plain pass/fail check is one warm pass (changed files were reloaded)
+\t\tvar error = ""
+\t\tif repeat > 0:
+\t\t\terror = _measure(path, ResourceLoader.CACHE_MODE_IGNORE_DEEP, "cold", repeat, samples)
+\t\t\tif error == "":
+\t\t\t\tload(path)
+\t\t\t\terror = _measure(path, ResourceLoader.CACHE_MODE_REUSE, "warm", repeat, samples)
+\t\telse:
+\t\t\terror = _measure(path, ResourceLoader.CACHE_MODE_REUSE, "warm", 1, samples)
+\t\tif error != "":
+\t\t\tprint("[InstantiationTest] FAILED: " + error)
+\t\t\tfailed.append(error)
+\t\t\tcontinue
+\t\tprint("[InstantiationTest] PASSED: " + path)
+\t\tif repeat > 0:
+\t\t\ttimings[path] = samples
+\treturn {"failed": failed, "timings": timings}
+
+
+func _measure(path: String, cache_mode: int, label: String, repeat: int, samples: Dictionary) -> String:
+\tfor _i in repeat:
+\t\tvar start = Time.get_ticks_usec()
+\t\tvar packed = ResourceLoader.load(path, "", cache_mode)
+\t\tvar loaded = Time.get_ticks_usec()
+\t\tif packed == null:
+\t\t\treturn "Could not load " + path
+\t\tvar instance = packed.instantiate()
+\t\tvar instantiated = Time.get_ticks_usec()
+\t\tif instance == null:
+\t\t\treturn path + " - instantiate() returned null"
+\t\tinstance.free()
+\t\tsamples[label + "_load_us"].append(loaded - start)
+\t\tsamples[label + "_instantiate_us"].append(instantiated - loaded)
+\treturn ""
+
+
+# Same run as `-s addons/gut/gut_cmdln.gd -gdir=...`, without quitting at the end
+func _run_tests(dirs: Array, tests: Array) -> Dictionary:
+\tvar config = load("res://addons/gut/gut_config.gd").new()
+\tconfig.load_options("res://.gutconfig.json")
+\tif tests.size() > 0:
+\t\tconfig.options.dirs = []
+\t\tconfig.options.tests = tests
+\telif dirs.size() > 0:
+\t\tconfig.options.dirs = dirs
+\tconfig.options.should_exit = false
+\tconfig.options.should_exit_on_success = false
+\tvar runner = load("res://addons/gut/gui/GutRunner.tscn").instantiate()
+\trunner.set_gut_config(config)
+\troot.add_child(runner)
+\trunner.run_tests(false)
+\tawait runner.gut.end_run
+\tvar gut = runner.gut
+\tvar result = {
+\t\t"total": gut.get_test_count(),
+\t\t"passed": gut.get_pass_count(),
+\t\t"failed": gut.get_fail_count(),
+\t\t"pending": gut.get_pending_count(),
+\t}
+\trunner.queue_free()
+\treturn result
+"""
+
+
+class WorkerError(Exception):
+    """The worker could not run a job (not reachable, crashed, rejected it)."""
+
+
+def project_digest(model: ProjectModel) -> str:
+    """Hash of what a running worker cannot pick up: class_names and project.godot."""
+    hasher = hashlib.sha256()
+    for name, rel_path in sorted(model.class_names().items()):
+        hasher.update(f"{name}={rel_path.as_posix()}\n".encode())
+    project_file = PROJECT_ROOT / "project.godot"
+    if project_file.exists():
+        hasher.update(project_file.read_bytes())
+    return hasher.hexdigest()
+
+
+def _read_state() -> Optional[Dict]:
+    try:
+        return json.loads(STATE_PATH.read_text())
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+def _is_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def running_worker_pid() -> Optional[int]:
+    """Pid of the running worker, if any (for is_godot_running's exclude list)."""
+    state = _read_state()
+    if state and _is_alive(int(state.get("pid", 0))):
+        return int(state["pid"])
+    return None
+
+
+class GodotWorker:
+    """Client for a running worker (see connect_worker())."""
+    def __init__(self, state: Dict):
+        self.pid = int(state["pid"])
+        self.port = int(state["port"])
+        self.token = state["token"]
+        self.digest = state.get("digest", "")
+        self._next_id = 1
+
+    def run(self, job: str, timeout: int = 120, **params) -> Tuple[Dict, str]:
+        """
+        Run a job and wait for it.
+
+        Returns: (result, output) - output is what the engine printed meanwhile
+        """
+        request = {"id": self._next_id, "token": self.token, "job": job, "params": params}
+        self._next_id += 1
+        offset = LOG_PATH.stat().st_size if LOG_PATH.exists() else 0
+
+        try:
+            with socket.create_connection(("127.0.0.1", self.port), timeout=CONNECT_TIMEOUT) as sock:
+                sock.settimeout(timeout)
+                sock.sendall((json.dumps(request) + "\n").encode())
+                data = b""
+                while not data.endswith(b"\n"):
+                    chunk = sock.recv(65536)
+                    if not chunk:
+                        raise WorkerError(f"worker closed the connection during '{job}'")
+                    data += chunk
+        except socket.timeout:
+            raise WorkerError(f"'{job}' timed out after {timeout}s")
+        except OSError as e:
+            raise WorkerError(f"could not reach worker on port {self.port}: {e}")
+
+        response = json.loads(data.decode())
+        output = _read_log(offset)
+        if not response.get("ok"):
+            raise WorkerError(response.get("error", f"'{job}' failed"))
+        return response.get("result", {}), output
+
+
+def _read_log(offset: int) -> str:
+    try:
+        with open(LOG_PATH, 'rb') as f:
+            f.seek(offset)
+            return f.read().decode('utf-8', errors='replace')
+    except OSError:
+        return ""
+
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_worker(godot_bin: str, model: Optional[ProjectModel] = None) -> GodotWorker:
+    """Refresh the class cache if needed, launch the worker and wait until it listens."""
+    model = model or load_project_model(PROJECT_ROOT)
+    stop_worker()
+
+    if class_cache_changes(model):
+        scan_class_cache(godot_bin)
+
+    port = _free_port()
+    token = secrets.token_hex(16)
+    script = WORKER_SCRIPT.replace("%%PORT%%", str(port)).replace("%%TOKEN%%", token)
+    root_hash = hashlib.sha256(str(PROJECT_ROOT).encode()).hexdigest()[:8]
+    script_path = Path(tempfile.gettempdir()) / f"godot_worker_{root_hash}.gd"
+    script_path.write_text(script)
+
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    with open(LOG_PATH, 'w') as log:
+        process = subprocess.Popen(
+            [godot_bin, "--headless", "--path", str(PROJECT_ROOT), "--script", str(script_path)],
+            stdin=subprocess.DEVNULL,
+            stdout=log,
+            stderr=subprocess.STDOUT,
+            start_new_session=True  # Outlives the commit that started it
+        )
+
+    deadline = time.time() + STARTUP_TIMEOUT
+    while READY_MARKER not in _read_log(0):
+        if process.poll() is not None:
+            raise WorkerError(f"worker exited during startup (see {LOG_PATH})")
+        if time.time() > deadline:
+            process.kill()
+            raise WorkerError(f"worker did not start within {STARTUP_TIMEOUT}s (see {LOG_PATH})")
+        time.sleep(0.1)
+
+    state = {
+        "pid": process.pid,
+        "port": port,
+        "token": token,
+        "digest": project_digest(model),
+        "godot": godot_bin,
+        "started": time.strftime('%Y-%m-%d %H:%M:%S'),
+    }
+    STATE_PATH.write_text(json.dumps(state, indent=2) + "\n")
+    return GodotWorker(state)
+
+
+def stop_worker() -> bool:
+    """Stop the running worker. Returns True if one was running."""
+    state = _read_state()
+    if STATE_PATH.exists():
+        STATE_PATH.unlink()
+    if not state or not _is_alive(int(state.get("pid", 0))):
+        return False
+
+    try:
+        GodotWorker(state).run("quit", timeout=10)
+    except WorkerError:
+        pass
+    pid = int(state["pid"])
+    for _ in range(50):
+        if not _is_alive(pid):
+            return True
+        time.sleep(0.1)
+    os.kill(pid, signal.SIGTERM)
+    return True
+
+
+def connect_worker(godot_bin: Optional[str] = None,
+                   model: Optional[ProjectModel] = None) -> Optional[GodotWorker]:
+    """
+    The running worker, or None if there is none (callers cold-start Godot).
+
+    A worker started before a class_name or project.godot change is
+    restarted, since its class cache no longer matches the project.
+    """
+    if os.environ.get("GODOT_WORKER") == "0":
+        return None
+    state = _read_state()
+    if not state or not _is_alive(int(state.get("pid", 0))):
+        return None
+
+    model = model or load_project_model(PROJECT_ROOT)
+    worker = GodotWorker(state)
+    try:
+        if worker.digest != project_digest(model):
+            print(f"{CYAN}Class declarations changed - restarting Godot worker...{NC}", flush=True)
+            return start_worker(godot_bin or state.get("godot") or find_godot_binary(), model)
+        worker.run("ping", timeout=CONNECT_TIMEOUT)
+    except WorkerError as e:
+        print(f"{YELLOW}⚠️  Godot worker unavailable ({e}), starting Godot directly{NC}", flush=True)
+        return None
+    return worker
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Manage the long-lived headless Godot worker")
+    parser.add_argument('command', choices=['start', 'stop', 'status'])
+    args = parser.parse_args(argv)
+
+    if args.command == 'stop':
+        if stop_worker():
+            print(f"{GREEN}✓ Godot worker stopped{NC}")
+        else:
+            print(f"{YELLOW}⚠️  No Godot worker running{NC}")
+        return 0
+
+    if args.command == 'status':
+        state = _read_state()
+        if not state or not _is_alive(int(state.get("pid", 0))):
+            print(f"{YELLOW}⚠️  No Godot worker running{NC}")
+            return 1
+        stale = state.get("digest") != project_digest(load_project_model(PROJECT_ROOT))
+        print(f"{GREEN}✓ Godot worker running{NC} (pid {state['pid']}, port {state['port']}, "
+              f"since {state.get('started')})")
+        if stale:
+            print(f"{YELLOW}  Class declarations changed since start - the next job restarts it{NC}")
+        return 0
+
+    try:
+        godot_bin = find_godot_binary()
+    except FileNotFoundError as e:
+        print(f"{RED}❌ {str(e)}{NC}")
+        return 1
+
+    print(f"{CYAN}Starting Godot worker ({godot_bin})...{NC}", flush=True)
+    try:
+        worker = start_worker(godot_bin)
+    except WorkerError as e:
+        print(f"{RED}❌ {e}{NC}")
+        return 1
+    print(f"{GREEN}✓ Godot worker listening on 127.0.0.1:{worker.port} (pid {worker.pid}){NC}")
+    print(f"  Log: {LOG_PATH.relative_to(PROJECT_ROOT)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
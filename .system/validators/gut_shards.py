@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+GUT Test Sharding
+
+Splits the GUT test files into N shards balanced by their historical run
+time and runs each shard in its own headless Godot process, in parallel.
+
+- Durations are passed in by the caller: godot_test_runner.py uses each
+  suite's median over recent runs from the results database
+  (ResultsDatabase.suite_durations()). Without that history (an empty or
+  unreadable database) they fall back to the `time=` attribute of each
+  <testsuite> in the last JUnit report (test_results.xml). Files with no
+  timing either way get the average.
+- Shards are filled longest-first onto the least-loaded shard.
+- Every shard gets its own HOME/XDG directories, so user:// (save files,
+  settings) does not collide between processes.
+- Shard JUnit reports are merged back into test_results.xml in GUT's own
+  layout (suites in path order, totals recomputed).
+
+Usage (from godot_test_runner.py):
+    from gut_shards import plan_shards, run_shards
+
+    shards = plan_shards(test_paths, count=4)
+    with tempfile.TemporaryDirectory(prefix="gut_shards_") as work_dir:
+        results = run_shards(command_for, shards, Path(work_dir))   # [ShardResult(output, junit_xml), ...]
+        merge_junit_reports([r.junit_path for r in results], TEST_RESULTS_XML)
+"""
+
+import os
+import re
+import subprocess
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+
+TEST_RESULTS_XML = PROJECT_ROOT / "test_results.xml"
+
+# Default shard count: one per core, capped (each shard is a full engine)
+MAX_DEFAULT_SHARDS = 4
+
+# Raw <testsuite ...> ... </testsuite> blocks of a GUT JUnit report
+SUITE_BLOCK_PATTERN = re.compile(r'^[ \t]*<testsuite .*?</testsuite>\n?', re.MULTILINE | re.DOTALL)
+SUITE_ATTR_PATTERN = re.compile(r'<testsuite name="([^"]*)" tests="(\d+)" failures="(\d+)"')
+
+
+class ShardResult:
+    """One shard's run."""
+    def __init__(self, index: int, tests: List[str], output: str, junit_path: Path,
+                 returncode: Optional[int], elapsed: float):
+        self.index = index
+        self.tests = tests
+        self.output = output            # Combined stdout/stderr
+        self.junit_path = junit_path    # This shard's JUnit report
+        self.returncode = returncode    # None if it timed out
+        self.elapsed = elapsed
+
+
+def default_shard_count() -> int:
+    return max(1, min(MAX_DEFAULT_SHARDS, os.cpu_count() or 1))
+
+
+def suite_durations(junit_path: Path = TEST_RESULTS_XML) -> Dict[str, float]:
+    """
+    res:// test path -> seconds, from a previous JUnit report. Fallback for
+    plan_shards() when the results database has no timing history.
+    """
+    durations: Dict[str, float] = {}
+    if not junit_path.exists():
+        return durations
+    try:
+        for _event, element in ET.iterparse(junit_path, events=("start",)):
+            if element.tag == "testsuite":
+                try:
+                    durations["res://" + element.get("name", "")] = float(element.get("time", 0))
+                except ValueError:
+                    pass
+    except ET.ParseError:
+        pass  # Truncated report (interrupted run) - use what was read
+    return durations
+
+
+def plan_shards(tests: List[str], count: int, durations: Optional[Dict[str, float]] = None) -> List[List[str]]:
+    """
+    Split test paths into at most `count` shards of similar total duration
+    (longest processing time first). Empty shards are dropped.
+    `durations` are per-suite seconds (database medians); None reads them
+    from the last test_results.xml.
+    """
+    durations = suite_durations() if durations is None else durations
+    known = [durations[test] for test in tests if test in durations]
+    fallback = sum(known) / len(known) if known else 1.0
+
+    shards: List[List[str]] = [[] for _ in range(max(1, min(count, len(tests))))]
+    loads = [0.0] * len(shards)
+    for test in sorted(tests, key=lambda t: (-durations.get(t, fallback), t)):
+        target = loads.index(min(loads))
+        shards[target].append(test)
+        loads[target] += durations.get(test, fallback)
+    return [sorted(shard) for shard in shards if shard]
+
+
+def shard_environment(shard_dir: Path) -> Dict[str, str]:
+    """Environment giving a Godot process its own user:// directory."""
+    env = dict(os.environ)
+    for variable, name in (("HOME", "home"), ("XDG_DATA_HOME", "data"),
+                           ("XDG_CONFIG_HOME", "config"), ("XDG_CACHE_HOME", "cache"),
+                           ("APPDATA", "appdata")):
+        path = shard_dir / name
+        path.mkdir(parents=True, exist_ok=True)
+        env[variable] = str(path)
+    return env
+
+
+def run_shards(command_for: Callable[[List[str], Path], List[str]], shards: List[List[str]],
+               work_dir: Path, timeout: int = 60) -> List[ShardResult]:
+    """
+    Run every shard at once. `command_for(tests, junit_path)` builds the
+    Godot command line for one shard. Each shard's user:// directories and
+    JUnit report go under `work_dir`, which the caller owns and removes once
+    the reports are merged.
+    """
+
+    def run(index: int) -> ShardResult:
+        shard_dir = work_dir / f"shard_{index}"
+        junit_path = shard_dir / "results.xml"
+        env = shard_environment(shard_dir)
+        started = time.time()
+        try:
+            result = subprocess.run(
+                command_for(shards[index], junit_path),
+                capture_output=True,
+                text=True,
+                timeout=timeout,
+                env=env
+            )
+            output, returncode = result.stdout + result.stderr, result.returncode
+        except subprocess.TimeoutExpired as e:
+            output = _decode(e.stdout) + _decode(e.stderr) + f"\nShard {index + 1} timed out after {timeout} seconds\n"
+            returncode = None
+        return ShardResult(index, shards[index], output, junit_path, returncode, time.time() - started)
+
+    with ThreadPoolExecutor(max_workers=len(shards)) as pool:
+        return list(pool.map(run, range(len(shards))))
+
+
+def _decode(data) -> str:
+    if data is None:
+        return ""
+    return data.decode("utf-8", errors="replace") if isinstance(data, bytes) else data
+
+
+def merge_junit_reports(reports: List[Path], destination: Path = TEST_RESULTS_XML) -> bool:
+    """
+    Merge shard reports into one file laid out like GUT's own export.
+    Returns False if no shard produced a report.
+    """
+    blocks: Dict[str, str] = {}
+    tests = failures = 0
+    for report in reports:
+        if not report.exists():
+            continue
+        text = report.read_text(encoding="utf-8")
+        for block in SUITE_BLOCK_PATTERN.findall(text):
+            match = SUITE_ATTR_PATTERN.search(block)
+            if not match:
+                continue
+            blocks[match.group(1)] = block if block.endswith("\n") else block + "\n"
+            tests += int(match.group(2))
+            failures += int(match.group(3))
+
+    if not blocks:
+        return False
+
+    merged = '<?xml version="1.0" encoding="UTF-8"?>\n'
+    merged += f'<testsuites name="GutTests" failures="{failures}" tests="{tests}" >\n'
+    merged += "".join(blocks[name] for name in sorted(blocks))
+    merged += '</testsuites>'
+    destination.write_text(merged, encoding="utf-8")
+    return True
@@ -14,7 +14,9 @@ Exit Codes:
 import sys
 import re
 from pathlib import Path
-from typing import List, Tuple
+from typing import List, Tuple, Optional
+
+from project_model import ProjectModel, SourceFile, load_project_model
 
 # ANSI colors
 RED = '\033[0;31m'
@@ -22,7 +24,7 @@ GREEN = '\033[0;32m'
 YELLOW = '\033[1;33m'
 NC = '\033[0m'
 
-PROJECT_ROOT = Path(__file__).parent.parent.parent
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
 
 # Godot 4.x native classes that are commonly conflicted with
 # Source: https://docs.godotengine.org/en/stable/classes/
@@ -84,7 +86,7 @@ GODOT_NATIVE_CLASSES = {
 }
 
 
-def find_class_name_conflicts(file_path: Path) -> List[Tuple[int, str, str]]:
+def find_class_name_conflicts(source: SourceFile) -> List[Tuple[int, str, str]]:
     """
     Find class_name declarations that conflict with Godot natives.
 
@@ -94,10 +96,7 @@ def find_class_name_conflicts(file_path: Path) -> List[Tuple[int, str, str]]:
     conflicts = []
 
     try:
-        content = file_path.read_text(encoding='utf-8')
-        lines = content.split('\n')
-
-        for line_num, line in enumerate(lines, start=1):
+        for line_num, line in enumerate(source.lines, start=1):
             # Match: class_name ClassName
             match = re.match(r'^\s*class_name\s+(\w+)', line)
             if match:
@@ -114,30 +113,28 @@ def find_class_name_conflicts(file_path: Path) -> List[Tuple[int, str, str]]:
                         break
 
     except Exception as e:
-        print(f"{YELLOW}⚠️  Could not read {file_path}: {e}{NC}")
+        print(f"{YELLOW}⚠️  Could not check {source.path}: {e}{NC}")
 
     return conflicts
 
 
-def main():
+def main(model: Optional[ProjectModel] = None):
     """Check all GDScript files for native class name conflicts."""
 
     print("Checking for native class name conflicts...")
 
+    model = model or load_project_model(PROJECT_ROOT)
+
     all_conflicts = []
     checked_files = 0
 
-    # Check all .gd files in project
-    for gd_file in PROJECT_ROOT.rglob("*.gd"):
-        # Skip addons directory
-        if "addons" in gd_file.parts:
-            continue
-
+    # Check all .gd files in project (addons/ excluded by the model)
+    for source in model.gd_files():
         checked_files += 1
-        conflicts = find_class_name_conflicts(gd_file)
+        conflicts = find_class_name_conflicts(source)
 
         if conflicts:
-            all_conflicts.append((gd_file, conflicts))
+            all_conflicts.append((source.path, conflicts))
 
     # Report results
     if not all_conflicts:
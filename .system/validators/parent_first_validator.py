@@ -22,7 +22,11 @@ This validator performs basic pattern detection to catch common violations.
 import re
 import sys
 from pathlib import Path
-from typing import List, Tuple
+from typing import List, Tuple, Optional
+
+from project_model import ProjectModel, load_project_model
+from validator_cache import ResultCache
+from file_selection import FileSelection, selection_from_argv
 
 
 class ParentFirstViolation:
@@ -36,16 +40,17 @@ class ParentFirstViolation:
         return f"{self.file_path}:{self.line_num} - {self.reason}\n  {self.line_content}"
 
 
-def check_file(file_path: Path) -> List[ParentFirstViolation]:
+def check_file(file_path: Path, lines: Optional[List[str]] = None) -> List[ParentFirstViolation]:
     """Check a single GDScript file for Parent-First Protocol violations."""
     violations = []
 
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-    except Exception as e:
-        print(f"Error reading {file_path}: {e}", file=sys.stderr)
-        return violations
+    if lines is None:
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                lines = f.readlines()
+        except Exception as e:
+            print(f"Error reading {file_path}: {e}", file=sys.stderr)
+            return violations
 
     # Track variable assignments and configuration
     # Format: {var_name: {'created_line': int, 'configured_before_parent': bool, 'parented_line': int}}
@@ -110,9 +115,9 @@ def check_file(file_path: Path) -> List[ParentFirstViolation]:
     return violations
 
 
-def main():
+def main(model: Optional[ProjectModel] = None, selection: Optional[FileSelection] = None):
     """Run Parent-First Protocol validation on all GDScript files in scripts/ui/"""
-    root_dir = Path(__file__).parent.parent.parent
+    root_dir = Path(__file__).resolve().parent.parent.parent
     ui_dir = root_dir / 'scripts' / 'ui'
 
     if not ui_dir.exists():
@@ -127,10 +132,19 @@ def main():
     all_violations = []
     files_checked = 0
 
-    for gd_file in ui_dir.rglob('*.gd'):
+    model = model or load_project_model(root_dir)
+    selection = selection or selection_from_argv(model)
+    cache = ResultCache("parent_first_validator", Path(__file__))
+    for source in model.glob('scripts/ui/**/*.gd'):
+        if not selection.includes(source):
+            continue
         files_checked += 1
-        violations = check_file(gd_file)
+        violations = cache.lookup(source, ParentFirstViolation)
+        if violations is None:
+            violations = check_file(source.path, source.lines)
+            cache.store(source, violations)
         all_violations.extend(violations)
+    cache.save(prune=selection.full)
 
     print(f"Files checked: {files_checked}")
     print(f"Violations found: {len(all_violations)}")
@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+"""
+Shared Project Model
+
+In-memory view of the project's GDScript and scene files, built once per
+validator run and shared by every validator. Replaces the per-validator
+`PROJECT_ROOT.rglob("*.gd")` + `read_text()` loops so the filesystem walk and
+UTF-8 decoding happen exactly once per commit.
+
+Usage (inside a validator):
+    from project_model import ProjectModel, load_project_model
+
+    def main(model: Optional[ProjectModel] = None) -> int:
+        model = model or load_project_model(PROJECT_ROOT)
+        for source in model.gd_files():
+            ...  # source.path, source.content, source.lines, source.functions
+        for scene in model.scene_files():
+            ...  # scene.scene.root, scene.scene.nodes, scene.scene.ext_resources
+
+The orchestrator builds the model once and passes it to each validator's
+main(); validators run standalone build (and cache) their own.
+"""
+
+import hashlib
+import os
+import re
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from gdscript_parser import CodeIndex, FunctionSpan, GDScript, parse
+from scene_parser import SceneFile, parse_scene_cached
+
+# Extensions loaded eagerly when the model is built (everything else is lazy)
+EAGER_SUFFIXES = {".gd", ".tscn"}
+
+# Directories never walked (VCS metadata only - .godot/ etc. match rglob)
+SKIP_DIRS = {".git"}
+
+# Dependency edges (see ProjectModel.dependents): res:// references
+# (preload/load/ext_resource) and `extends ClassName` on a global class_name
+RES_REF_PATTERN = re.compile(r'res://([^"\'\s)]+)')
+CLASS_NAME_PATTERN = re.compile(r'^class_name\s+(\w+)', re.MULTILINE)
+EXTENDS_PATTERN = re.compile(r'^extends\s+(\w+)', re.MULTILINE)
+
+# Text files that can hold those references. All of them are loaded before
+# the reverse index is built, so dependents() does not depend on which lazy
+# files earlier validators happened to read.
+INDEXED_SUFFIXES = EAGER_SUFFIXES | {".tres", ".gdshader", ".gdshaderinc", ".godot"}
+
+
+class SourceFile:
+    """One project file, read and decoded once."""
+    def __init__(self, path: Path, rel_path: Path, content: str):
+        self.path = path          # Absolute path
+        self.rel_path = rel_path  # Path relative to the project root
+        self.content = content
+        self.lines = content.split('\n')
+        self._indents: Optional[List[int]] = None
+        self._digest: Optional[str] = None
+        self._parsed: Optional[GDScript] = None
+
+    @property
+    def name(self) -> str:
+        return self.path.name
+
+    @property
+    def suffix(self) -> str:
+        return self.path.suffix
+
+    @property
+    def res_path(self) -> str:
+        """Godot resource path, e.g. res://scripts/entities/enemy.gd"""
+        return f"res://{self.rel_path.as_posix()}"
+
+    @property
+    def digest(self) -> str:
+        """SHA-256 of the file contents (cache key for per-file results)."""
+        if self._digest is None:
+            self._digest = hashlib.sha256(self.content.encode('utf-8')).hexdigest()
+        return self._digest
+
+    @property
+    def parsed(self) -> GDScript:
+        """Tokenized statement tree (see gdscript_parser.py), built on first use."""
+        if self._parsed is None:
+            self._parsed = parse(self.content)
+        return self._parsed
+
+    @property
+    def scene(self) -> SceneFile:
+        """Parsed .tscn node tree (see scene_parser.py), cached per content hash."""
+        return parse_scene_cached(self.content, self.digest)
+
+    @property
+    def indents(self) -> List[int]:
+        """Indentation width of every line (blank lines report 0)."""
+        if self._indents is None:
+            self._indents = [len(line) - len(line.lstrip()) for line in self.lines]
+        return self._indents
+
+    @property
+    def index(self) -> CodeIndex:
+        """Function spans, loop spans and nesting depth (see gdscript_parser.CodeIndex)."""
+        return self.parsed.index
+
+    @property
+    def functions(self) -> List[FunctionSpan]:
+        """All `func` declarations with their body spans."""
+        return self.index.functions
+
+    def function(self, name: str) -> Optional[FunctionSpan]:
+        """First function with the given name, or None."""
+        return self.index.function(name)
+
+
+class ProjectModel:
+    """All project files of interest, walked and decoded once."""
+    def __init__(self, root: Path):
+        self.root = Path(root).resolve()
+        self._files: Dict[Path, SourceFile] = {}   # rel_path -> SourceFile
+        self._all_paths: List[Path] = []           # Every rel_path seen in the walk
+        self._reverse_deps: Optional[Tuple[Dict[Path, Set[Path]], Dict[Path, Set[Path]],
+                                           Dict[str, Set[Path]]]] = None
+        self._walk()
+
+    def _walk(self) -> None:
+        for dirpath, dirnames, filenames in os.walk(self.root):
+            dirnames[:] = sorted(d for d in dirnames if d not in SKIP_DIRS)
+            base = Path(dirpath)
+            for filename in sorted(filenames):
+                rel_path = (base / filename).relative_to(self.root)
+                self._all_paths.append(rel_path)
+                if rel_path.suffix in EAGER_SUFFIXES:
+                    self._load(rel_path)
+        # Same order as sorted(rglob(...)), which the validators relied on
+        self._all_paths.sort()
+
+    def _load(self, rel_path: Path) -> Optional[SourceFile]:
+        path = self.root / rel_path
+        try:
+            content = path.read_text(encoding='utf-8')
+        except (OSError, UnicodeDecodeError):
+            return None
+        source = SourceFile(path, rel_path, content)
+        self._files[rel_path] = source
+        return source
+
+    def _rel(self, path: Path) -> Path:
+        path = Path(path)
+        if path.is_absolute():
+            return path.resolve().relative_to(self.root)
+        return path
+
+    def get(self, path: Path) -> Optional[SourceFile]:
+        """Look up a file by absolute or project-relative path (loads lazily)."""
+        try:
+            rel_path = self._rel(path)
+        except ValueError:
+            return None  # Outside the project
+        if rel_path in self._files:
+            return self._files[rel_path]
+        if not (self.root / rel_path).is_file():
+            return None
+        return self._load(rel_path)
+
+    def get_res(self, res_path: str) -> Optional[SourceFile]:
+        """Look up a file by its res:// path."""
+        return self.get(Path(res_path.replace("res://", "", 1)))
+
+    def files(self, suffix: str, include_addons: bool = False) -> List[SourceFile]:
+        """All readable files with the given suffix, in path order."""
+        result = []
+        for rel_path in self._all_paths:
+            if rel_path.suffix != suffix:
+                continue
+            if not include_addons and "addons" in rel_path.parts:
+                continue
+            source = self.get(rel_path)
+            if source is not None:
+                result.append(source)
+        return result
+
+    def gd_files(self, include_addons: bool = False) -> List[SourceFile]:
+        """All GDScript files (addons/ excluded by default)."""
+        return self.files(".gd", include_addons)
+
+    def scene_files(self, include_addons: bool = False) -> List[SourceFile]:
+        """All .tscn scene files (addons/ excluded by default)."""
+        return self.files(".tscn", include_addons)
+
+    def glob(self, pattern: str) -> List[SourceFile]:
+        """
+        Files whose project-relative path matches a glob pattern.
+
+        `*` does not cross directories; `**/` matches any number of them:
+            model.glob("scripts/services/*_service.gd")
+            model.glob("scripts/ui/**/*.gd")
+        """
+        regex = _compile_glob(pattern)
+        result = []
+        for rel_path in self._all_paths:
+            if regex.match(rel_path.as_posix()):
+                source = self.get(rel_path)
+                if source is not None:
+                    result.append(source)
+        return result
+
+    def class_names(self) -> Dict[str, Path]:
+        """Global `class_name` declarations (addons included) -> declaring script."""
+        classes: Dict[str, Path] = {}
+        for source in self.gd_files(include_addons=True):
+            match = CLASS_NAME_PATTERN.search(source.content)
+            if match:
+                classes[match.group(1)] = source.rel_path
+        return classes
+
+    def dependents(self, rel_paths: Iterable[Path], class_names: Iterable[str] = ()) -> Set[Path]:
+        """
+        Files that depend on any of `rel_paths`: subclasses (followed through
+        the whole `extends` chain) plus scripts and scenes that reference one
+        of those files by res:// path. Reference edges are followed one level
+        only - scenes link to each other through change_scene_to_file(), so
+        following them transitively would pull in most of the project.
+        The inputs themselves are not included.
+
+        `rel_paths` may name deleted files: their referencing files are still
+        found, and `class_names` (the classes the deleted scripts declared)
+        finds the scripts that still extend them.
+        """
+        if self._reverse_deps is None:
+            self._reverse_deps = self._index_reverse_deps()
+        extends_reverse, ref_reverse, extends_by_name = self._reverse_deps
+
+        start = {Path(p) for p in rel_paths}
+        classes = set(start)
+        pending = list(start)
+        for name in class_names:
+            for subclass in extends_by_name.get(name, ()):
+                if subclass not in classes:
+                    classes.add(subclass)
+                    pending.append(subclass)
+        while pending:
+            for subclass in extends_reverse.get(pending.pop(), ()):
+                if subclass not in classes:
+                    classes.add(subclass)
+                    pending.append(subclass)
+
+        found = set(classes)
+        for rel_path in classes:
+            found.update(ref_reverse.get(rel_path, ()))
+        return found - start
+
+    def _index_reverse_deps(self) -> Tuple[Dict[Path, Set[Path]], Dict[Path, Set[Path]], Dict[str, Set[Path]]]:
+        """
+        Map each file to its subclasses and to the files referencing it, and
+        each `extends` class name to the scripts using it.
+        """
+        for rel_path in self._all_paths:
+            if rel_path.suffix in INDEXED_SUFFIXES and rel_path not in self._files \
+                    and rel_path.parts[0] != ".godot":
+                self._load(rel_path)
+
+        class_paths: Dict[str, Path] = {}
+        for rel_path, source in self._files.items():
+            if rel_path.suffix == ".gd":
+                match = CLASS_NAME_PATTERN.search(source.content)
+                if match:
+                    class_paths[match.group(1)] = rel_path
+
+        extends_reverse: Dict[Path, Set[Path]] = {}
+        ref_reverse: Dict[Path, Set[Path]] = {}
+        extends_by_name: Dict[str, Set[Path]] = {}
+        for rel_path, source in self._files.items():
+            for base in EXTENDS_PATTERN.findall(source.content):
+                extends_by_name.setdefault(base, set()).add(rel_path)
+                if base in class_paths and class_paths[base] != rel_path:
+                    extends_reverse.setdefault(class_paths[base], set()).add(rel_path)
+            for ref in RES_REF_PATTERN.findall(source.content):
+                target = Path(ref)
+                if target != rel_path:
+                    ref_reverse.setdefault(target, set()).add(rel_path)
+        return extends_reverse, ref_reverse, extends_by_name
+
+
+def _compile_glob(pattern: str) -> "re.Pattern":
+    """Translate a path glob (`*`, `?`, `**/`) into an anchored regex."""
+    regex = []
+    i = 0
+    while i < len(pattern):
+        if pattern.startswith("**/", i):
+            regex.append("(?:.*/)?")
+            i += 3
+        elif pattern[i] == "*":
+            regex.append("[^/]*")
+            i += 1
+        elif pattern[i] == "?":
+            regex.append("[^/]")
+            i += 1
+        else:
+            regex.append(re.escape(pattern[i]))
+            i += 1
+    return re.compile("".join(regex) + r"\Z")
+
+
+_MODELS: Dict[Path, ProjectModel] = {}
+
+
+def load_project_model(root: Path) -> ProjectModel:
+    """Build the project model for `root`, or return the one already built."""
+    key = Path(root).resolve()
+    if key not in _MODELS:
+        _MODELS[key] = ProjectModel(key)
+    return _MODELS[key]
+
+
+def set_project_model(model: ProjectModel) -> None:
+    """Install a prebuilt model (used to seed process pool workers)."""
+    _MODELS[model.root] = model
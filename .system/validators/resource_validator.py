@@ -4,37 +4,183 @@ Resource Validator
 
 Validates that .tres resources match JSON source data.
 This would have caught missing resources or mismatches.
+
+The JSON files are first checked against their schemas
+(scripts/tools/resource_schema.py, shared with the .tres generators): every
+type, range, enum and duplicate-id error is reported with its JSON path.
+
+Each weapon/enemy/item .tres is then compared field by field with what the
+generator would write for its JSON record (scripts/tools/generate_resources.py
+renders it, scene_parser.py reads both [resource] blocks), so a stale
+`base_damage` or `spawn_weight` is reported with both values. Values are
+compared decoded (15 == 15.0, Color(1, 0, 0, 1) == Color(1.0000, ...)), and a
+property Godot dropped on re-save because it equals the script default is
+compared against that default. Results are cached by .tres content hash plus
+the expected content (validator_cache.py); uncached files are diffed in a
+process pool once there are enough of them.
 """
 
-import json
+import hashlib
+import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from project_model import ProjectModel, SourceFile
+from scene_parser import parse_resource, parse_value, resource_id
+from validator_cache import ResultCache
+
+TOOLS_DIR = Path(__file__).resolve().parent.parent.parent / "scripts" / "tools"
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
+
+from generate_resources import RESOURCE_TYPES  # noqa: E402
+from resource_schema import SCHEMAS  # noqa: E402
+
+# Below this many uncached .tres files a process pool costs more than it saves
+PARALLEL_MIN_FILES = 64
+
+# The generators write colours with 4 decimals
+FLOAT_TOLERANCE = 1e-4
+
+# `@export var damage: int = 10`, `@export_enum("a", "b") var rarity: String = "a"`
+EXPORT_DEFAULT_PATTERN = re.compile(
+    r'^@export\w*(?:\([^)]*\))?\s+var\s+(\w+)\s*(?::\s*[\w\[\], ]*)?=\s*(.+?)\s*(?:#.*)?$', re.M)
+
+# Editor-managed properties the generators never write
+IGNORED_PROPERTY_PREFIXES = ("resource_", "metadata/")
+
+
+def _decode(raw: str, ext_paths: Dict[str, str]) -> Any:
+    """Property text -> comparable value; ExtResource ids resolve to their res:// path."""
+    try:
+        value = parse_value(raw)
+    except ValueError:
+        return raw
+    if isinstance(value, tuple) and value[:1] == ("ExtResource",):
+        ref = resource_id(raw)
+        return ("ExtResource", ext_paths.get(ref, ref))
+    return value
+
+
+def values_equal(a: Any, b: Any) -> bool:
+    """Decoded .tres values equal, allowing int/float and rounding differences."""
+    if isinstance(a, bool) or isinstance(b, bool):
+        return a is b
+    if isinstance(a, (int, float)) and isinstance(b, (int, float)):
+        return abs(a - b) <= FLOAT_TOLERANCE
+    if isinstance(a, (list, tuple)) and isinstance(b, (list, tuple)):
+        return type(a) is type(b) and len(a) == len(b) and all(values_equal(x, y) for x, y in zip(a, b))
+    if isinstance(a, dict) and isinstance(b, dict):
+        return a.keys() == b.keys() and all(values_equal(a[k], b[k]) for k in a)
+    return a == b
+
+
+def diff_resource(actual_text: str, expected_text: str, defaults: Dict[str, str]) -> List[str]:
+    """
+    Field-by-field drift between a .tres file and the generator's output for
+    its record, e.g. ["damage = 12, expected 15"]. `defaults` holds the raw
+    default of each exported script property.
+    """
+    actual = parse_resource(actual_text)
+    expected = parse_resource(expected_text)
+    actual_paths = {ext.id: ext.path for ext in actual.ext_resources.values()}
+    expected_paths = {ext.id: ext.path for ext in expected.ext_resources.values()}
+
+    drift = []
+    for key, want in expected.properties.items():
+        have = actual.properties.get(key)
+        note = ""
+        if have is None:
+            # Godot omits properties equal to the script default when it re-saves
+            have = defaults.get(key)
+            note = " (script default)"
+            if have is None:
+                drift.append(f"{key} missing, expected {want}")
+                continue
+        if not values_equal(_decode(have, actual_paths), _decode(want, expected_paths)):
+            drift.append(f"{key} = {have}{note}, expected {want}")
+    for key, have in actual.properties.items():
+        if key not in expected.properties and not key.startswith(IGNORED_PROPERTY_PREFIXES):
+            drift.append(f"{key} = {have} is not written by the generator")
+    return drift
+
+
+def _diff_job(job: Tuple[str, str, Dict[str, str]]) -> List[str]:
+    return diff_resource(*job)
+
+
+def diff_resources(jobs: List[Tuple[str, str, Dict[str, str]]]) -> List[List[str]]:
+    """diff_resource() for each (actual, expected, defaults), in a process pool when it pays off."""
+    if len(jobs) >= PARALLEL_MIN_FILES:
+        try:
+            with ProcessPoolExecutor() as pool:
+                return list(pool.map(_diff_job, jobs, chunksize=max(1, len(jobs) // 32)))
+        except (OSError, BrokenProcessPool):
+            pass  # No pool available (e.g. sandboxed); diff serially
+    return [_diff_job(job) for job in jobs]
+
+
+def script_defaults(script_text: str) -> Dict[str, str]:
+    """Raw default value of every `@export var` in a resource script."""
+    return {name: value for name, value in EXPORT_DEFAULT_PATTERN.findall(script_text)}
+
+
+class ContentCheck:
+    """One .tres file queued for a field-by-field comparison."""
+    def __init__(self, source: SourceFile, label: str, record_path: str,
+                 expected: str, defaults: Dict[str, str], deps: str):
+        self.source = source
+        self.label = label              # "weapon", "enemy", "item"
+        self.record_path = record_path  # "weapons.json[3]"
+        self.expected = expected        # Generator output for the record
+        self.defaults = defaults
+        self.deps = deps                # Cache key part: expected content + script
 
 
 class ResourceValidator:
-    def __init__(self, project_root: Path):
+    def __init__(self, project_root: Path, model: Optional[ProjectModel] = None):
         self.project_root = project_root
+        self.model = model
         self.errors = []
         self.warnings = []
+        self.records = {}  # Schema name -> parsed JSON (only when it passed its schema)
+        self.content_checks: List[ContentCheck] = []
+        self.compared = 0
+        self._scripts: Dict[str, Tuple[str, Dict[str, str]]] = {}  # res:// -> (digest, defaults)
 
     def validate(self) -> bool:
         """Run all validations."""
+        self.check_data_schemas()
         self.check_weapons()
         self.check_enemies()
         self.check_items()
+        self.check_contents()
 
         return len(self.errors) == 0
 
+    def check_data_schemas(self):
+        """Validate resources/data/*.json against their schemas in one pass each."""
+        data_dir = self.project_root / "resources" / "data"
+        for name, schema in SCHEMAS.items():
+            json_file = data_dir / schema.file_name
+            if not json_file.exists():
+                continue  # Not created yet
+            data, errors = schema.load(json_file)
+            for error in errors:
+                self.errors.append(f"Schema: {error}")
+            if not errors:
+                self.records[name] = data
+
     def check_weapons(self):
         """Verify weapon .tres files match weapons.json."""
-        json_file = self.project_root / "resources" / "data" / "weapons.json"
         tres_dir = self.project_root / "resources" / "weapons"
 
-        if not json_file.exists():
-            return  # Not created yet
-
-        with open(json_file) as f:
-            weapons = json.load(f)
+        weapons = self.records.get("weapons")
+        if weapons is None:
+            return  # Not created yet, or schema errors already reported
 
         expected_count = len(weapons)
         expected_ids = {w['id'] for w in weapons}
@@ -60,17 +206,16 @@ class ResourceValidator:
             if not tres_file.exists():
                 self.errors.append(f"Missing weapon resource: {weapon_id}.tres")
 
+        self.queue_content_checks("weapons", weapons, tres_dir)
+
     def check_enemies(self):
         """Verify enemy .tres files match enemies.json."""
-        json_file = self.project_root / "resources" / "data" / "enemies.json"
         tres_dir = self.project_root / "resources" / "enemies"
 
-        if not json_file.exists():
+        enemies = self.records.get("enemies")
+        if enemies is None:
             return
 
-        with open(json_file) as f:
-            enemies = json.load(f)
-
         expected_count = len(enemies)
         expected_ids = {e['id'] for e in enemies}
 
@@ -94,17 +239,16 @@ class ResourceValidator:
             if not tres_file.exists():
                 self.errors.append(f"Missing enemy resource: {enemy_id}.tres")
 
+        self.queue_content_checks("enemies", enemies, tres_dir)
+
     def check_items(self):
         """Verify item .tres files match items.json."""
-        json_file = self.project_root / "resources" / "data" / "items.json"
         tres_dir = self.project_root / "resources" / "items"
 
-        if not json_file.exists():
+        items = self.records.get("items")
+        if items is None:
             return
 
-        with open(json_file) as f:
-            items = json.load(f)
-
         expected_count = len(items)
         expected_ids = {i['id'] for i in items}
 
@@ -128,6 +272,72 @@ class ResourceValidator:
             if not tres_file.exists():
                 self.errors.append(f"Missing item resource: {item_id}.tres")
 
+        self.queue_content_checks("items", items, tres_dir)
+
+    def _source(self, path: Path) -> Optional[SourceFile]:
+        if self.model is not None:
+            return self.model.get(path)
+        try:
+            content = path.read_text(encoding='utf-8')
+        except (OSError, UnicodeDecodeError):
+            return None
+        return SourceFile(path, path.relative_to(self.project_root), content)
+
+    def _script(self, res_path: Optional[str]) -> Tuple[str, Dict[str, str]]:
+        """(digest, exported defaults) of a resource script, read once per run."""
+        if not res_path:
+            return "", {}
+        if res_path not in self._scripts:
+            source = self._source(self.project_root / res_path.replace("res://", "", 1))
+            if source is None:
+                self._scripts[res_path] = ("", {})
+            else:
+                self._scripts[res_path] = (source.digest, script_defaults(source.content))
+        return self._scripts[res_path]
+
+    def queue_content_checks(self, name: str, records: List[dict], tres_dir: Path):
+        """Queue every existing .tres of a resource type for a field-by-field diff."""
+        resource_type = RESOURCE_TYPES[name]
+        label = resource_type.resource_class.replace("Resource", "").lower()
+        for index, record in enumerate(records):
+            source = self._source(tres_dir / f"{record['id']}.tres")
+            if source is None:
+                continue  # Reported as missing
+            expected = resource_type.render(record)
+            script_digest, defaults = self._script(parse_resource(expected).script)
+            deps = hashlib.sha256(f"{expected}\0{script_digest}".encode('utf-8')).hexdigest()
+            self.content_checks.append(ContentCheck(
+                source, label, f"{SCHEMAS[name].file_name}[{index}]", expected, defaults, deps))
+
+    def check_contents(self):
+        """Compare the queued .tres files with their JSON records."""
+        cache = ResultCache("resource_validator", Path(__file__))
+        results: Dict[int, List[str]] = {}
+        pending = []
+        for position, check in enumerate(self.content_checks):
+            drift = cache.lookup(check.source, deps=check.deps)
+            if drift is None:
+                pending.append(position)
+            else:
+                results[position] = drift
+
+        diffs = diff_resources([(self.content_checks[p].source.content, self.content_checks[p].expected,
+                                 self.content_checks[p].defaults) for p in pending])
+        for position, drift in zip(pending, diffs):
+            check = self.content_checks[position]
+            cache.store(check.source, drift, deps=check.deps)
+            results[position] = drift
+        cache.save()
+
+        self.compared = len(self.content_checks)
+        for position, check in enumerate(self.content_checks):
+            for field in results[position]:
+                self.errors.append(
+                    f"Stale {check.label} resource {check.source.name} ({check.record_path}): {field}"
+                )
+        if any(results.values()):
+            self.warnings.append("Regenerate with: python3 scripts/tools/generate_resources.py")
+
     def report(self):
         """Print validation report."""
         if self.errors:
@@ -141,13 +351,13 @@ class ResourceValidator:
                 print(f"  {warning}")
 
         if not self.errors and not self.warnings:
-            print("✅ Resources valid")
+            print(f"✅ Resources valid ({self.compared} .tres files match their JSON records)")
 
 
-def main():
-    project_root = Path(__file__).parent.parent.parent
+def main(model: Optional[ProjectModel] = None):
+    project_root = Path(__file__).resolve().parent.parent.parent
 
-    validator = ResourceValidator(project_root)
+    validator = ResourceValidator(project_root, model)
     success = validator.validate()
     validator.report()
 
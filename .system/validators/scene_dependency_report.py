@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+"""
+Scene Dependency Report
+
+Builds the cross-scene dependency graph - scene -> instanced sub-scene ->
+script -> preloaded resource - and estimates how heavy each top-level scene
+is to load: total node count (instanced sub-scenes expanded), scripts,
+texture/audio bytes and dependency depth. Scenes over the thresholds are
+flagged as load-time hotspots, to target startup and scene-change latency
+on iOS.
+
+Edges (scene parsing via scene_parser.py):
+- Scene:    [node instance=ExtResource(...)] (nodes counted), any other
+            ext_resource (Script, Texture2D, Theme, PackedScene, ...)
+- Script:   preload("res://...") of scenes, scripts and resources
+- .tres:    its own ext_resources (themes -> fonts/textures)
+- Startup:  autoload scripts from project.godot (reported as one row)
+
+Sizes are those of the source files on disk (a proxy for the imported
+resources); depth counts nested scenes, instanced or preloaded.
+
+Top-level scenes: the main scene, every change_scene_to_file() target and
+any scene nothing else references (scenes/tests/ excluded).
+
+Usage:
+    python3 .system/validators/scene_dependency_report.py
+    python3 .system/validators/scene_dependency_report.py scenes/game/wasteland.tscn   # Just these scenes
+    python3 .system/validators/scene_dependency_report.py --all   # Every scene, not just top-level
+
+Informational only - not part of the pre-commit hook.
+"""
+
+import argparse
+import re
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+from project_model import ProjectModel, SourceFile, load_project_model
+from gdscript_parser import NAME, STRING
+from scene_parser import SceneFile, parse_scene_cached
+
+# ANSI colors
+RED = '\033[0;31m'
+GREEN = '\033[0;32m'
+YELLOW = '\033[1;33m'
+CYAN = '\033[0;36m'
+NC = '\033[0m'
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+
+TEXTURE_SUFFIXES = {".png", ".jpg", ".jpeg", ".webp", ".svg", ".ktx", ".exr"}
+AUDIO_SUFFIXES = {".ogg", ".wav", ".mp3"}
+
+# Rough load-time model for a mid-range iPhone (ms). Used to rank scenes.
+LOAD_MS_PER_NODE = 0.02
+LOAD_MS_PER_SCRIPT = 0.5
+LOAD_MS_PER_MB = 12.0
+
+# Hotspot thresholds (scene changes should fit in a few frames on device)
+MAX_NODES = 200
+MAX_SCRIPTS = 12
+MAX_LOAD_MS = 10.0
+MAX_DEPTH = 4
+
+MAIN_SCENE_PATTERN = re.compile(r'^run/main_scene\s*=\s*"([^"]+)"', re.MULTILINE)
+AUTOLOAD_PATTERN = re.compile(r'^(\w+)\s*=\s*"\*?res://([^"]+)"', re.MULTILINE)
+CHANGE_SCENE_PATTERN = re.compile(r'change_scene_to_file\(\s*"res://([^"]+)"')
+
+
+class Closure:
+    """Everything loading one file pulls in."""
+    def __init__(self, is_scene: bool = False):
+        self.is_scene = is_scene
+        self.nodes = 0
+        self.scene_depth = 0                   # Deepest chain of scenes below this file
+        self.scenes: Set[Path] = set()
+        self.scripts: Set[Path] = set()
+        self.resources: Dict[Path, int] = {}   # path -> bytes on disk
+        self.missing: Set[Path] = set()        # Referenced but not on disk
+
+    @property
+    def depth(self) -> int:
+        """Scene nesting depth: 1 for a scene with no sub-scenes."""
+        return self.scene_depth + (1 if self.is_scene else 0)
+
+    def include(self, other: "Closure", count_nodes: bool = False) -> None:
+        if count_nodes:
+            self.nodes += other.nodes
+        self.scene_depth = max(self.scene_depth, other.depth)
+        self.scenes |= other.scenes
+        self.scripts |= other.scripts
+        self.resources.update(other.resources)
+        self.missing |= other.missing
+
+    def bytes_of(self, suffixes: Set[str]) -> int:
+        return sum(size for path, size in self.resources.items() if path.suffix.lower() in suffixes)
+
+    @property
+    def texture_bytes(self) -> int:
+        return self.bytes_of(TEXTURE_SUFFIXES)
+
+    @property
+    def audio_bytes(self) -> int:
+        return self.bytes_of(AUDIO_SUFFIXES)
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(self.resources.values())
+
+    @property
+    def load_ms(self) -> float:
+        return (self.nodes * LOAD_MS_PER_NODE
+                + len(self.scripts) * LOAD_MS_PER_SCRIPT
+                + self.total_bytes / (1024 * 1024) * LOAD_MS_PER_MB)
+
+
+def script_preloads(source: SourceFile) -> List[Path]:
+    """Paths passed to preload("res://...") in a script (comments ignored)."""
+    tokens = source.parsed.tokens
+    found = []
+    for index, token in enumerate(tokens[:-2]):
+        if token.kind == NAME and token.value == "preload" and tokens[index + 1].value == "(":
+            target = tokens[index + 2]
+            if target.kind == STRING and target.value.strip("\"'").startswith("res://"):
+                found.append(Path(target.value.strip("\"'")[len("res://"):]))
+    return found
+
+
+class SceneDependencyGraph:
+    """Load closures of scenes, scripts and resources, computed on demand."""
+    def __init__(self, model: ProjectModel):
+        self.model = model
+        self._closures: Dict[Path, Closure] = {}
+        self._active: Set[Path] = set()
+        # Incoming references, for finding top-level scenes
+        self.referenced: Set[Path] = set()
+
+    def _file_size(self, rel_path: Path) -> int:
+        try:
+            return (self.model.root / rel_path).stat().st_size
+        except OSError:
+            return 0
+
+    def _parsed_resource(self, source: SourceFile) -> SceneFile:
+        return source.scene if source.suffix == ".tscn" else parse_scene_cached(source.content, source.digest)
+
+    def closure(self, rel_path: Path) -> Closure:
+        if rel_path in self._closures:
+            return self._closures[rel_path]
+        suffix = rel_path.suffix
+        result = Closure(is_scene=suffix == ".tscn")
+        if rel_path in self._active:
+            return result  # Preload cycle - already being counted
+        if not (self.model.root / rel_path).is_file():
+            result.missing.add(rel_path)
+            return result
+        self._active.add(rel_path)
+
+        source = self.model.get(rel_path) if suffix in (".tscn", ".tres", ".gd") else None
+        if suffix == ".tscn" and source is not None:
+            self._add_scene(rel_path, source, result)
+        elif suffix == ".gd" and source is not None:
+            result.scripts.add(rel_path)
+            for target in script_preloads(source):
+                self._add_dependency(result, target)
+        elif suffix == ".tres" and source is not None:
+            result.resources[rel_path] = self._file_size(rel_path)
+            for resource in self._parsed_resource(source).ext_resources.values():
+                self._add_dependency(result, Path(resource.path.replace("res://", "", 1)))
+        else:
+            result.resources[rel_path] = self._file_size(rel_path)
+
+        self._active.discard(rel_path)
+        self._closures[rel_path] = result
+        return result
+
+    def _add_dependency(self, result: Closure, target: Path, count_nodes: bool = False) -> None:
+        self.referenced.add(target)
+        result.include(self.closure(target), count_nodes)
+
+    def _add_scene(self, rel_path: Path, source: SourceFile, result: Closure) -> None:
+        parsed = source.scene
+        result.scenes.add(rel_path)
+        result.nodes = len(parsed.nodes)
+
+        instanced: Set[str] = set()
+        for node in parsed.nodes:
+            if node.instance:
+                instanced.add(node.instance)
+                target = parsed.instanced_scene(node)
+                if target:
+                    # The instance node stands in for the sub-scene's root
+                    result.nodes -= 1
+                    self._add_dependency(result, Path(target.replace("res://", "", 1)), count_nodes=True)
+
+        for resource in parsed.ext_resources.values():
+            if resource.id not in instanced and resource.path.startswith("res://"):
+                self._add_dependency(result, Path(resource.path[len("res://"):]))
+
+
+def autoload_scripts(model: ProjectModel) -> List[Path]:
+    """Autoload singletons, loaded at startup before the main scene."""
+    project = model.get(Path("project.godot"))
+    if project is None:
+        return []
+    return [Path(path) for _name, path in AUTOLOAD_PATTERN.findall(project.content)]
+
+
+def entry_scenes(model: ProjectModel) -> Set[Path]:
+    """Main scene and every change_scene_to_file() target."""
+    entries: Set[Path] = set()
+    project = model.get(Path("project.godot"))
+    main = MAIN_SCENE_PATTERN.search(project.content) if project is not None else None
+    if main:
+        main_ref = main.group(1)
+        if main_ref.startswith("uid://"):
+            for scene in model.scene_files():
+                header = scene.scene.header
+                if header is not None and header.attrs.get("uid") == main_ref:
+                    entries.add(scene.rel_path)
+        else:
+            entries.add(Path(main_ref.replace("res://", "", 1)))
+    for script in model.gd_files():
+        entries.update(Path(target) for target in CHANGE_SCENE_PATTERN.findall(script.content))
+    return entries
+
+
+def _megabytes(size: int) -> str:
+    return f"{size / (1024 * 1024):.2f} MB"
+
+
+def hotspot_reasons(closure: Closure) -> List[str]:
+    reasons = []
+    if closure.nodes > MAX_NODES:
+        reasons.append(f"{closure.nodes} nodes (> {MAX_NODES})")
+    if len(closure.scripts) > MAX_SCRIPTS:
+        reasons.append(f"{len(closure.scripts)} scripts (> {MAX_SCRIPTS})")
+    if closure.load_ms > MAX_LOAD_MS:
+        reasons.append(f"~{closure.load_ms:.0f} ms estimated load (> {MAX_LOAD_MS:.0f} ms)")
+    if closure.depth > MAX_DEPTH:
+        reasons.append(f"dependency depth {closure.depth} (> {MAX_DEPTH})")
+    return reasons
+
+
+def startup_closure(graph: SceneDependencyGraph) -> Closure:
+    """Combined closure of every autoload."""
+    startup = Closure()
+    for script in autoload_scripts(graph.model):
+        startup.include(graph.closure(script))
+    return startup
+
+
+def print_report(graph: SceneDependencyGraph, scenes: List[Path], entries: Set[Path], top: int) -> int:
+    closures = sorted(((scene, graph.closure(scene)) for scene in scenes),
+                      key=lambda item: item[1].load_ms, reverse=True)
+    startup = startup_closure(graph)
+
+    print(f"\n{CYAN}📦 Scene load cost ({len(closures)} scene(s), heaviest first){NC}\n")
+    print(f"  {'Scene':<48} {'Nodes':>6} {'Scripts':>7} {'Scenes':>6} "
+          f"{'Textures':>10} {'Audio':>10} {'Depth':>5} {'~Load':>8}")
+    for scene, closure in closures:
+        marker = "*" if scene in entries else " "
+        color = RED if hotspot_reasons(closure) else NC
+        print(f"{marker} {color}{scene.as_posix():<48} {closure.nodes:>6} {len(closure.scripts):>7} "
+              f"{len(closure.scenes) - 1:>6} {_megabytes(closure.texture_bytes):>10} "
+              f"{_megabytes(closure.audio_bytes):>10} {closure.depth:>5} {closure.load_ms:>6.1f}ms{NC}")
+    print(f"  {'[autoload] (startup, all scenes)':<48} {startup.nodes:>6} {len(startup.scripts):>7} "
+          f"{len(startup.scenes):>6} {_megabytes(startup.texture_bytes):>10} "
+          f"{_megabytes(startup.audio_bytes):>10} {startup.depth:>5} {startup.load_ms:>6.1f}ms")
+    print(f"\n  * = main scene or change_scene_to_file() target")
+
+    missing = set(startup.missing).union(*(closure.missing for _scene, closure in closures))
+    if missing:
+        print(f"  {YELLOW}{len(missing)} referenced file(s) not on disk (e.g. {sorted(missing)[0].as_posix()}) "
+              f"- their size is not counted{NC}")
+
+    hotspots = [(scene, closure) for scene, closure in closures if hotspot_reasons(closure)]
+    for scene, closure in hotspots:
+        print(f"\n{YELLOW}⚠️  Load-time hotspot: {scene.as_posix()}{NC}")
+        for reason in hotspot_reasons(closure):
+            print(f"  - {reason}")
+        heaviest = sorted(((path, size) for path, size in closure.resources.items() if size >= 1024),
+                          key=lambda item: item[1], reverse=True)[:top]
+        if heaviest:
+            print(f"  {CYAN}Largest resources:{NC}")
+            for path, size in heaviest:
+                print(f"    {path.as_posix()} ({_megabytes(size)})")
+        sub_scenes = sorted((s for s in closure.scenes if s != scene),
+                            key=lambda s: graph.closure(s).load_ms, reverse=True)[:top]
+        if sub_scenes:
+            print(f"  {CYAN}Heaviest dependencies:{NC}")
+            for sub in sub_scenes:
+                sub_closure = graph.closure(sub)
+                print(f"    {sub.as_posix()} ({sub_closure.nodes} nodes, ~{sub_closure.load_ms:.1f} ms)")
+
+    if hotspots:
+        print(f"\n{CYAN}💡 Defer heavy resources with ResourceLoader.load_threaded_request() "
+              f"or load() on first use instead of preload(){NC}")
+    else:
+        print(f"\n{GREEN}✅ No load-time hotspots{NC}")
+    print(f"{CYAN}📚 Static estimate (nodes ×{LOAD_MS_PER_NODE} ms, scripts ×{LOAD_MS_PER_SCRIPT} ms, "
+          f"{LOAD_MS_PER_MB} ms/MB) - confirm with on-device timing{NC}")
+    return len(hotspots)
+
+
+def main(model: Optional[ProjectModel] = None, argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Report scene dependency graphs and load cost")
+    parser.add_argument('scenes', nargs='*', type=Path, help='Scenes to report (default: top-level scenes)')
+    parser.add_argument('--all', action='store_true', help='Report every scene, not just top-level ones')
+    parser.add_argument('--top', type=int, default=5, help='Contributors listed per hotspot')
+    args = parser.parse_args(argv)
+
+    model = model or load_project_model(PROJECT_ROOT)
+    graph = SceneDependencyGraph(model)
+    all_scenes = [scene.rel_path for scene in model.scene_files() if "tests" not in scene.rel_path.parts]
+    for scene in all_scenes:
+        graph.closure(scene)  # Also records which scenes are referenced
+    entries = entry_scenes(model)
+
+    if args.scenes:
+        scenes = [Path(s).resolve().relative_to(model.root) if Path(s).is_absolute() else Path(s)
+                  for s in args.scenes]
+    elif args.all:
+        scenes = all_scenes
+    else:
+        scenes = [s for s in all_scenes if s in entries or s not in graph.referenced]
+
+    print_report(graph, scenes, entries, args.top)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
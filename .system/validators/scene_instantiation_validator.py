@@ -14,15 +14,40 @@ Uses Godot in headless mode to verify:
 - Scene loads without errors
 
 Runs during pre-commit to catch instantiation failures before they're committed.
+
+Jobs go to the headless Godot worker when one is running (godot_worker.py),
+otherwise a fresh `godot --headless --script` process runs them.
+
+Benchmark mode times load() and instantiate() for every scene with
+Time.get_ticks_usec(), N times with a cold resource cache
+(CACHE_MODE_IGNORE_DEEP) and N times warm, and writes the medians as JSON.
+Once a baseline has been recorded on this machine (--update-baseline), every
+run benchmarks - the pre-commit hook included - and a load-time regression
+fails it just like an instantiation failure. The orchestrator runs this
+validator on its own after the other validators have finished, so the
+timings are not taken under contention.
+
+Usage:
+    python3 scene_instantiation_validator.py                      # Pass/fail (+ timings if baselined)
+    python3 scene_instantiation_validator.py --benchmark          # Timings vs baseline
+    python3 scene_instantiation_validator.py --no-benchmark       # Pass/fail only
+    python3 scene_instantiation_validator.py --benchmark --repeat 10
+    python3 scene_instantiation_validator.py --update-baseline    # Record current timings
 """
 
+import argparse
+import json
 import os
 import re
+import statistics
 import sys
 import subprocess
 import tempfile
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, List, Optional, Tuple
+
+from godot_binary import find_godot_binary
+from godot_worker import GodotWorker, WorkerError, connect_worker
 
 # ANSI colors
 RED = '\033[0;31m'
@@ -33,28 +58,21 @@ NC = '\033[0m'
 
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 
+# Benchmark baseline and latest results. Timings are machine-specific, so
+# both live in the git-ignored cache and are never committed.
+BASELINE_PATH = PROJECT_ROOT / ".system" / "cache" / "scene_benchmark_baseline.json"
+RESULTS_PATH = PROJECT_ROOT / ".system" / "cache" / "scene_benchmark.json"
 
-def find_godot_binary() -> str:
-    """Find Godot binary (same logic as godot_test_runner.py)"""
-    # Check environment variable first
-    godot_path = os.environ.get('GODOT_BIN')
-    if godot_path and os.path.exists(godot_path):
-        return godot_path
-
-    # Common macOS locations
-    common_paths = [
-        '/Applications/Godot.app/Contents/MacOS/Godot',
-        '/Applications/Godot_mono.app/Contents/MacOS/Godot',
-        os.path.expanduser('~/Applications/Godot.app/Contents/MacOS/Godot'),
-    ]
+BENCHMARK_REPEAT = 5
+# A scene regresses when a median is both this much slower (fraction)...
+REGRESSION_TOLERANCE = 0.5
+# ...and at least this many microseconds slower (filters timer noise)
+REGRESSION_MIN_DELTA_US = 2000
 
-    for path in common_paths:
-        if os.path.exists(path):
-            return path
+# Median timings recorded per scene
+BENCHMARK_METRICS = ["cold_load_us", "cold_instantiate_us", "warm_load_us", "warm_instantiate_us"]
 
-    raise FileNotFoundError(
-        "Godot binary not found. Set GODOT_BIN environment variable or install Godot to /Applications/"
-    )
+BENCHMARK_JSON_PREFIX = "[SceneBenchmark] JSON: "
 
 
 def discover_scene_files() -> List[Path]:
@@ -71,6 +89,10 @@ def discover_scene_files() -> List[Path]:
     return sorted(scene_files)
 
 
+def _res_path(scene_path: Path) -> str:
+    return f"res://{scene_path.relative_to(PROJECT_ROOT)}".replace("\\", "/")
+
+
 def create_instantiation_test_script(scene_paths: List[Path]) -> str:
     """
     Create a GDScript that tests instantiation of all scenes.
@@ -120,21 +142,81 @@ def create_instantiation_test_script(scene_paths: List[Path]) -> str:
     return "\n".join(script_lines)
 
 
-def test_scene_instantiation(godot_bin: str, scene_files: List[Path]) -> Tuple[bool, List[str]]:
+def create_benchmark_script(scene_paths: List[Path], repeat: int) -> str:
     """
-    Test that all scenes can be instantiated.
+    Create a GDScript that times load() and instantiate() of every scene.
 
-    Returns: (all_passed, failed_scenes)
+    Each scene is loaded `repeat` times bypassing the resource cache (cold:
+    the scene and all its dependencies are re-read from disk) and `repeat`
+    times through the cache (warm). Failures are reported with the same
+    [InstantiationTest] lines as the pass/fail script; timings are printed
+    as one JSON line.
+
+    Returns: GDScript code as string
     """
-    # Create temporary test script
-    test_script = create_instantiation_test_script(scene_files)
+    scene_list = ",\n".join(f"\t\"{_res_path(scene_path)}\"" for scene_path in scene_paths)
+
+    return f"""extends SceneTree
+
+const SCENES = [
+{scene_list},
+]
+const REPEAT = {repeat}
+
+
+func _init():
+\tprint('[InstantiationTest] Starting scene load benchmark')
+\tvar failed_scenes = []
+\tvar results = {{}}
+\tfor path in SCENES:
+\t\tvar timings = {{
+\t\t\t"cold_load_us": [], "cold_instantiate_us": [],
+\t\t\t"warm_load_us": [], "warm_instantiate_us": [],
+\t\t}}
+\t\tif not _measure(path, ResourceLoader.CACHE_MODE_IGNORE_DEEP, "cold", timings):
+\t\t\tfailed_scenes.append(path)
+\t\t\tcontinue
+\t\t# Prime the cache so the warm runs only hit ResourceLoader's lookup
+\t\tload(path)
+\t\t_measure(path, ResourceLoader.CACHE_MODE_REUSE, "warm", timings)
+\t\tresults[path] = timings
+\t\tprint('[InstantiationTest] PASSED: ' + path)
+
+\tprint('{BENCHMARK_JSON_PREFIX}' + JSON.stringify(results))
+\tif failed_scenes.size() > 0:
+\t\tprint('[InstantiationTest] SUMMARY: ' + str(failed_scenes.size()) + ' scene(s) failed')
+\t\tquit(1)
+\telse:
+\t\tquit(0)
+
+
+func _measure(path: String, cache_mode: int, label: String, timings: Dictionary) -> bool:
+\tfor _i in REPEAT:
+\t\tvar start = Time.get_ticks_usec()
+\t\tvar packed = ResourceLoader.load(path, "", cache_mode)
+\t\tvar loaded = Time.get_ticks_usec()
+\t\tif packed == null:
+\t\t\tprint('[InstantiationTest] FAILED: Could not load ' + path)
+\t\t\treturn false
+\t\tvar instance = packed.instantiate()
+\t\tvar instantiated = Time.get_ticks_usec()
+\t\tif instance == null:
+\t\t\tprint('[InstantiationTest] FAILED: ' + path + ' - instantiate() returned null')
+\t\t\treturn false
+\t\tinstance.free()
+\t\ttimings[label + "_load_us"].append(loaded - start)
+\t\ttimings[label + "_instantiate_us"].append(instantiated - loaded)
+\treturn true
+"""
+
 
+def run_godot_script(godot_bin: str, script: str, timeout: int) -> subprocess.CompletedProcess:
+    """Run a generated SceneTree script headless against the project."""
     with tempfile.NamedTemporaryFile(mode='w', suffix='.gd', delete=False) as f:
-        f.write(test_script)
+        f.write(script)
         temp_script_path = f.name
 
     try:
-        # Run Godot with the test script
         cmd = [
             godot_bin,
             '--headless',
@@ -144,33 +226,170 @@ def test_scene_instantiation(godot_bin: str, scene_files: List[Path]) -> Tuple[b
             str(PROJECT_ROOT)
         ]
 
-        result = subprocess.run(
+        return subprocess.run(
             cmd,
             capture_output=True,
             text=True,
-            timeout=60
+            timeout=timeout
         )
 
-        # Parse output to find failed scenes
-        failed_scenes = []
-        for line in result.stdout.split('\n'):
-            if '[InstantiationTest] FAILED:' in line:
-                # Extract scene path from failure message
-                match = re.search(r'FAILED: (.+)$', line)
-                if match:
-                    failed_scenes.append(match.group(1).strip())
-
-        return (result.returncode == 0, failed_scenes)
-
     finally:
         # Clean up temporary file
         if os.path.exists(temp_script_path):
             os.remove(temp_script_path)
 
 
-def main() -> int:
+def parse_failed_scenes(output: str) -> List[str]:
+    """Scene paths from the [InstantiationTest] FAILED lines."""
+    failed_scenes = []
+    for line in output.split('\n'):
+        if '[InstantiationTest] FAILED:' in line:
+            # Extract scene path from failure message
+            match = re.search(r'FAILED: (.+)$', line)
+            if match:
+                failed_scenes.append(match.group(1).strip())
+    return failed_scenes
+
+
+def _medians(raw: Dict[str, Dict[str, List[int]]]) -> Dict[str, Dict[str, int]]:
+    return {
+        res_path: {metric: int(statistics.median(samples)) for metric, samples in timings.items() if samples}
+        for res_path, timings in raw.items()
+    }
+
+
+def test_scene_instantiation(godot_bin: str, scene_files: List[Path],
+                             worker: Optional[GodotWorker] = None) -> Tuple[bool, List[str]]:
+    """
+    Test that all scenes can be instantiated.
+
+    Returns: (all_passed, failed_scenes)
+    """
+    if worker is not None:
+        result, _ = worker.run("instantiate", scenes=[_res_path(p) for p in scene_files])
+        return (not result["failed"], result["failed"])
+
+    result = run_godot_script(godot_bin, create_instantiation_test_script(scene_files), timeout=60)
+    return (result.returncode == 0, parse_failed_scenes(result.stdout))
+
+
+def benchmark_scenes(godot_bin: str, scene_files: List[Path], repeat: int,
+                     worker: Optional[GodotWorker] = None) -> Tuple[bool, List[str], Dict[str, Dict[str, int]]]:
+    """
+    Time load()/instantiate() of every scene.
+
+    Returns: (all_passed, failed_scenes, {res_path: {metric: median_us}})
+    """
+    # Cold loads re-read every dependency, so allow for more than one pass
+    timeout = 60 + 10 * repeat
+
+    if worker is not None:
+        result, _ = worker.run("instantiate", timeout=timeout,
+                               scenes=[_res_path(p) for p in scene_files], repeat=repeat)
+        return (not result["failed"], result["failed"], _medians(result["timings"]))
+
+    result = run_godot_script(godot_bin, create_benchmark_script(scene_files, repeat), timeout=timeout)
+
+    medians: Dict[str, Dict[str, int]] = {}
+    for line in result.stdout.split('\n'):
+        if line.startswith(BENCHMARK_JSON_PREFIX):
+            medians = _medians(json.loads(line[len(BENCHMARK_JSON_PREFIX):]))
+
+    return (result.returncode == 0, parse_failed_scenes(result.stdout), medians)
+
+
+def load_baseline(path: Path = BASELINE_PATH) -> Optional[Dict[str, Dict[str, int]]]:
+    """Recorded per-scene medians, or None if no baseline exists."""
+    if not path.exists():
+        return None
+    try:
+        return json.loads(path.read_text()).get("scenes", {})
+    except (json.JSONDecodeError, OSError) as e:
+        print(f"{YELLOW}⚠️  Could not read benchmark baseline {path}: {e}{NC}")
+        return None
+
+
+def write_benchmark(path: Path, medians: Dict[str, Dict[str, int]], repeat: int) -> None:
+    """Write medians in the baseline format."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = {"repeat": repeat, "metrics": BENCHMARK_METRICS, "scenes": medians}
+    path.write_text(json.dumps(data, indent=2, sort_keys=True) + "\n")
+
+
+def find_regressions(medians: Dict[str, Dict[str, int]], baseline: Dict[str, Dict[str, int]],
+                     tolerance: float = REGRESSION_TOLERANCE,
+                     min_delta_us: int = REGRESSION_MIN_DELTA_US) -> List[Tuple[str, str, int, int]]:
+    """
+    Metrics slower than the baseline by more than the tolerance.
+
+    Scenes missing from the baseline (new scenes) are not regressions.
+
+    Returns: [(res_path, metric, baseline_us, current_us)]
+    """
+    regressions = []
+    for res_path, timings in sorted(medians.items()):
+        recorded = baseline.get(res_path)
+        if not recorded:
+            continue
+        for metric in BENCHMARK_METRICS:
+            if metric not in timings or metric not in recorded:
+                continue
+            before, after = recorded[metric], timings[metric]
+            if after - before >= min_delta_us and after > before * (1 + tolerance):
+                regressions.append((res_path, metric, before, after))
+    return regressions
+
+
+def _ms(microseconds: int) -> str:
+    return f"{microseconds / 1000:.2f} ms"
+
+
+def print_benchmark(medians: Dict[str, Dict[str, int]], baseline: Optional[Dict[str, Dict[str, int]]]) -> None:
+    """Per-scene medians, slowest cold load + instantiate first."""
+    def cold_total(item):
+        timings = item[1]
+        return timings.get("cold_load_us", 0) + timings.get("cold_instantiate_us", 0)
+
+    print(f"{CYAN}⏱️  Scene load times (median, cold load / cold instantiate / warm instantiate):{NC}")
+    for res_path, timings in sorted(medians.items(), key=cold_total, reverse=True):
+        line = (f"  {res_path}: {_ms(timings.get('cold_load_us', 0))} / "
+                f"{_ms(timings.get('cold_instantiate_us', 0))} / "
+                f"{_ms(timings.get('warm_instantiate_us', 0))}")
+        recorded = (baseline or {}).get(res_path)
+        if recorded:
+            before = recorded.get("cold_load_us", 0) + recorded.get("cold_instantiate_us", 0)
+            line += f"  (baseline cold {_ms(before)})"
+        elif baseline is not None:
+            line += f"  {YELLOW}(new){NC}"
+        print(line)
+    print()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
     """Main validation function"""
-    print(f"{CYAN}🔍 Testing scene instantiation...{NC}\n")
+    parser = argparse.ArgumentParser(description="Test that every scene can be instantiated")
+    parser.add_argument('--benchmark', action='store_true',
+                        help='Time load()/instantiate() and compare against the baseline')
+    parser.add_argument('--no-benchmark', action='store_true',
+                        help='Only check instantiation, even when a baseline exists')
+    parser.add_argument('--repeat', type=int, default=BENCHMARK_REPEAT,
+                        help=f'Cold and warm runs per scene (default: {BENCHMARK_REPEAT})')
+    parser.add_argument('--update-baseline', action='store_true',
+                        help=f'Benchmark and record the results as {BASELINE_PATH.relative_to(PROJECT_ROOT)}')
+    parser.add_argument('--tolerance', type=float, default=REGRESSION_TOLERANCE,
+                        help=f'Allowed slowdown as a fraction (default: {REGRESSION_TOLERANCE})')
+    parser.add_argument('--json', type=Path, default=RESULTS_PATH,
+                        help='Where to write the benchmark results')
+    args = parser.parse_args(argv)
+
+    # A recorded baseline turns the plain (hook) run into a regression check
+    baseline = None if args.no_benchmark else load_baseline()
+    benchmark = args.benchmark or args.update_baseline or baseline is not None
+
+    if benchmark:
+        print(f"{CYAN}🔍 Benchmarking scene instantiation...{NC}\n")
+    else:
+        print(f"{CYAN}🔍 Testing scene instantiation...{NC}\n")
 
     # Find Godot
     try:
@@ -189,8 +408,23 @@ def main() -> int:
 
     print(f"Testing {len(scene_files)} scene(s)...\n")
 
-    # Test instantiation
-    all_passed, failed_scenes = test_scene_instantiation(godot_bin, scene_files)
+    # Test instantiation (in the running worker if there is one)
+    worker = connect_worker(godot_bin)
+    if worker is not None:
+        print(f"{GREEN}✓ Using Godot worker (pid {worker.pid}){NC}\n")
+
+    medians: Dict[str, Dict[str, int]] = {}
+    try:
+        if benchmark:
+            all_passed, failed_scenes, medians = benchmark_scenes(godot_bin, scene_files, args.repeat, worker)
+        else:
+            all_passed, failed_scenes = test_scene_instantiation(godot_bin, scene_files, worker)
+    except WorkerError as e:
+        print(f"{YELLOW}⚠️  Godot worker failed ({e}), starting Godot directly{NC}\n")
+        if benchmark:
+            all_passed, failed_scenes, medians = benchmark_scenes(godot_bin, scene_files, args.repeat)
+        else:
+            all_passed, failed_scenes = test_scene_instantiation(godot_bin, scene_files)
 
     # Summary
     print("\n" + "=" * 60)
@@ -215,6 +449,43 @@ def main() -> int:
         return 1
 
     print(f"\n{GREEN}✅ All scenes can be instantiated!{NC}\n")
+
+    if not benchmark:
+        return 0
+
+    if not medians:
+        print(f"{RED}❌ Benchmark produced no timings (no JSON line in Godot output){NC}\n")
+        return 1
+
+    write_benchmark(args.json, medians, args.repeat)
+    print_benchmark(medians, None if args.update_baseline else baseline)
+
+    if args.update_baseline:
+        write_benchmark(BASELINE_PATH, medians, args.repeat)
+        print(f"{GREEN}✅ Baseline recorded: {BASELINE_PATH.relative_to(PROJECT_ROOT)} "
+              f"({len(medians)} scene(s)){NC}\n")
+        return 0
+
+    if baseline is None:
+        print(f"{YELLOW}⚠️  No baseline recorded - run with --update-baseline to enable regression checks{NC}\n")
+        return 0
+
+    regressions = find_regressions(medians, baseline, args.tolerance)
+    if regressions:
+        print(f"{RED}❌ Scene instantiation time regressed ({len(regressions)} metric(s) "
+              f"more than {args.tolerance:.0%} slower than baseline):{NC}")
+        for res_path, metric, before, after in regressions:
+            print(f"  {RED}✗{NC} {res_path} {metric}: {_ms(before)} → {_ms(after)}")
+        print()
+        print(f"{YELLOW}FIX:{NC}")
+        print(f"  1. Check the scene dependency report: python3 .system/validators/scene_dependency_report.py")
+        print(f"  2. Move heavy preloads/textures out of the scene or load them in the background")
+        print(f"  3. If the slowdown is intended, re-record: "
+              f"python3 .system/validators/scene_instantiation_validator.py --update-baseline")
+        print()
+        return 1
+
+    print(f"{GREEN}✅ No scene load-time regressions against baseline ({len(baseline)} scene(s)){NC}\n")
     return 0
 
 
@@ -17,6 +17,10 @@ import sys
 from pathlib import Path
 from typing import Dict, List, Set, Tuple, Optional
 
+from project_model import ProjectModel, SourceFile, load_project_model
+from scene_parser import SceneFile
+from validator_cache import ResultCache
+
 # ANSI colors
 RED = '\033[0;31m'
 GREEN = '\033[0;32m'
@@ -24,114 +28,31 @@ YELLOW = '\033[1;33m'
 CYAN = '\033[0;36m'
 NC = '\033[0m'
 
-PROJECT_ROOT = Path(__file__).parent.parent.parent
-
-
-class SceneNode:
-    """Represents a node in the scene tree"""
-    def __init__(self, name: str, parent: str = "."):
-        self.name = name
-        self.parent = parent
-        self.children: List['SceneNode'] = []
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
 
-    def get_path(self) -> str:
-        """Get the full node path from root"""
-        if self.parent == ".":
-            return self.name
-        # Build path by walking up parent chain
-        return f"{self.parent}/{self.name}" if self.parent else self.name
 
-
-def discover_scene_files() -> List[Path]:
+def discover_scene_files(model: ProjectModel) -> List[SourceFile]:
     """Auto-discover all .tscn scene files"""
-    scene_files = []
-    scenes_dir = PROJECT_ROOT / "scenes"
-    if scenes_dir.exists():
-        scene_files.extend(scenes_dir.rglob("*.tscn"))
-    return sorted(scene_files)
+    return model.glob("scenes/**/*.tscn")
 
 
-def parse_scene_file(scene_path: Path) -> Tuple[Optional[str], Dict[str, SceneNode]]:
+def parse_scene_file(scene: SourceFile) -> Tuple[Optional[str], Optional[SceneFile]]:
     """
     Parse .tscn file to extract:
     - Script path attached to root node
-    - Node hierarchy (name -> parent mapping)
+    - Node tree (see scene_parser.py)
 
-    Returns: (script_path, node_dict)
+    Returns: (script_path, scene_file)
     """
-    script_path = None
-    nodes: Dict[str, SceneNode] = {}
-    parent_map: Dict[str, str] = {}  # node_name -> parent_name
-
     try:
-        content = scene_path.read_text()
-
-        # Find script attached to root node
-        # Format: [node name="Root"] followed by script = ExtResource(...)
-        root_node_match = re.search(r'\[node name="([^"]+)"[^\]]*\]\s*script\s*=\s*ExtResource\("([^"]+)"\)', content)
-        if root_node_match:
-            script_id = root_node_match.group(2)
-            # Find the actual script path from ExtResource
-            ext_resource_match = re.search(
-                rf'\[ext_resource type="Script" path="([^"]+)" id="{re.escape(script_id)}"\]',
-                content
-            )
-            if ext_resource_match:
-                script_path = ext_resource_match.group(1)
-
-        # Parse all nodes in the scene
-        # Format: [node name="NodeName" type="NodeType" parent="ParentName"]
-        # Note: First node has no parent (is the root), others may have parent="." or parent="NodeName"
-        node_pattern = r'\[node name="([^"]+)"[^\]]*\]'
-        is_first_node = True
-
-        for match in re.finditer(node_pattern, content):
-            node_name = match.group(1)
-            node_block = match.group(0)
-
-            # Extract parent attribute if it exists
-            parent_match = re.search(r'parent="([^"]+)"', node_block)
-
-            if is_first_node:
-                # First node is always the root
-                parent_name = None  # Root has no parent
-                is_first_node = False
-            elif parent_match:
-                parent_name = parent_match.group(1)
-            else:
-                # No parent attribute means it's a child of root
-                parent_name = "."
-
-            nodes[node_name] = SceneNode(node_name, parent_name if parent_name else ".")
-            parent_map[node_name] = parent_name if parent_name else "."
-
-        # Find the root node (first node in the file, parent will be ".")
-        root_node_name = None
-        for node_name, node in nodes.items():
-            if node.parent == ".":
-                root_node_name = node_name
-                break
-
-        # Build parent-child relationships
-        for node_name, node in nodes.items():
-            parent_name = parent_map.get(node_name, ".")
-
-            if parent_name == "." and node_name != root_node_name:
-                # This is a child of the root
-                if root_node_name and root_node_name in nodes:
-                    nodes[root_node_name].children.append(node)
-            elif parent_name != "." and parent_name in nodes:
-                # This is a child of another named node
-                nodes[parent_name].children.append(node)
-
-        return script_path, nodes
-
+        parsed = scene.scene
+        return parsed.root_script, parsed
     except Exception as e:
-        print(f"{RED}Error parsing scene {scene_path}: {e}{NC}")
-        return None, {}
+        print(f"{RED}Error parsing scene {scene.path}: {e}{NC}")
+        return None, None
 
 
-def build_path_map(nodes: Dict[str, SceneNode]) -> Dict[str, str]:
+def build_path_map(scene_file: SceneFile) -> Dict[str, str]:
     """
     Build a map of node paths from root.
     Returns: {full_path -> node_name}
@@ -140,37 +61,21 @@ def build_path_map(nodes: Dict[str, SceneNode]) -> Dict[str, str]:
 
     Note: In GDScript, $NodeName is relative to the scene root, so we don't
     include the root node name in paths. E.g., $UI/WaveComplete, not $Wasteland/UI/WaveComplete
+    Nodes marked unique_name_in_owner are also reachable as %NodeName.
     """
     path_map: Dict[str, str] = {}
 
-    def walk_node(node: SceneNode, current_path: str = "", is_root: bool = False):
-        # Add this node (skip root node name in path)
-        if is_root:
-            # Root node: don't add to path, just walk children
-            for child in node.children:
-                walk_node(child, "", False)
-        else:
-            if current_path:
-                full_path = f"{current_path}/{node.name}"
-            else:
-                full_path = node.name
-
-            path_map[full_path] = node.name
-
-            # Walk children
-            for child in node.children:
-                walk_node(child, full_path, False)
-
-    # Find root node (parent == ".")
-    for node in nodes.values():
-        if node.parent == ".":
-            walk_node(node, "", True)
-            break  # Only one root
+    for node in scene_file.nodes:
+        if node.is_root:
+            continue
+        path_map[node.path] = node.name
+        if node.properties.get("unique_name_in_owner") == "true":
+            path_map[f"%{node.name}"] = node.name
 
     return path_map
 
 
-def parse_script_onready_paths(script_path: Path) -> List[Tuple[int, str, str]]:
+def parse_script_onready_paths(script: SourceFile) -> List[Tuple[int, str, str]]:
     """
     Parse .gd script for @onready references with $NodePath.
 
@@ -181,7 +86,7 @@ def parse_script_onready_paths(script_path: Path) -> List[Tuple[int, str, str]]:
     onready_refs = []
 
     try:
-        lines = script_path.read_text().split('\n')
+        lines = script.lines
 
         # Pattern: @onready var name: Type = $Path/To/Node
         pattern = r'@onready\s+var\s+(\w+):\s*\w+\s*=\s*\$([^\s]+)'
@@ -196,11 +101,11 @@ def parse_script_onready_paths(script_path: Path) -> List[Tuple[int, str, str]]:
         return onready_refs
 
     except Exception as e:
-        print(f"{RED}Error parsing script {script_path}: {e}{NC}")
+        print(f"{RED}Error parsing script {script.path}: {e}{NC}")
         return []
 
 
-def validate_scene_script_pair(scene_path: Path, script_path: Path, nodes: Dict[str, SceneNode]) -> List[str]:
+def validate_scene_script_pair(scene_path: Path, script: SourceFile, scene_file: SceneFile) -> List[str]:
     """
     Validate that all @onready $NodePath references in the script
     actually exist in the scene.
@@ -209,15 +114,11 @@ def validate_scene_script_pair(scene_path: Path, script_path: Path, nodes: Dict[
     """
     errors = []
 
-    # Build path map
-    path_map = build_path_map(nodes)
-
-    # Get all valid paths (including direct node names)
-    valid_paths = set(path_map.keys())
-    valid_paths.update(nodes.keys())  # Also allow direct node names
+    # Every node's full path from the root (nested parent="A/B" included)
+    valid_paths = set(build_path_map(scene_file).keys())
 
     # Parse script for @onready references
-    onready_refs = parse_script_onready_paths(script_path)
+    onready_refs = parse_script_onready_paths(script)
 
     for line_num, var_name, node_path in onready_refs:
         if node_path not in valid_paths:
@@ -248,36 +149,41 @@ def find_closest_path(target: str, valid_paths: Set[str]) -> Optional[str]:
     return None
 
 
-def main():
+def main(model: Optional[ProjectModel] = None):
     print(f"{CYAN}Validating scene node paths...{NC}\n")
 
-    scene_files = discover_scene_files()
+    model = model or load_project_model(PROJECT_ROOT)
+    scene_files = discover_scene_files(model)
 
     if not scene_files:
         print(f"{YELLOW}⚠️  No scene files found{NC}")
         return 0
 
+    # Cached per scene; a scene's result also depends on its attached script
+    cache = ResultCache("scene_node_path_validator", Path(__file__))
     total_errors = []
     checked_count = 0
 
-    for scene_path in scene_files:
-        script_path_str, nodes = parse_scene_file(scene_path)
+    for scene in scene_files:
+        scene_path = scene.path
+        script_path_str, scene_file = parse_scene_file(scene)
 
         if not script_path_str:
             # Scene doesn't have a script attached, skip
             continue
 
-        # Convert script path to absolute
-        # Format: res://path/to/script.gd -> PROJECT_ROOT/path/to/script.gd
-        script_rel_path = script_path_str.replace("res://", "")
-        script_path = PROJECT_ROOT / script_rel_path
+        # Resolve res://path/to/script.gd through the project model
+        script = model.get_res(script_path_str)
 
-        if not script_path.exists():
+        if script is None:
             print(f"{YELLOW}⚠️  Script not found: {script_path_str} for scene {scene_path.name}{NC}")
             continue
 
         # Validate this scene/script pair
-        errors = validate_scene_script_pair(scene_path, script_path, nodes)
+        errors = cache.lookup(scene, deps=script.digest)
+        if errors is None:
+            errors = validate_scene_script_pair(scene_path, script, scene_file)
+            cache.store(scene, errors, deps=script.digest)
 
         if errors:
             print(f"{RED}❌ Scene/script mismatch in {scene_path.relative_to(PROJECT_ROOT)}:{NC}")
@@ -288,6 +194,8 @@ def main():
 
         checked_count += 1
 
+    cache.save()
+
     print(f"Checked {checked_count} scene(s) with scripts")
 
     if total_errors:
@@ -0,0 +1,449 @@
+#!/usr/bin/env python3
+"""
+Scene Parser
+
+Streaming parser for Godot text scenes (.tscn) shared by the scene
+validators. The file is read one section at a time - [gd_scene],
+[ext_resource], [sub_resource], [node], [connection] - into a typed node
+tree, replacing the per-validator regexes over whole files.
+
+Text resources (.tres) use the same section format; parse_resource() reads
+their [gd_resource] header, [ext_resource]s and the [resource] properties,
+and parse_value() decodes a property value (strings, numbers, bools, Color()
+and other constructors, arrays, dictionaries) for comparison.
+
+Node paths follow Godot's rules: the root is ".", direct children of the
+root use parent=".", and deeper nodes name their parent by path relative to
+the root (parent="HBoxContainer/StartRun"). Nodes are keyed by that full
+path, so two nodes with the same name under different parents stay distinct.
+
+Usage:
+    from scene_parser import parse_scene
+
+    scene = source.scene                     # SourceFile (cached per content hash)
+    scene = parse_scene(text)                # Any .tscn text
+    scene.root.name, scene.root_script       # "Wasteland", "res://scenes/game/wasteland.gd"
+    scene.node("UI/WaveComplete").type       # Node lookup by path from the root
+    for node in scene.nodes:                 # File order
+        node.path, node.parent, node.properties.get("collision_layer")
+    for resource in scene.ext_resources.values():
+        resource.type, resource.path
+
+    resource = parse_resource(tres_text)
+    resource.properties["damage"]            # '15' (raw text)
+    parse_value('Color(1, 0, 0, 1)')         # ('Color', 1, 0, 0, 1)
+"""
+
+import re
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# Header attributes: key="string", key=ExtResource("id"), key=["a", "b"], key=3
+ATTRIBUTE_PATTERN = re.compile(r'(\w+)=("(?:[^"\\]|\\.)*"|\w+\([^)]*\)|\[[^\]]*\]|[^\s\]]+)')
+RESOURCE_REF_PATTERN = re.compile(r'(?:Ext|Sub)Resource\(\s*"?([^")\s]+)"?\s*\)')
+STRING_ITEM_PATTERN = re.compile(r'"((?:[^"\\]|\\.)*)"')
+# Value tokens: strings (also &"StringName" / ^"NodePath"), numbers, identifiers, punctuation
+VALUE_TOKEN_PATTERN = re.compile(
+    r'\s*(?:[&^]?(?P<string>"(?:[^"\\]|\\.)*")'
+    r'|(?P<number>[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)'
+    r'|(?P<name>[A-Za-z_][\w.]*)'
+    r'|(?P<punct>[\[\]{}(),:]))'
+)
+STRING_ESCAPES = {"n": "\n", "t": "\t", "r": "\r", '"': '"', "\\": "\\"}
+
+
+class Section:
+    """One `[header ...]` block with its `key = value` properties."""
+    __slots__ = ("kind", "attrs", "header", "line", "properties", "property_lines")
+
+    def __init__(self, kind: str, attrs: Dict[str, str], header: str, line: int):
+        self.kind = kind                  # "gd_scene", "ext_resource", "node", ...
+        self.attrs = attrs                # Header attributes, strings unquoted
+        self.header = header              # Raw header text
+        self.line = line                  # 1-indexed line of the header
+        self.properties: Dict[str, str] = {}     # Raw property values
+        self.property_lines: Dict[str, int] = {}
+
+
+class ExtResource:
+    """`[ext_resource]`: a script, texture, scene, ... loaded from disk."""
+    __slots__ = ("id", "type", "path", "uid", "line")
+
+    def __init__(self, section: Section):
+        self.id = section.attrs.get("id", "")
+        self.type = section.attrs.get("type", "")
+        self.path = section.attrs.get("path", "")     # res:// path
+        self.uid = section.attrs.get("uid")
+        self.line = section.line
+
+    def __repr__(self) -> str:
+        return f"ExtResource({self.id!r}, {self.type!r}, {self.path!r})"
+
+
+class SubResource:
+    """`[sub_resource]`: a resource embedded in the scene."""
+    __slots__ = ("id", "type", "properties", "line")
+
+    def __init__(self, section: Section):
+        self.id = section.attrs.get("id", "")
+        self.type = section.attrs.get("type", "")
+        self.properties = section.properties
+        self.line = section.line
+
+    def __repr__(self) -> str:
+        return f"SubResource({self.id!r}, {self.type!r})"
+
+
+class SceneNode:
+    """`[node]`: one node of the scene tree."""
+    __slots__ = ("name", "type", "parent", "path", "instance", "groups",
+                 "properties", "property_lines", "header", "line", "children", "parent_node")
+
+    def __init__(self, section: Section, path: str):
+        attrs = section.attrs
+        self.name = attrs.get("name", "")
+        self.type = attrs.get("type")                 # None for instanced scenes
+        self.parent = attrs.get("parent")             # None for the root
+        self.path = path                              # "." for the root, else relative to it
+        self.instance = resource_id(attrs.get("instance", ""))  # ExtResource id of an instanced scene
+        self.groups = STRING_ITEM_PATTERN.findall(attrs.get("groups", ""))
+        self.properties = section.properties
+        self.property_lines = section.property_lines
+        self.header = section.header
+        self.line = section.line
+        self.children: List["SceneNode"] = []
+        self.parent_node: Optional["SceneNode"] = None
+
+    @property
+    def is_root(self) -> bool:
+        return self.path == "."
+
+    def walk(self) -> Iterator["SceneNode"]:
+        """This node and all its descendants, depth first."""
+        yield self
+        for child in self.children:
+            yield from child.walk()
+
+    def __repr__(self) -> str:
+        return f"SceneNode({self.path!r}, {self.type!r})"
+
+
+class Connection:
+    """`[connection]`: a signal connection saved in the scene."""
+    __slots__ = ("signal", "source", "target", "method", "line")
+
+    def __init__(self, section: Section):
+        self.signal = section.attrs.get("signal", "")
+        self.source = section.attrs.get("from", "")   # Node path of the emitter
+        self.target = section.attrs.get("to", "")     # Node path of the receiver
+        self.method = section.attrs.get("method", "")
+        self.line = section.line
+
+
+class SceneFile:
+    """Parsed .tscn: resources, node tree and connections."""
+    def __init__(self):
+        self.header: Optional[Section] = None         # [gd_scene ...]
+        self.ext_resources: Dict[str, ExtResource] = {}
+        self.sub_resources: Dict[str, SubResource] = {}
+        self.nodes: List[SceneNode] = []              # File order; nodes[0] is the root
+        self.connections: List[Connection] = []
+        self._by_path: Dict[str, SceneNode] = {}
+
+    @property
+    def root(self) -> Optional[SceneNode]:
+        return self.nodes[0] if self.nodes else None
+
+    @property
+    def root_script(self) -> Optional[str]:
+        """res:// path of the script attached to the root node."""
+        return self.script_of(self.root) if self.root is not None else None
+
+    def node(self, path: str) -> Optional[SceneNode]:
+        """Node at `path` relative to the root ("." is the root itself)."""
+        return self._by_path.get(path)
+
+    def script_of(self, node: SceneNode) -> Optional[str]:
+        """res:// path of the script attached to `node`, if it is an ext_resource."""
+        resource = self.resource(node.properties.get("script", ""))
+        return resource.path if isinstance(resource, ExtResource) else None
+
+    def instanced_scene(self, node: SceneNode) -> Optional[str]:
+        """res:// path of the scene `node` instances, if any."""
+        resource = self.ext_resources.get(node.instance) if node.instance else None
+        return resource.path if resource is not None else None
+
+    def resource(self, value: str):
+        """ExtResource/SubResource referenced by a property value, or None."""
+        ref = resource_id(value)
+        if ref is None:
+            return None
+        if value.lstrip().startswith("SubResource"):
+            return self.sub_resources.get(ref)
+        return self.ext_resources.get(ref)
+
+    def _add_node(self, section: Section) -> None:
+        parent = section.attrs.get("parent")
+        name = section.attrs.get("name", "")
+        if not self.nodes or parent is None:
+            path = "." if not self.nodes else name
+        elif parent == ".":
+            path = name
+        else:
+            path = f"{parent}/{name}"
+
+        node = SceneNode(section, path)
+        self.nodes.append(node)
+        self._by_path.setdefault(path, node)
+
+        # Children of nodes inside an instanced scene have no parent here
+        parent_node = self._by_path.get(parent) if parent is not None else None
+        if parent_node is not None and node is not parent_node:
+            node.parent_node = parent_node
+            parent_node.children.append(node)
+
+
+class ResourceFile:
+    """Parsed .tres: header, external resources and the [resource] properties."""
+    def __init__(self):
+        self.header: Optional[Section] = None         # [gd_resource ...]
+        self.ext_resources: Dict[str, ExtResource] = {}
+        self.sub_resources: Dict[str, SubResource] = {}
+        self.properties: Dict[str, str] = {}          # [resource] properties, raw text
+        self.property_lines: Dict[str, int] = {}
+
+    @property
+    def script_class(self) -> Optional[str]:
+        return self.header.attrs.get("script_class") if self.header is not None else None
+
+    @property
+    def script(self) -> Optional[str]:
+        """res:// path of the resource's script, if it is an ext_resource."""
+        resource = self.ext_resources.get(resource_id(self.properties.get("script", "")) or "")
+        return resource.path if resource is not None else None
+
+
+def resource_id(value: str) -> Optional[str]:
+    """Id inside ExtResource("1_abc") / SubResource("x") / ExtResource( 1 )."""
+    match = RESOURCE_REF_PATTERN.search(value or "")
+    return match.group(1) if match else None
+
+
+def _unquote(value: str) -> str:
+    if len(value) >= 2 and value[0] == '"' and value[-1] == '"':
+        return value[1:-1].replace('\\"', '"')
+    return value
+
+
+def _is_complete(value: str) -> bool:
+    """True once a property value has balanced brackets and closed strings."""
+    depth = 0
+    in_string = False
+    escaped = False
+    for char in value:
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char in "([{":
+            depth += 1
+        elif char in ")]}":
+            depth -= 1
+    return not in_string and depth <= 0
+
+
+def iter_sections(lines: List[str]) -> Iterator[Section]:
+    """Yield each section of a .tscn file as soon as it is complete."""
+    section: Optional[Section] = None
+    pending: Optional[Tuple[str, int, List[str]]] = None  # Multi-line property
+
+    for line_num, line in enumerate(lines, start=1):
+        if pending is not None:
+            key, start, parts = pending
+            parts.append(line)
+            value = "\n".join(parts)
+            if _is_complete(value):
+                section.properties[key] = value
+                section.property_lines[key] = start
+                pending = None
+            continue
+
+        if line.startswith("["):
+            if section is not None:
+                yield section
+            header = line.rstrip()
+            kind = header[1:].split(None, 1)[0].rstrip("]") if len(header) > 1 else ""
+            attrs = {key: _unquote(value) for key, value in ATTRIBUTE_PATTERN.findall(header[len(kind) + 1:].rstrip("]"))}
+            section = Section(kind, attrs, header, line_num)
+            continue
+
+        if section is None or not line.strip() or line.startswith(";"):
+            continue
+
+        key, sep, value = line.partition("=")
+        if not sep:
+            continue
+        key = key.strip()
+        value = value.strip()
+        if _is_complete(value):
+            section.properties[key] = value
+            section.property_lines[key] = line_num
+        else:
+            pending = (key, line_num, [value])
+
+    if section is not None:
+        yield section
+
+
+def parse_scene(text: str) -> SceneFile:
+    """Parse .tscn text into a SceneFile."""
+    scene = SceneFile()
+    for section in iter_sections(text.split('\n')):
+        if section.kind == "gd_scene":
+            scene.header = section
+        elif section.kind == "ext_resource":
+            resource = ExtResource(section)
+            scene.ext_resources[resource.id] = resource
+        elif section.kind == "sub_resource":
+            resource = SubResource(section)
+            scene.sub_resources[resource.id] = resource
+        elif section.kind == "node":
+            scene._add_node(section)
+        elif section.kind == "connection":
+            scene.connections.append(Connection(section))
+    return scene
+
+
+def parse_resource(text: str) -> ResourceFile:
+    """Parse .tres text into a ResourceFile."""
+    resource = ResourceFile()
+    for section in iter_sections(text.split('\n')):
+        if section.kind == "gd_resource":
+            resource.header = section
+        elif section.kind == "ext_resource":
+            ext = ExtResource(section)
+            resource.ext_resources[ext.id] = ext
+        elif section.kind == "sub_resource":
+            sub = SubResource(section)
+            resource.sub_resources[sub.id] = sub
+        elif section.kind == "resource":
+            resource.properties = section.properties
+            resource.property_lines = section.property_lines
+    return resource
+
+
+def _unescape(literal: str) -> str:
+    body = literal[1:-1]
+    if "\\" not in body:
+        return body
+    return re.sub(r'\\(.)', lambda m: STRING_ESCAPES.get(m.group(1), m.group(1)), body)
+
+
+def parse_value(text: str) -> Any:
+    """
+    Decode a property value written by Godot or the resource generators.
+
+    Strings, numbers, true/false/null, arrays and dictionaries map to Python
+    values; constructors become tuples (`Color(1, 0, 0, 1)` ->
+    `('Color', 1, 0, 0, 1)`, `ExtResource("1_x")` -> `('ExtResource', '1_x')`)
+    and bare constants to one-element tuples (`('Color.WHITE',)`). Typed
+    collections (`Array[int]([1])`) decode to their contents. Raises
+    ValueError on text it cannot read.
+    """
+    tokens = []
+    pos = 0
+    text = text.strip()
+    while pos < len(text):
+        match = VALUE_TOKEN_PATTERN.match(text, pos)
+        if match is None or match.end() == pos:
+            raise ValueError(f"Unexpected character at {pos} in {text!r}")
+        pos = match.end()
+        kind = match.lastgroup
+        tokens.append((kind, match.group(kind)))
+
+    index = 0
+
+    def peek() -> Tuple[Optional[str], Optional[str]]:
+        return tokens[index] if index < len(tokens) else (None, None)
+
+    def expect(punct: str) -> None:
+        nonlocal index
+        if peek() != ("punct", punct):
+            raise ValueError(f"Expected {punct!r} in {text!r}")
+        index += 1
+
+    def items(close: str) -> List[Any]:
+        nonlocal index
+        values = []
+        while peek() != ("punct", close):
+            values.append(value())
+            if peek() == ("punct", ","):
+                index += 1
+            elif peek() != ("punct", close):
+                raise ValueError(f"Expected ',' or {close!r} in {text!r}")
+        index += 1
+        return values
+
+    def value() -> Any:
+        nonlocal index
+        kind, token = peek()
+        if kind is None:
+            raise ValueError(f"Unexpected end of {text!r}")
+        index += 1
+        if kind == "string":
+            return _unescape(token)
+        if kind == "number":
+            return float(token) if any(c in token for c in ".eE") else int(token)
+        if kind == "name":
+            if token in ("true", "false"):
+                return token == "true"
+            if token == "null":
+                return None
+            if token in ("inf", "inf_neg", "nan"):
+                return {"inf": float("inf"), "inf_neg": float("-inf"), "nan": float("nan")}[token]
+            if peek() == ("punct", "["):
+                # Typed collection: Array[int]([...]), Dictionary[String, int]({...})
+                index += 1
+                items("]")
+                expect("(")
+                contents = value()
+                expect(")")
+                return contents
+            if peek() == ("punct", "("):
+                index += 1
+                return (token, *items(")"))
+            return (token,)
+        if token == "[":
+            return items("]")
+        if token == "{":
+            result = {}
+            while peek() != ("punct", "}"):
+                key = value()
+                expect(":")
+                result[key if not isinstance(key, list) else tuple(key)] = value()
+                if peek() == ("punct", ","):
+                    index += 1
+                elif peek() != ("punct", "}"):
+                    raise ValueError(f"Expected ',' or '}}' in {text!r}")
+            index += 1
+            return result
+        raise ValueError(f"Unexpected {token!r} in {text!r}")
+
+    result = value()
+    if index != len(tokens):
+        raise ValueError(f"Trailing text in {text!r}")
+    return result
+
+
+_SCENES: Dict[str, SceneFile] = {}
+
+
+def parse_scene_cached(text: str, digest: str) -> SceneFile:
+    """parse_scene() memoized by content hash (identical files parse once)."""
+    if digest not in _SCENES:
+        _SCENES[digest] = parse_scene(text)
+    return _SCENES[digest]
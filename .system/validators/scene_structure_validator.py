@@ -4,7 +4,8 @@ Scene Structure Validator
 
 Validates that .tscn scene files have proper structure:
 - All child nodes specify parent="..." attribute
-- No orphan nodes (except root)
+- No orphan nodes (except root): every parent="A/B" path names a node
+  of the scene (nodes inside an instanced sub-scene are allowed)
 - Valid node hierarchy
 
 Catches errors like:
@@ -15,11 +16,13 @@ when it should be:
 Runs during pre-commit to catch scene file corruption before it's committed.
 """
 
-import re
 import sys
 from pathlib import Path
 from typing import List, Tuple, Optional
 
+from project_model import ProjectModel, SourceFile, load_project_model
+from scene_parser import SceneFile
+
 # ANSI colors
 RED = '\033[0;31m'
 GREEN = '\033[0;32m'
@@ -27,19 +30,25 @@ YELLOW = '\033[1;33m'
 CYAN = '\033[0;36m'
 NC = '\033[0m'
 
-PROJECT_ROOT = Path(__file__).parent.parent.parent
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
 
 
-def discover_scene_files() -> List[Path]:
+def discover_scene_files(model: ProjectModel) -> List[SourceFile]:
     """Auto-discover all .tscn scene files"""
-    scene_files = []
-    scenes_dir = PROJECT_ROOT / "scenes"
-    if scenes_dir.exists():
-        scene_files.extend(scenes_dir.rglob("*.tscn"))
-    return sorted(scene_files)
+    return model.glob("scenes/**/*.tscn")
+
+
+def _inside_instance(scene_file: SceneFile, parent_path: str) -> bool:
+    """True if `parent_path` lies under an instanced sub-scene (editable children)."""
+    parts = parent_path.split("/")
+    for depth in range(len(parts) - 1, 0, -1):
+        node = scene_file.node("/".join(parts[:depth]))
+        if node is not None:
+            return node.instance is not None
+    return False
 
 
-def validate_scene_structure(scene_path: Path) -> Tuple[bool, List[str]]:
+def validate_scene_structure(scene: SourceFile) -> Tuple[bool, List[str]]:
     """
     Validate scene file structure.
 
@@ -48,45 +57,34 @@ def validate_scene_structure(scene_path: Path) -> Tuple[bool, List[str]]:
     errors = []
 
     try:
-        content = scene_path.read_text()
-        lines = content.split('\n')
-
-        # Track if we've seen the root node
-        root_node = None
-        line_num = 0
-
-        for i, line in enumerate(lines, 1):
-            # Match node definitions: [node name="NodeName" type="NodeType" ...]
-            node_match = re.match(r'\[node name="([^"]+)"\s+type="([^"]+)"([^\]]*)\]', line)
-
-            if node_match:
-                node_name = node_match.group(1)
-                node_type = node_match.group(2)
-                attributes = node_match.group(3)
-
-                # First node is the root
-                if root_node is None:
-                    root_node = node_name
-                    # Root should NOT have parent attribute
-                    if 'parent=' in attributes:
-                        errors.append(
-                            f"Line {i}: Root node '{node_name}' should not have parent attribute\n"
-                            f"  Found: {line.strip()}\n"
-                            f"  Expected: [node name=\"{node_name}\" type=\"{node_type}\"]"
-                        )
-                else:
-                    # All child nodes MUST have parent attribute
-                    if 'parent=' not in attributes:
-                        errors.append(
-                            f"Line {i}: Child node '{node_name}' missing parent specification\n"
-                            f"  Found: {line.strip()}\n"
-                            f"  Expected: [node name=\"{node_name}\" type=\"{node_type}\" parent=\"...\"]"
-                        )
-
-                line_num = i
+        nodes = scene.scene.nodes
+
+        for node in nodes:
+            node_type = node.type or "..."
+            if node.is_root:
+                # Root should NOT have parent attribute
+                if node.parent is not None:
+                    errors.append(
+                        f"Line {node.line}: Root node '{node.name}' should not have parent attribute\n"
+                        f"  Found: {node.header.strip()}\n"
+                        f"  Expected: [node name=\"{node.name}\" type=\"{node_type}\"]"
+                    )
+            elif node.parent is None:
+                # All child nodes MUST have parent attribute
+                errors.append(
+                    f"Line {node.line}: Child node '{node.name}' missing parent specification\n"
+                    f"  Found: {node.header.strip()}\n"
+                    f"  Expected: [node name=\"{node.name}\" type=\"{node_type}\" parent=\"...\"]"
+                )
+            elif node.parent_node is None and not _inside_instance(scene.scene, node.parent):
+                # Parent path must name a node of this scene (or one inside an instanced scene)
+                errors.append(
+                    f"Line {node.line}: Node '{node.name}' has parent \"{node.parent}\" which is not in the scene\n"
+                    f"  Found: {node.header.strip()}"
+                )
 
         # Verify we found at least one node
-        if root_node is None:
+        if not nodes:
             errors.append("No nodes found in scene file - file may be corrupted")
 
         return (len(errors) == 0, errors)
@@ -96,11 +94,12 @@ def validate_scene_structure(scene_path: Path) -> Tuple[bool, List[str]]:
         return (False, errors)
 
 
-def main() -> int:
+def main(model: Optional[ProjectModel] = None) -> int:
     """Main validation function"""
     print(f"{CYAN}🔍 Validating scene file structure...{NC}\n")
 
-    scene_files = discover_scene_files()
+    model = model or load_project_model(PROJECT_ROOT)
+    scene_files = discover_scene_files(model)
 
     if not scene_files:
         print(f"{YELLOW}⚠️  No scene files found in scenes/ directory{NC}")
@@ -112,9 +111,9 @@ def main() -> int:
 
     all_errors = []
 
-    for scene_path in scene_files:
-        relative_path = scene_path.relative_to(PROJECT_ROOT)
-        is_valid, errors = validate_scene_structure(scene_path)
+    for scene in scene_files:
+        relative_path = scene.rel_path
+        is_valid, errors = validate_scene_structure(scene)
 
         if is_valid:
             valid_files += 1
@@ -13,7 +13,9 @@ Exit Codes:
 import sys
 import re
 from pathlib import Path
-from typing import Dict, List, Set
+from typing import Dict, List, Set, Optional
+
+from project_model import ProjectModel, SourceFile, load_project_model
 
 # ANSI colors
 RED = '\033[0;31m'
@@ -21,7 +23,7 @@ GREEN = '\033[0;32m'
 YELLOW = '\033[1;33m'
 NC = '\033[0m'
 
-PROJECT_ROOT = Path(__file__).parent.parent.parent
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
 SERVICES_DIR = PROJECT_ROOT / "scripts/services"
 
 # Required methods for all services (Week 5+)
@@ -48,7 +50,7 @@ WEEK_6_METHODS = {
 }
 
 
-def check_service_api(service_file: Path, required_methods: Dict) -> List[str]:
+def check_service_api(service_file: SourceFile, required_methods: Dict) -> List[str]:
     """
     Check if service implements all required methods.
 
@@ -58,7 +60,7 @@ def check_service_api(service_file: Path, required_methods: Dict) -> List[str]:
     errors = []
 
     try:
-        content = service_file.read_text(encoding='utf-8')
+        content = service_file.content
 
         for method_name, spec in required_methods.items():
             if not re.search(spec["signature"], content, re.MULTILINE):
@@ -73,7 +75,7 @@ def check_service_api(service_file: Path, required_methods: Dict) -> List[str]:
     return errors
 
 
-def check_naming_consistency(service_files: List[Path]) -> List[str]:
+def check_naming_consistency(service_files: List[SourceFile]) -> List[str]:
     """
     Check for naming inconsistencies across services.
 
@@ -88,7 +90,7 @@ def check_naming_consistency(service_files: List[Path]) -> List[str]:
 
     for service_file in service_files:
         try:
-            content = service_file.read_text(encoding='utf-8')
+            content = service_file.content
 
             # Find all public methods (not starting with _)
             methods = re.findall(r'^func ([a-z][a-z0-9_]*)\(', content, re.MULTILINE)
@@ -98,7 +100,7 @@ def check_naming_consistency(service_files: List[Path]) -> List[str]:
                 base = method.split('_')[0]
                 if base not in method_patterns:
                     method_patterns[base] = set()
-                method_patterns[base].add((service_file.stem, method))
+                method_patterns[base].add((service_file.path.stem, method))
 
         except Exception:
             pass
@@ -119,14 +121,15 @@ def check_naming_consistency(service_files: List[Path]) -> List[str]:
     return warnings
 
 
-def main():
+def main(model: Optional[ProjectModel] = None):
     """Check all services for API consistency."""
 
     if not SERVICES_DIR.exists():
         print(f"{YELLOW}⚠️  Services directory not found: {SERVICES_DIR}{NC}")
         return 0
 
-    service_files = sorted(SERVICES_DIR.glob("*_service.gd"))
+    model = model or load_project_model(PROJECT_ROOT)
+    service_files = model.glob("scripts/services/*_service.gd")
 
     if not service_files:
         print(f"{YELLOW}⚠️  No service files found{NC}")
@@ -136,7 +139,7 @@ def main():
 
     # Determine which methods to require
     # Week 6+ requires serialization
-    has_save_system = (PROJECT_ROOT / "scripts/systems/save_system.gd").exists()
+    has_save_system = model.get(Path("scripts/systems/save_system.gd")) is not None
     required_methods = REQUIRED_METHODS_WEEK_5.copy()
     if has_save_system:
         required_methods.update(WEEK_6_METHODS)
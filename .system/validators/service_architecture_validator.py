@@ -19,9 +19,13 @@ Exit Codes:
 import sys
 import re
 from pathlib import Path
-from typing import List, Tuple, Dict
+from typing import List, Tuple, Dict, Optional
 from collections import defaultdict
 
+from project_model import ProjectModel, SourceFile, load_project_model
+from validator_cache import ResultCache
+from file_selection import FileSelection, selection_from_argv
+
 # ANSI colors
 RED = '\033[0;31m'
 GREEN = '\033[0;32m'
@@ -29,7 +33,7 @@ YELLOW = '\033[1;33m'
 CYAN = '\033[0;36m'
 NC = '\033[0m'
 
-PROJECT_ROOT = Path(__file__).parent.parent.parent
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
 
 
 class ArchitectureIssue:
@@ -256,11 +260,12 @@ def check_state_management_methods(file_path: Path, content: str) -> List[Archit
     return issues
 
 
-def validate_file(file_path: Path) -> List[ArchitectureIssue]:
+def validate_file(source: SourceFile) -> List[ArchitectureIssue]:
     """Run all architecture checks on a file."""
     try:
-        content = file_path.read_text(encoding='utf-8')
-        lines = content.split('\n')
+        file_path = source.path
+        content = source.content
+        lines = source.lines
 
         all_issues = []
 
@@ -274,15 +279,19 @@ def validate_file(file_path: Path) -> List[ArchitectureIssue]:
         return all_issues
 
     except Exception as e:
-        print(f"{YELLOW}⚠️  Could not read {file_path}: {e}{NC}")
+        print(f"{YELLOW}⚠️  Could not check {source.path}: {e}{NC}")
         return []
 
 
-def main():
+def main(model: Optional[ProjectModel] = None, selection: Optional[FileSelection] = None):
     """Check all GDScript service files for architecture issues."""
 
     print(f"{CYAN}Checking for service architecture issues...{NC}")
 
+    model = model or load_project_model(PROJECT_ROOT)
+    selection = selection or selection_from_argv(model)
+    cache = ResultCache("service_architecture_validator", Path(__file__))
+
     file_issues: Dict[Path, List[ArchitectureIssue]] = defaultdict(list)
     checked_files = 0
     error_count = 0
@@ -295,22 +304,30 @@ def main():
         print(f"{GREEN}✅ No services directory found (skipping){NC}")
         return 0
 
-    for file in services_dir.rglob("*.gd"):
+    for source in model.glob("services/**/*.gd"):
         # Skip test files
-        if "_test.gd" in file.name or "test_" in file.name:
+        if "_test.gd" in source.name or "test_" in source.name:
+            continue
+
+        if not selection.includes(source):
             continue
 
         checked_files += 1
-        issues = validate_file(file)
+        issues = cache.lookup(source, ArchitectureIssue)
+        if issues is None:
+            issues = validate_file(source)
+            cache.store(source, issues)
 
         if issues:
-            file_issues[file] = issues
+            file_issues[source.path] = issues
             for issue in issues:
                 if issue.severity == "error":
                     error_count += 1
                 else:
                     warning_count += 1
 
+    cache.save(prune=selection.full)
+
     # Report results
     if not file_issues:
         print(f"{GREEN}✅ No service architecture issues detected ({checked_files} files checked){NC}")
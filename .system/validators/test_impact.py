@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+Test Impact Analysis
+
+Maps every GUT test file (scripts/tests/**/*_test.gd) to the project files it
+depends on, so the pre-commit hook runs only the tests a change can affect
+instead of the whole suite.
+
+A test depends on everything it reaches through:
+- res:// string literals (preload/load/change_scene, data JSON paths)
+- class_name references (and `extends` of a class_name)
+- autoloads, including the services and systems whose public API
+  test_method_validator.extract_service_api() extracts
+- ext_resources of the scenes and .tres files reached
+followed transitively through the scripts, scenes and resources reached.
+
+`load("res://resources/weapons/" + id + ".tres")` is recorded as a dependency
+on everything under that directory. A `load(path)` with no literal at all
+cannot be resolved, so those tests also run whenever a scene, resource or
+data file changes.
+
+The whole suite runs (select_tests() returns None) when:
+- nothing is staged, or --full is given (CI)
+- project.godot, .gutconfig.json or addons/gut/ changed
+- a non-test file under scripts/tests/ (shared test helper) changed
+
+Usage:
+    python3 test_impact.py                                # Tests affected by staged changes
+    python3 test_impact.py scripts/services/shop_service.gd
+    python3 test_impact.py --map                          # Dependencies of every test
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from file_selection import staged_paths
+from gdscript_parser import NAME, STRING
+from project_model import ProjectModel, SourceFile, load_project_model
+from scene_dependency_report import AUTOLOAD_PATTERN
+from test_method_validator import discover_service_files, extract_service_api
+
+# ANSI colors
+RED = '\033[0;31m'
+GREEN = '\033[0;32m'
+YELLOW = '\033[1;33m'
+CYAN = '\033[0;36m'
+NC = '\033[0m'
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+
+TEST_GLOB = "scripts/tests/**/*_test.gd"
+TEST_DIR = Path("scripts/tests")
+
+# Changes that can affect every test
+GLOBAL_FILES = {Path("project.godot"), Path(".gutconfig.json")}
+GLOBAL_DIRS = [Path("addons/gut")]
+
+# Files a dependency walk descends into (everything else is a leaf)
+WALKED_SUFFIXES = {".gd", ".tscn", ".tres"}
+
+# Files a literal-free load(path) could be loading
+DYNAMIC_SUFFIXES = {".tscn", ".tres", ".res", ".json"}
+
+LOAD_FUNCTIONS = {"load", "preload", "change_scene_to_file", "load_threaded_request"}
+
+
+class FileDependencies:
+    """What one file references directly."""
+    __slots__ = ("paths", "prefixes", "dynamic")
+
+    def __init__(self):
+        self.paths: Set[Path] = set()        # Files referenced by path, class or autoload name
+        self.prefixes: Set[str] = set()      # "resources/weapons/" from "res://resources/weapons/" + id
+        self.dynamic = False                 # load(variable) with no literal path
+
+
+class TestDependencies:
+    """Everything a test file reaches."""
+    def __init__(self, test: Path):
+        self.test = test
+        self.paths: Set[Path] = set()
+        self.prefixes: Set[str] = set()
+        self.dynamic = False
+
+    def affected_by(self, rel_path: Path) -> bool:
+        if rel_path == self.test or rel_path in self.paths:
+            return True
+        posix = rel_path.as_posix()
+        if any(posix.startswith(prefix) for prefix in self.prefixes):
+            return True
+        return self.dynamic and rel_path.suffix in DYNAMIC_SUFFIXES
+
+
+class TestImpactMap:
+    """Test file -> transitive dependencies, built from the project model."""
+    def __init__(self, model: ProjectModel):
+        self.model = model
+        self.names: Dict[str, Path] = {}       # class_name / autoload / service -> script
+        for name, rel_path in model.class_names().items():
+            self.names[name] = rel_path
+        for service in discover_service_files(model):
+            self.names.setdefault(extract_service_api(service).name, service.rel_path)
+        project = model.get(Path("project.godot"))
+        if project is not None:
+            for name, path in AUTOLOAD_PATTERN.findall(project.content):
+                self.names[name] = Path(path)
+
+        self._direct: Dict[Path, FileDependencies] = {}
+        self.tests: Dict[Path, TestDependencies] = {
+            source.rel_path: self._walk(source.rel_path)
+            for source in model.glob(TEST_GLOB)
+        }
+
+    def direct(self, rel_path: Path) -> FileDependencies:
+        """Direct references of one file (memoized)."""
+        if rel_path not in self._direct:
+            self._direct[rel_path] = self._scan(rel_path)
+        return self._direct[rel_path]
+
+    def _scan(self, rel_path: Path) -> FileDependencies:
+        deps = FileDependencies()
+        # addons/ are third-party leaves (changes to GUT itself rerun everything)
+        if rel_path.suffix not in WALKED_SUFFIXES or "addons" in rel_path.parts:
+            return deps
+        source = self.model.get(rel_path)
+        if source is None:
+            return deps
+
+        if rel_path.suffix != ".gd":
+            # .tscn / .tres: ext_resource paths (and script/texture refs in properties)
+            for resource in _resource_paths(source):
+                deps.paths.add(resource)
+            return deps
+
+        tokens = source.parsed.tokens
+        for index, token in enumerate(tokens):
+            if token.kind == STRING:
+                _add_string_reference(deps, token.value)
+            elif token.kind == NAME:
+                target = self.names.get(token.value)
+                if target is not None and target != rel_path:
+                    deps.paths.add(target)
+                if (token.value in LOAD_FUNCTIONS and index + 2 < len(tokens)
+                        and tokens[index + 1].value == "(" and tokens[index + 2].kind != STRING):
+                    deps.dynamic = True
+        return deps
+
+    def _walk(self, test: Path) -> TestDependencies:
+        result = TestDependencies(test)
+        pending = [test]
+        seen = {test}
+        while pending:
+            deps = self.direct(pending.pop())
+            result.prefixes |= deps.prefixes
+            result.dynamic = result.dynamic or deps.dynamic
+            for path in deps.paths:
+                if path not in seen:
+                    seen.add(path)
+                    result.paths.add(path)
+                    pending.append(path)
+        return result
+
+    def affected_tests(self, changed: Iterable[Path]) -> List[Path]:
+        """Test files affected by any of `changed`, in path order."""
+        changed = list(changed)
+        return sorted(test for test, deps in self.tests.items()
+                      if any(deps.affected_by(path) for path in changed))
+
+
+def _add_string_reference(deps: FileDependencies, literal: str) -> None:
+    value = literal.lstrip("&^rR").strip("\"'")
+    if not value.startswith("res://"):
+        return
+    path = value[len("res://"):]
+    if not path:
+        deps.dynamic = True  # "res://" + anything
+    elif "%" in path or "{" in path or path.endswith("/"):
+        # Built at runtime: depend on the directory it loads from
+        prefix = path.split("%", 1)[0].split("{", 1)[0]
+        deps.prefixes.add(prefix[:prefix.rfind("/") + 1])
+    else:
+        deps.paths.add(Path(path))
+
+
+def _resource_paths(source: SourceFile) -> Set[Path]:
+    if source.suffix == ".tscn":
+        return {Path(r.path[len("res://"):]) for r in source.scene.ext_resources.values()
+                if r.path.startswith("res://")}
+    deps = FileDependencies()
+    for line in source.lines:
+        if "res://" in line:
+            for part in line.split('"'):
+                _add_string_reference(deps, f'"{part}"')
+    return deps.paths
+
+
+def full_suite_reason(changed: Iterable[Path]) -> Optional[str]:
+    """Why `changed` needs the whole suite, or None if impact analysis applies."""
+    for path in changed:
+        if path in GLOBAL_FILES:
+            return f"{path} changed"
+        if any(path.parts[:len(d.parts)] == d.parts for d in GLOBAL_DIRS):
+            return f"{path} changed (test framework)"
+        if path.parts[:len(TEST_DIR.parts)] == TEST_DIR.parts and path.suffix == ".gd" \
+                and not path.name.endswith("_test.gd"):
+            return f"{path} changed (shared test helper)"
+    return None
+
+
+def select_tests(model: ProjectModel, changed: Optional[Iterable[Path]] = None,
+                 full: bool = False) -> Tuple[Optional[List[Path]], str]:
+    """
+    Test files to run for `changed` (default: staged files).
+
+    Returns: (tests, reason) - tests is None for the whole suite
+    """
+    if full:
+        return None, "--full"
+    if changed is None:
+        changed = staged_paths(model.root)
+        if not changed:
+            return None, "nothing staged"
+    changed = [Path(path) for path in changed]
+
+    reason = full_suite_reason(changed)
+    if reason is not None:
+        return None, reason
+
+    tests = TestImpactMap(model).affected_tests(changed)
+    return tests, f"{len(changed)} changed file(s) affect {len(tests)} test file(s)"
+
+
+def to_res_path(rel_path: Path) -> str:
+    return f"res://{rel_path.as_posix()}"
+
+
+def main(model: Optional[ProjectModel] = None, argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Show the GUT tests affected by a change")
+    parser.add_argument('files', nargs='*', type=Path, help='Changed files (default: staged files)')
+    parser.add_argument('--map', action='store_true', help='Print every test file with its dependencies')
+    args = parser.parse_args(argv)
+
+    model = model or load_project_model(PROJECT_ROOT)
+
+    if args.map:
+        impact = TestImpactMap(model)
+        for test, deps in sorted(impact.tests.items()):
+            flag = f" {YELLOW}(dynamic loads){NC}" if deps.dynamic else ""
+            print(f"{CYAN}{test}{NC}: {len(deps.paths)} file(s){flag}")
+            for path in sorted(deps.paths):
+                print(f"    {path}")
+            for prefix in sorted(deps.prefixes):
+                print(f"    {prefix}*")
+        return 0
+
+    tests, reason = select_tests(model, args.files or None)
+    if tests is None:
+        print(f"{YELLOW}Full suite: {reason}{NC}")
+        return 0
+
+    print(f"{CYAN}{reason}{NC}")
+    for test in tests:
+        print(f"  {to_res_path(test)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,12 +6,21 @@ Validates that test files only call methods and signals that actually exist
 in the service implementations. Prevents tests from calling non-existent APIs.
 
 Runs during pre-commit to catch errors before they're committed.
+
+Usage:
+    python3 .system/validators/test_method_validator.py              # Validate
+    python3 .system/validators/test_method_validator.py --benchmark  # Matcher scaling
 """
 
+import argparse
 import re
 import sys
+import time
 from pathlib import Path
-from typing import Dict, List, Set, Tuple
+from typing import Dict, List, Set, Tuple, Optional
+
+from project_model import ProjectModel, SourceFile, load_project_model
+from validator_cache import ResultCache, dependency_digest
 
 # ANSI colors
 RED = '\033[0;31m'
@@ -19,37 +28,27 @@ GREEN = '\033[0;32m'
 YELLOW = '\033[1;33m'
 NC = '\033[0m'
 
-PROJECT_ROOT = Path(__file__).parent.parent.parent
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
 
 
-def discover_service_files() -> List[Path]:
+def discover_service_files(model: ProjectModel) -> List[SourceFile]:
     """Auto-discover all service and system files"""
     service_files = []
 
     # Find all *_service.gd files in scripts/services/
-    services_dir = PROJECT_ROOT / "scripts" / "services"
-    if services_dir.exists():
-        service_files.extend(services_dir.glob("*_service.gd"))
+    service_files.extend(model.glob("scripts/services/*_service.gd"))
 
     # Find all *_system.gd and *_manager.gd files in scripts/systems/
-    systems_dir = PROJECT_ROOT / "scripts" / "systems"
-    if systems_dir.exists():
-        service_files.extend(systems_dir.glob("*_system.gd"))
-        service_files.extend(systems_dir.glob("*_manager.gd"))
+    service_files.extend(model.glob("scripts/systems/*_system.gd"))
+    service_files.extend(model.glob("scripts/systems/*_manager.gd"))
 
-    return sorted(service_files)
+    return sorted(service_files, key=lambda source: source.path)
 
 
-def discover_test_files() -> List[Path]:
+def discover_test_files(model: ProjectModel) -> List[SourceFile]:
     """Auto-discover all test files"""
-    test_files = []
-
     # Find all *_test.gd files in scripts/tests/
-    tests_dir = PROJECT_ROOT / "scripts" / "tests"
-    if tests_dir.exists():
-        test_files.extend(tests_dir.glob("*_test.gd"))
-
-    return sorted(test_files)
+    return model.glob("scripts/tests/*_test.gd")
 
 
 class ServiceAPI:
@@ -64,10 +63,10 @@ class ServiceAPI:
         self.properties: Set[str] = set()
 
 
-def extract_service_api(file_path: Path) -> ServiceAPI:
+def extract_service_api(source: SourceFile) -> ServiceAPI:
     """Extract the public API from a service file"""
 
-    service_name = file_path.stem
+    service_name = source.path.stem
     # Convert snake_case to PascalCase for service name
     service_name = ''.join(word.capitalize() for word in service_name.split('_'))
 
@@ -80,11 +79,7 @@ def extract_service_api(file_path: Path) -> ServiceAPI:
     # See: https://docs.godotengine.org/en/stable/tutorials/scripting/gdscript/gdscript_basics.html
     api.methods.add('new')
 
-    if not file_path.exists():
-        return api
-
-    content = file_path.read_text()
-    lines = content.split('\n')
+    lines = source.lines
 
     # Track if we're inside an enum
     current_enum = None
@@ -142,67 +137,117 @@ def extract_service_api(file_path: Path) -> ServiceAPI:
     return api
 
 
-def find_method_calls(file_path: Path, service_apis: Dict[str, ServiceAPI]) -> List[Tuple[int, str, str, str]]:
+# Member access on a service: `Service.member(` (method call) or
+# `Service.member.connect(` / `.disconnect(` (signal connection)
+MEMBER_PATTERN = r'\.([a-zA-Z_][a-zA-Z0-9_]*)(?:\s*(\()|\.(?:connect|disconnect)\s*\()'
+
+
+def _trie_pattern(names: List[str]) -> str:
     """
-    Find all service method calls in a test file.
-    Returns: List of (line_number, service_name, method_name, full_line)
+    Regex alternation for `names` factored into a prefix trie
+    (e.g. Wave(?:Manager|System)), so matching at a position costs
+    O(name length) instead of trying every service name in turn.
     """
+    trie: Dict[str, dict] = {}
+    for name in names:
+        node = trie
+        for char in name:
+            node = node.setdefault(char, {})
+        node[''] = {}  # End of a name
+
+    def build(node: Dict[str, dict]) -> str:
+        branches = []
+        optional = False
+        for char in sorted(node):
+            if char == '':
+                optional = True
+            else:
+                branches.append(re.escape(char) + build(node[char]))
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        if optional:
+            return f"(?:{body})?"
+        return body
 
-    if not file_path.exists():
-        return []
-
-    content = file_path.read_text()
-    lines = content.split('\n')
+    return build(trie)
 
-    calls = []
 
-    for i, line in enumerate(lines, start=1):
-        # Find ServiceName.method_name() patterns
-        for service_name in service_apis.keys():
-            # Match: ServiceName.method_name(
-            pattern = rf'{service_name}\.([a-zA-Z_][a-zA-Z0-9_]*)\s*\('
-            matches = re.finditer(pattern, line)
-            for match in matches:
-                method_name = match.group(1)
-                calls.append((i, service_name, method_name, line.strip()))
+class ServiceCallMatcher:
+    """
+    Finds every `Service.method(` and `Service.signal.connect(` in one pass
+    per file using a single precompiled pattern over all service names.
 
-    return calls
+    Matches are searched at every position (zero-width lookahead), so a
+    service name embedded in a longer identifier is still reported, exactly
+    as the old per-service patterns did.
+    """
+    _cache: Dict[Tuple[str, ...], "ServiceCallMatcher"] = {}
+
+    def __init__(self, service_names: List[str]):
+        self.service_names = list(service_names)
+        self.order = {name: index for index, name in enumerate(self.service_names)}
+        names = sorted(set(self.service_names))
+        pattern = f"(?=({_trie_pattern(names)}){MEMBER_PATTERN})" if names else r"(?!)"
+        self.pattern = re.compile(pattern)
+
+    @classmethod
+    def for_services(cls, service_names: List[str]) -> "ServiceCallMatcher":
+        """Matcher for this service set, compiled once per run."""
+        key = tuple(service_names)
+        if key not in cls._cache:
+            cls._cache[key] = cls(service_names)
+        return cls._cache[key]
+
+    def scan(self, source: SourceFile) -> Tuple[List[Tuple[int, str, str, str]], List[Tuple[int, str, str, str]]]:
+        """
+        Returns: (method_calls, signal_connections), each a list of
+        (line_number, service_name, member_name, full_line)
+        """
+        calls = []
+        connections = []
+        search = self.pattern.finditer
+
+        for i, line in enumerate(source.lines, start=1):
+            if '.' not in line:
+                continue
+            line_calls = []
+            line_connections = []
+            for match in search(line):
+                service_name, member_name, call_paren = match.group(1), match.group(2), match.group(3)
+                key = (self.order[service_name], match.start())
+                if call_paren:
+                    line_calls.append((key, service_name, member_name))
+                else:
+                    line_connections.append((key, service_name, member_name))
+
+            # Report in service order, like the old per-service loop
+            stripped = line.strip()
+            for _, service_name, member_name in sorted(line_calls):
+                calls.append((i, service_name, member_name, stripped))
+            for _, service_name, member_name in sorted(line_connections):
+                connections.append((i, service_name, member_name, stripped))
+
+        return calls, connections
+
+
+def find_method_calls(source: SourceFile, service_apis: Dict[str, ServiceAPI]) -> List[Tuple[int, str, str, str]]:
+    """
+    Find all service method calls in a test file.
+    Returns: List of (line_number, service_name, method_name, full_line)
+    """
+    return ServiceCallMatcher.for_services(list(service_apis.keys())).scan(source)[0]
 
 
-def find_signal_connections(file_path: Path, service_apis: Dict[str, ServiceAPI]) -> List[Tuple[int, str, str, str]]:
+def find_signal_connections(source: SourceFile, service_apis: Dict[str, ServiceAPI]) -> List[Tuple[int, str, str, str]]:
     """
     Find all signal connections in a test file.
     Returns: List of (line_number, service_name, signal_name, full_line)
     """
+    return ServiceCallMatcher.for_services(list(service_apis.keys())).scan(source)[1]
 
-    if not file_path.exists():
-        return []
-
-    content = file_path.read_text()
-    lines = content.split('\n')
-
-    connections = []
-
-    for i, line in enumerate(lines, start=1):
-        # Find ServiceName.signal_name.connect( patterns
-        for service_name in service_apis.keys():
-            pattern = rf'{service_name}\.([a-zA-Z_][a-zA-Z0-9_]*)\.connect\s*\('
-            matches = re.finditer(pattern, line)
-            for match in matches:
-                signal_name = match.group(1)
-                connections.append((i, service_name, signal_name, line.strip()))
-
-            # Also check for .disconnect(
-            pattern = rf'{service_name}\.([a-zA-Z_][a-zA-Z0-9_]*)\.disconnect\s*\('
-            matches = re.finditer(pattern, line)
-            for match in matches:
-                signal_name = match.group(1)
-                connections.append((i, service_name, signal_name, line.strip()))
 
-    return connections
-
-
-def validate_test_file(test_file: Path, service_apis: Dict[str, ServiceAPI]) -> List[str]:
+def validate_test_file(test_file: SourceFile, service_apis: Dict[str, ServiceAPI]) -> List[str]:
     """
     Validate a test file against service APIs.
     Returns: List of error messages
@@ -210,8 +255,11 @@ def validate_test_file(test_file: Path, service_apis: Dict[str, ServiceAPI]) ->
 
     errors = []
 
+    # One pass over the file finds both method calls and signal connections
+    matcher = ServiceCallMatcher.for_services(list(service_apis.keys()))
+    method_calls, signal_connections = matcher.scan(test_file)
+
     # Check method calls
-    method_calls = find_method_calls(test_file, service_apis)
     for line_num, service_name, method_name, full_line in method_calls:
         api = service_apis.get(service_name)
         if api and method_name not in api.methods and method_name not in api.properties:
@@ -222,7 +270,6 @@ def validate_test_file(test_file: Path, service_apis: Dict[str, ServiceAPI]) ->
             )
 
     # Check signal connections
-    signal_connections = find_signal_connections(test_file, service_apis)
     for line_num, service_name, signal_name, full_line in signal_connections:
         api = service_apis.get(service_name)
         if api and signal_name not in api.signals:
@@ -235,15 +282,75 @@ def validate_test_file(test_file: Path, service_apis: Dict[str, ServiceAPI]) ->
     return errors
 
 
-def main():
+def _naive_scan(source: SourceFile, service_names: List[str]) -> int:
+    """Reference implementation (one regex per service per line) for --benchmark."""
+    found = 0
+    for line in source.lines:
+        for service_name in service_names:
+            found += len(re.findall(rf'{service_name}\.([a-zA-Z_][a-zA-Z0-9_]*)\s*\(', line))
+            found += len(re.findall(rf'{service_name}\.([a-zA-Z_][a-zA-Z0-9_]*)\.connect\s*\(', line))
+            found += len(re.findall(rf'{service_name}\.([a-zA-Z_][a-zA-Z0-9_]*)\.disconnect\s*\(', line))
+    return found
+
+
+def run_benchmark(model: ProjectModel) -> int:
+    """
+    Time the per-service regex loop against ServiceCallMatcher over the real
+    test files while padding the service list with synthetic names.
+    """
+    service_names = [extract_service_api(f).name for f in discover_service_files(model)]
+    test_files = discover_test_files(model)
+    line_count = sum(len(f.lines) for f in test_files)
+
+    print(f"Benchmark: {len(test_files)} test files, {line_count} lines")
+    print(f"  {'services':>8}  {'per-service':>12}  {'combined':>10}  {'speedup':>8}")
+
+    # Stops at 100: beyond that the per-service loop outgrows re's compiled
+    # pattern cache and recompiles on every line (minutes per run)
+    for count in [len(service_names), 25, 50, 100]:
+        names = service_names + [f"Synthetic{i}Service" for i in range(max(count - len(service_names), 0))]
+
+        start = time.perf_counter()
+        naive_found = sum(_naive_scan(f, names) for f in test_files)
+        naive_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        matcher = ServiceCallMatcher(names)  # Include compile time
+        combined_found = 0
+        for f in test_files:
+            calls, connections = matcher.scan(f)
+            combined_found += len(calls) + len(connections)
+        combined_elapsed = time.perf_counter() - start
+
+        if naive_found != combined_found:
+            print(f"{RED}❌ Match count differs at {count} services: {naive_found} vs {combined_found}{NC}")
+            return 1
+
+        speedup = naive_elapsed / combined_elapsed if combined_elapsed else float('inf')
+        print(f"  {len(names):>8}  {naive_elapsed * 1000:>9.1f} ms  {combined_elapsed * 1000:>7.1f} ms  {speedup:>7.1f}x")
+
+    return 0
+
+
+def main(model: Optional[ProjectModel] = None):
     """Main validation logic"""
 
+    parser = argparse.ArgumentParser(description="Validate test method calls against service APIs")
+    parser.add_argument('--benchmark', action='store_true',
+                        help='Compare the combined matcher with the per-service regex loop and exit')
+    args = parser.parse_args()
+
+    model = model or load_project_model(PROJECT_ROOT)
+
+    if args.benchmark:
+        return run_benchmark(model)
+
     print("Validating test method calls against service APIs...")
     print()
 
     # Auto-discover service and test files
-    service_files = discover_service_files()
-    test_files = discover_test_files()
+    service_files = discover_service_files(model)
+    test_files = discover_test_files(model)
 
     # Extract service APIs
     service_apis = {}
@@ -257,11 +364,17 @@ def main():
         print(f"  • {name}: {len(api.methods)} methods, {len(api.signals)} signals")
     print()
 
-    # Validate each test file
+    # Validate each test file (cached results depend on every service's API)
+    cache = ResultCache("test_method_validator", Path(__file__))
+    services_digest = dependency_digest(service_files)
     all_errors = []
     for file_path in test_files:
-        errors = validate_test_file(file_path, service_apis)
+        errors = cache.lookup(file_path, deps=services_digest)
+        if errors is None:
+            errors = validate_test_file(file_path, service_apis)
+            cache.store(file_path, errors, deps=services_digest)
         all_errors.extend(errors)
+    cache.save()
 
     # Report results
     if all_errors:
@@ -20,9 +20,13 @@ Exit Codes:
 import sys
 import re
 from pathlib import Path
-from typing import List, Tuple, Dict
+from typing import List, Tuple, Dict, Optional
 from collections import defaultdict
 
+from project_model import ProjectModel, SourceFile, load_project_model
+from validator_cache import ResultCache
+from file_selection import FileSelection, selection_from_argv
+
 # ANSI colors
 RED = '\033[0;31m'
 GREEN = '\033[0;32m'
@@ -30,7 +34,7 @@ YELLOW = '\033[1;33m'
 CYAN = '\033[0;36m'
 NC = '\033[0m'
 
-PROJECT_ROOT = Path(__file__).parent.parent.parent
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
 
 
 class TestPatternIssue:
@@ -387,16 +391,16 @@ def check_memory_management(content: str, lines: List[str]) -> List[TestPatternI
     return issues
 
 
-def validate_file(file_path: Path) -> List[TestPatternIssue]:
+def validate_file(source: SourceFile) -> List[TestPatternIssue]:
     """Run all test pattern checks on a file."""
     try:
-        content = file_path.read_text(encoding='utf-8')
-        lines = content.split('\n')
+        content = source.content
+        lines = source.lines
 
         all_issues = []
 
         # Run all checks
-        all_issues.extend(check_test_structure(file_path, content))
+        all_issues.extend(check_test_structure(source.path, content))
         all_issues.extend(check_test_naming_convention(content, lines))
         all_issues.extend(check_hardcoded_delays(content, lines))
         all_issues.extend(check_lifecycle_hooks(content))
@@ -406,37 +410,48 @@ def validate_file(file_path: Path) -> List[TestPatternIssue]:
         return all_issues
 
     except Exception as e:
-        print(f"{YELLOW}⚠️  Could not read {file_path}: {e}{NC}")
+        print(f"{YELLOW}⚠️  Could not check {source.path}: {e}{NC}")
         return []
 
 
-def main():
+def main(model: Optional[ProjectModel] = None, selection: Optional[FileSelection] = None):
     """Check all test files for pattern issues."""
 
     print(f"{CYAN}Checking for test pattern issues...{NC}")
 
+    model = model or load_project_model(PROJECT_ROOT)
+    selection = selection or selection_from_argv(model)
+    cache = ResultCache("test_patterns_validator", Path(__file__))
+
     file_issues: Dict[Path, List[TestPatternIssue]] = defaultdict(list)
     checked_files = 0
     error_count = 0
     warning_count = 0
 
-    # Check all *_test.gd files
-    for file in PROJECT_ROOT.rglob("*_test.gd"):
-        # Skip files in addons
-        if "addons" in file.parts:
+    # Check all *_test.gd files (addons/ excluded by the model)
+    for source in model.gd_files():
+        if not source.name.endswith("_test.gd"):
+            continue
+
+        if not selection.includes(source):
             continue
 
         checked_files += 1
-        issues = validate_file(file)
+        issues = cache.lookup(source, TestPatternIssue)
+        if issues is None:
+            issues = validate_file(source)
+            cache.store(source, issues)
 
         if issues:
-            file_issues[file] = issues
+            file_issues[source.path] = issues
             for issue in issues:
                 if issue.severity == "error":
                     error_count += 1
                 else:
                     warning_count += 1
 
+    cache.save(prune=selection.full)
+
     # Report results
     if not file_issues:
         print(f"{GREEN}✅ No test pattern issues detected ({checked_files} test files checked){NC}")
@@ -17,33 +17,44 @@ import argparse
 import re
 import sys
 from pathlib import Path
+from typing import Optional
+
+from project_model import ProjectModel, load_project_model
+from file_selection import FileSelection, add_selection_arguments, selection_from_args
 
 
 class TestQualityValidator:
-    def __init__(self, test_dir: Path, warn_only: bool = False):
+    def __init__(self, test_dir: Path, warn_only: bool = False, model: Optional[ProjectModel] = None,
+                 selection: Optional[FileSelection] = None):
         self.test_dir = test_dir
         self.warn_only = warn_only
+        self.model = model or load_project_model(test_dir.parent.parent)
+        self.selection = selection or FileSelection()
         self.errors = []
         self.warnings = []
 
     def validate_all_tests(self) -> bool:
         """Validate all test files. Returns True if all pass."""
-        test_files = list(self.test_dir.glob("*_test.gd"))
+        rel_dir = self.test_dir.resolve().relative_to(self.model.root).as_posix()
+        test_files = self.model.glob(f"{rel_dir}/*_test.gd")
 
         if not test_files:
             print("❌ No test files found")
             return False
 
+        test_files = [f for f in test_files if self.selection.includes(f)]
+
         all_valid = True
-        for test_file in sorted(test_files):
-            if not self.validate_test_file(test_file):
+        for test_file in test_files:
+            if not self.validate_test_file(test_file.path, test_file.content):
                 all_valid = False
 
         return all_valid
 
-    def validate_test_file(self, test_file: Path) -> bool:
+    def validate_test_file(self, test_file: Path, content: Optional[str] = None) -> bool:
         """Validate a single test file."""
-        content = test_file.read_text()
+        if content is None:
+            content = test_file.read_text()
         file_valid = True
 
         # Check 1: User story mapping (warn-only mode: make it a warning, not error)
@@ -164,18 +175,23 @@ class TestQualityValidator:
             print("   Remove smoke tests, add user stories, use correct patterns")
 
 
-def main():
+def main(model: Optional[ProjectModel] = None, selection: Optional[FileSelection] = None):
     parser = argparse.ArgumentParser(description="Validate GDScript test quality")
     parser.add_argument(
         '--warn-only',
         action='store_true',
         help='Report issues as warnings only (do not block commit)'
     )
+    add_selection_arguments(parser)
     args = parser.parse_args()
 
-    test_dir = Path(__file__).parent.parent.parent / "scripts" / "tests"
+    project_root = Path(__file__).resolve().parent.parent.parent
+    test_dir = project_root / "scripts" / "tests"
+
+    model = model or load_project_model(project_root)
+    selection = selection or selection_from_args(model, args)
 
-    validator = TestQualityValidator(test_dir, warn_only=args.warn_only)
+    validator = TestQualityValidator(test_dir, warn_only=args.warn_only, model=model, selection=selection)
     all_valid = validator.validate_all_tests()
     validator.print_report()
 
@@ -0,0 +1,613 @@
+#!/usr/bin/env python3
+"""
+GUT Test Results Database
+
+Reads GUT's JUnit XML report (test_results.xml) with a streaming parser into
+per-suite / per-test records, and keeps every run in a small SQLite database
+(.system/cache/test_results.db) that the test runner uses for freshness
+checks, failure reporting and timing history - instead of regex-scraping the
+console output.
+
+Tables:
+- runs:      one row per run (timestamp, scope, status, totals, wall time)
+- suites:    per test script: tests, failures, skipped, time
+- testcases: per test: status (pass/fail/pending/risky), time, assertions,
+             failure/pending message
+- failures:  per failing test: assertion text and test line (the triage
+             index used by test_triage.py)
+
+A report written outside the runner (GUT panel, manual gut_cmdln run) is
+imported the first time the database sees it.
+
+Result cache: every run stores the tree key - a digest of every script,
+scene, resource, data file and project.godot the tests can load. A passing
+run is reused for as long as the tree is byte-identical to the one it tested
+(whatever its age), and never once any of those files changed. Imported
+reports only get a key if no such file is newer than the report, and the
+report is not simply the committed test_results.xml (a fresh checkout writes
+it after the sources).
+
+Timing history: each test's and suite's rolling median over the last
+TIMING_WINDOW runs that included it. A run is flagged when a test or suite
+takes more than TIMING_TOLERANCE (50%) longer than its median, and by at least
+the minimum delta so sub-millisecond noise is ignored.
+
+Usage:
+    python3 test_results_db.py                     # Latest run
+    python3 test_results_db.py --runs 10           # Recent runs
+    python3 test_results_db.py --slowest 20        # Slowest tests by median time
+    python3 test_results_db.py --import test_results.xml
+"""
+
+import argparse
+import hashlib
+import re
+import sqlite3
+import subprocess
+import statistics
+import sys
+import time
+import xml.etree.ElementTree as ET
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from project_model import ProjectModel, SourceFile
+
+# ANSI colors
+RED = '\033[0;31m'
+GREEN = '\033[0;32m'
+YELLOW = '\033[1;33m'
+CYAN = '\033[0;36m'
+NC = '\033[0m'
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+
+TEST_RESULTS_XML = PROJECT_ROOT / "test_results.xml"
+RESULTS_DB = PROJECT_ROOT / ".system" / "cache" / "test_results.db"
+
+# Files whose contents decide a test run's outcome (tree_key)
+RESULT_KEY_SUFFIXES = [".gd", ".tscn", ".tres", ".gdshader", ".json"]
+RESULT_KEY_FILES = [Path("project.godot")]
+RESULT_KEY_SKIP_DIRS = {".godot", ".system", ".vscode"}
+
+# "  at line 50" that GUT appends to every failure
+FAILURE_LINE_PATTERN = re.compile(r'^\s*at line (-?\d+)\s*$', re.MULTILINE)
+
+# Timing history: rolling median over the last N runs containing a test
+TIMING_WINDOW = 10
+TIMING_MIN_SAMPLES = 3          # Runs needed before a median is trusted
+TIMING_TOLERANCE = 0.5          # Flag anything 50% slower than its median...
+TEST_MIN_DELTA_S = 0.05         # ...and at least this much slower (per test)
+SUITE_MIN_DELTA_S = 0.25        # (per suite)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    timestamp REAL NOT NULL,
+    scope TEXT NOT NULL,
+    status TEXT NOT NULL,
+    total INTEGER NOT NULL,
+    passed INTEGER NOT NULL,
+    failed INTEGER NOT NULL,
+    pending INTEGER NOT NULL,
+    elapsed REAL,
+    report_mtime REAL,
+    source TEXT NOT NULL DEFAULT 'junit',
+    tree_key TEXT
+);
+CREATE TABLE IF NOT EXISTS suites (
+    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    path TEXT NOT NULL,
+    tests INTEGER NOT NULL,
+    failures INTEGER NOT NULL,
+    skipped INTEGER NOT NULL,
+    time REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS testcases (
+    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    suite TEXT NOT NULL,
+    name TEXT NOT NULL,
+    status TEXT NOT NULL,
+    time REAL NOT NULL,
+    assertions INTEGER NOT NULL,
+    message TEXT
+);
+CREATE TABLE IF NOT EXISTS failures (
+    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    suite TEXT NOT NULL,
+    name TEXT NOT NULL,
+    assertion TEXT NOT NULL,
+    line INTEGER,
+    message TEXT
+);
+CREATE INDEX IF NOT EXISTS testcases_by_test ON testcases (suite, name);
+CREATE INDEX IF NOT EXISTS failures_by_test ON failures (suite, name);
+CREATE INDEX IF NOT EXISTS suites_by_path ON suites (path);
+"""
+
+# Columns added to `runs` after the first release, with their definitions
+ADDED_RUN_COLUMNS = {
+    "source": "TEXT NOT NULL DEFAULT 'junit'",
+    "tree_key": "TEXT",
+}
+
+
+class TestCaseRecord:
+    """One <testcase> of a JUnit report."""
+    __slots__ = ("suite", "name", "status", "time", "assertions", "message")
+
+    def __init__(self, suite: str, name: str, status: str, time: float, assertions: int,
+                 message: Optional[str] = None):
+        self.suite = suite            # res:// path of the test script
+        self.name = name              # Test function name
+        self.status = status          # pass | fail | pending | risky
+        self.time = time              # Seconds
+        self.assertions = assertions
+        self.message = message        # Failure or pending text (first one GUT reports)
+
+
+class SuiteRecord:
+    """One <testsuite> (test script) of a JUnit report."""
+    def __init__(self, path: str, tests: int, failures: int, skipped: int, time: float):
+        self.path = path              # res:// path of the test script
+        self.tests = tests
+        self.failures = failures
+        self.skipped = skipped
+        self.time = time
+        self.cases: List[TestCaseRecord] = []
+
+
+class TestReport:
+    """A parsed GUT JUnit report."""
+    def __init__(self, suites: List[SuiteRecord], mtime: Optional[float] = None):
+        self.suites = suites
+        self.mtime = mtime
+
+    @property
+    def cases(self) -> List[TestCaseRecord]:
+        return [case for suite in self.suites for case in suite.cases]
+
+    @property
+    def failures(self) -> List[TestCaseRecord]:
+        return [case for case in self.cases if case.status == "fail"]
+
+    def stats(self) -> Dict[str, int]:
+        """Totals in the shape godot_test_runner reports."""
+        total = sum(suite.tests for suite in self.suites)
+        failed = sum(suite.failures for suite in self.suites)
+        pending = sum(suite.skipped for suite in self.suites)
+        return {"passed": total - failed - pending, "failed": failed, "pending": pending, "total": total}
+
+
+def parse_junit(path: Path = TEST_RESULTS_XML) -> Optional[TestReport]:
+    """
+    Stream-parse a GUT JUnit report. Returns None if it is missing or not
+    a complete report (e.g. Godot crashed while writing it).
+    """
+    try:
+        mtime = path.stat().st_mtime
+    except OSError:
+        return None
+
+    suites: List[SuiteRecord] = []
+    suite: Optional[SuiteRecord] = None
+    try:
+        for event, element in ET.iterparse(path, events=("start", "end")):
+            if event == "start":
+                if element.tag == "testsuite":
+                    suite = SuiteRecord(
+                        "res://" + element.get("name", ""),
+                        _int(element.get("tests")),
+                        _int(element.get("failures")),
+                        _int(element.get("skipped")),
+                        _float(element.get("time")),
+                    )
+                    suites.append(suite)
+                continue
+
+            if element.tag == "testcase" and suite is not None:
+                detail = element.find("failure")
+                if detail is None:
+                    detail = element.find("skipped")
+                message = detail.text.strip() if detail is not None and detail.text else None
+                suite.cases.append(TestCaseRecord(
+                    suite.path,
+                    element.get("name", ""),
+                    element.get("status", "pass"),
+                    _float(element.get("time")),
+                    _int(element.get("assertions")),
+                    message,
+                ))
+                element.clear()
+            elif element.tag == "testsuite":
+                element.clear()
+    except ET.ParseError:
+        return None
+    return TestReport(suites, mtime)
+
+
+def _int(value: Optional[str]) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return 0
+
+
+def _float(value: Optional[str]) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def split_failure_message(message: Optional[str]) -> Tuple[str, Optional[int]]:
+    """
+    (assertion, line) of a GUT failure text. The assertion is its first line,
+    plus the first detail line when GUT only gives a heading
+    ("Unexpected Errors:").
+    """
+    if not message:
+        return "", None
+    lines = [line.strip() for line in FAILURE_LINE_PATTERN.sub("", message).splitlines() if line.strip()]
+    assertion = lines[0] if lines else ""
+    if assertion.endswith(":") and len(lines) > 1:
+        assertion += " " + lines[1]
+    line_matches = FAILURE_LINE_PATTERN.findall(message)
+    line = int(line_matches[-1]) if line_matches else None
+    return assertion, (line if line is not None and line >= 0 else None)
+
+
+def result_key_files(model: ProjectModel) -> List[SourceFile]:
+    """Every file a test run's outcome depends on, in path order."""
+    sources = [source for suffix in RESULT_KEY_SUFFIXES for source in model.files(suffix, include_addons=True)
+               if source.rel_path.parts[0] not in RESULT_KEY_SKIP_DIRS]
+    for rel_path in RESULT_KEY_FILES:
+        source = model.get(rel_path)
+        if source is not None:
+            sources.append(source)
+    return sorted(sources, key=lambda source: source.rel_path)
+
+
+def tree_key(sources: Iterable[SourceFile]) -> str:
+    """Digest of the paths and contents of `sources`."""
+    hasher = hashlib.sha256()
+    for source in sources:
+        hasher.update(source.rel_path.as_posix().encode('utf-8'))
+        hasher.update(b"\0")
+        hasher.update(source.digest.encode('utf-8'))
+    return hasher.hexdigest()
+
+
+def newest_mtime(sources: Iterable[SourceFile]) -> float:
+    newest = 0.0
+    for source in sources:
+        try:
+            newest = max(newest, source.path.stat().st_mtime)
+        except OSError:
+            pass
+    return newest
+
+
+def is_committed_version(path: Path) -> bool:
+    """True if `path` is tracked and identical to its committed version."""
+    try:
+        tracked = subprocess.run(["git", "ls-files", "--error-unmatch", str(path)], cwd=PROJECT_ROOT,
+                                 capture_output=True).returncode == 0
+        unchanged = subprocess.run(["git", "diff", "--quiet", "HEAD", "--", str(path)], cwd=PROJECT_ROOT,
+                                   capture_output=True).returncode == 0
+    except OSError:
+        return False
+    return tracked and unchanged
+
+
+class RunSummary:
+    """One row of the runs table."""
+    def __init__(self, row: sqlite3.Row):
+        self.id = row["id"]
+        self.timestamp = row["timestamp"]
+        self.scope = row["scope"]
+        self.status = row["status"]
+        self.total = row["total"]
+        self.passed = row["passed"]
+        self.failed = row["failed"]
+        self.pending = row["pending"]
+        self.elapsed = row["elapsed"]
+        self.report_mtime = row["report_mtime"]
+        self.source = row["source"]           # junit | console
+        self.tree_key = row["tree_key"]       # None: tree not known (imported report)
+
+    @property
+    def when(self) -> str:
+        return datetime.fromtimestamp(self.timestamp).strftime('%Y-%m-%d %H:%M:%S')
+
+    def stats(self) -> Dict[str, str]:
+        """The keys test_results.txt carries."""
+        return {
+            "timestamp": self.when,
+            "passed": str(self.passed),
+            "failed": str(self.failed),
+            "total": str(self.total),
+            "status": self.status,
+            "scope": self.scope,
+        }
+
+
+class TimingRegression:
+    """A test or suite that ran slower than its rolling median."""
+    def __init__(self, kind: str, name: str, current: float, median: float, samples: int):
+        self.kind = kind          # "test" or "suite"
+        self.name = name          # "res://...::test_name" or "res://..."
+        self.current = current
+        self.median = median
+        self.samples = samples
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.median if self.median else float("inf")
+
+
+class ResultsDatabase:
+    """The SQLite store of GUT runs."""
+    def __init__(self, path: Path = RESULTS_DB):
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(str(path))
+        self.connection.row_factory = sqlite3.Row
+        self.connection.execute("PRAGMA foreign_keys = ON")
+        self.connection.executescript(SCHEMA)
+        columns = {row["name"] for row in self.connection.execute("PRAGMA table_info(runs)")}
+        for column, definition in ADDED_RUN_COLUMNS.items():
+            if column not in columns:  # Database written by an older runner
+                self.connection.execute(f"ALTER TABLE runs ADD COLUMN {column} {definition}")
+        self.connection.execute("CREATE INDEX IF NOT EXISTS runs_by_tree ON runs (tree_key)")
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def __enter__(self) -> "ResultsDatabase":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def record_run(self, report: TestReport, scope: str, status: str,
+                   elapsed: Optional[float] = None, timestamp: Optional[float] = None,
+                   stats: Optional[Dict[str, int]] = None, source: str = "junit",
+                   key: Optional[str] = None) -> int:
+        """
+        Store a run with all its suites, test cases and failures; returns the
+        run id. A "console" report (failures read from GUT's console summary)
+        only has its failures stored, with `stats` giving the totals. `key`
+        is the tree_key of the files the run tested.
+        """
+        stats = stats or report.stats()
+        with self.connection:
+            cursor = self.connection.execute(
+                "INSERT INTO runs (timestamp, scope, status, total, passed, failed, pending, elapsed,"
+                " report_mtime, source, tree_key) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (timestamp or time.time(), scope, status, stats["total"], stats["passed"],
+                 stats["failed"], stats.get("pending", 0), elapsed, report.mtime, source, key)
+            )
+            run_id = cursor.lastrowid
+            self.connection.executemany(
+                "INSERT INTO failures (run_id, suite, name, assertion, line, message) VALUES (?, ?, ?, ?, ?, ?)",
+                [(run_id, c.suite, c.name, *split_failure_message(c.message), c.message) for c in report.failures]
+            )
+            if source != "junit":
+                return run_id
+            self.connection.executemany(
+                "INSERT INTO suites (run_id, path, tests, failures, skipped, time) VALUES (?, ?, ?, ?, ?, ?)",
+                [(run_id, s.path, s.tests, s.failures, s.skipped, s.time) for s in report.suites]
+            )
+            self.connection.executemany(
+                "INSERT INTO testcases (run_id, suite, name, status, time, assertions, message)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [(run_id, c.suite, c.name, c.status, c.time, c.assertions, c.message) for c in report.cases]
+            )
+        return run_id
+
+    def latest_run(self) -> Optional[RunSummary]:
+        row = self.connection.execute("SELECT * FROM runs ORDER BY id DESC LIMIT 1").fetchone()
+        return RunSummary(row) if row else None
+
+    def recent_runs(self, limit: int) -> List[RunSummary]:
+        rows = self.connection.execute("SELECT * FROM runs ORDER BY id DESC LIMIT ?", (limit,)).fetchall()
+        return [RunSummary(row) for row in rows]
+
+    def failures(self, run_id: int) -> List[sqlite3.Row]:
+        """Failures of a run (suite, name, assertion, line, message), in suite order."""
+        return self.connection.execute(
+            "SELECT suite, name, assertion, line, message FROM failures WHERE run_id = ?"
+            " ORDER BY suite, rowid", (run_id,)
+        ).fetchall()
+
+    def cached_run(self, key: str, tests: List[str], status: str = "PASS") -> Optional[RunSummary]:
+        """
+        Latest run with `status` that tested exactly this tree (`key`) and
+        covered every one of `tests` (res:// paths).
+        """
+        wanted = set(tests)
+        for row in self.connection.execute(
+                "SELECT * FROM runs WHERE tree_key = ? AND status = ? ORDER BY id DESC", (key, status)):
+            run = RunSummary(row)
+            if run.scope == "full":
+                return run
+            covered = {path for (path,) in self.connection.execute(
+                "SELECT path FROM suites WHERE run_id = ?", (run.id,))}
+            if wanted <= covered:
+                return run
+        return None
+
+    def test_times(self, before_run: Optional[int] = None,
+                   window: int = TIMING_WINDOW) -> Dict[Tuple[str, str], List[float]]:
+        """(suite, test) -> times of its last `window` runs (before `before_run`)."""
+        rows = self.connection.execute(
+            "SELECT suite, name, time FROM ("
+            "  SELECT suite, name, time, ROW_NUMBER() OVER"
+            "    (PARTITION BY suite, name ORDER BY run_id DESC) AS recent"
+            "  FROM testcases WHERE run_id < ? AND status != 'pending'"
+            ") WHERE recent <= ?",
+            (before_run if before_run is not None else 2 ** 62, window)
+        )
+        times: Dict[Tuple[str, str], List[float]] = {}
+        for suite, name, seconds in rows:
+            times.setdefault((suite, name), []).append(seconds)
+        return times
+
+    def suite_times(self, before_run: Optional[int] = None,
+                    window: int = TIMING_WINDOW) -> Dict[str, List[float]]:
+        """Suite path -> times of its last `window` runs (before `before_run`)."""
+        rows = self.connection.execute(
+            "SELECT path, time FROM ("
+            "  SELECT path, time, ROW_NUMBER() OVER (PARTITION BY path ORDER BY run_id DESC) AS recent"
+            "  FROM suites WHERE run_id < ?"
+            ") WHERE recent <= ?",
+            (before_run if before_run is not None else 2 ** 62, window)
+        )
+        times: Dict[str, List[float]] = {}
+        for path, seconds in rows:
+            times.setdefault(path, []).append(seconds)
+        return times
+
+    def suite_durations(self) -> Dict[str, float]:
+        """Suite path -> median time (for balancing shards)."""
+        return {path: statistics.median(times) for path, times in self.suite_times().items()}
+
+    def timing_regressions(self, run_id: int, tolerance: float = TIMING_TOLERANCE) -> List[TimingRegression]:
+        """Tests and suites of `run_id` that ran slower than their median, slowest first."""
+        regressions = []
+
+        history = self.suite_times(before_run=run_id)
+        for path, seconds in self.connection.execute(
+                "SELECT path, time FROM suites WHERE run_id = ?", (run_id,)):
+            regression = _regression("suite", path, seconds, history.get(path, []),
+                                     tolerance, SUITE_MIN_DELTA_S)
+            if regression:
+                regressions.append(regression)
+
+        history = self.test_times(before_run=run_id)
+        for suite, name, seconds in self.connection.execute(
+                "SELECT suite, name, time FROM testcases WHERE run_id = ? AND status != 'pending'", (run_id,)):
+            regression = _regression("test", f"{suite}::{name}", seconds, history.get((suite, name), []),
+                                     tolerance, TEST_MIN_DELTA_S)
+            if regression:
+                regressions.append(regression)
+
+        return sorted(regressions, key=lambda r: -(r.current - r.median))
+
+    def slowest_tests(self, limit: int) -> List[Tuple[str, float, float, int]]:
+        """[(suite::test, median, max, samples)] of the `limit` slowest tests by median."""
+        ranked = []
+        for (suite, name), times in self.test_times().items():
+            ranked.append((f"{suite}::{name}", statistics.median(times), max(times), len(times)))
+        ranked.sort(key=lambda entry: -entry[1])
+        return ranked[:limit]
+
+    def import_report(self, path: Path = TEST_RESULTS_XML, scope: str = "external",
+                      model: Optional[ProjectModel] = None) -> Optional[int]:
+        """
+        Record a report written outside the runner (GUT panel, manual run),
+        unless it is already in the database. Returns the new run id.
+
+        With `model`, the run is keyed to the current tree when no file it
+        depends on changed after the report was written and the report is
+        not the committed one.
+        """
+        try:
+            mtime = path.stat().st_mtime
+        except OSError:
+            return None
+        if self.connection.execute("SELECT 1 FROM runs WHERE report_mtime = ?", (mtime,)).fetchone():
+            return None
+        report = parse_junit(path)
+        if report is None or not report.suites:
+            return None
+        status = "PASS" if report.stats()["failed"] == 0 else "FAIL"
+        key = None
+        if model is not None:
+            sources = result_key_files(model)
+            if newest_mtime(sources) <= mtime and not is_committed_version(path):
+                key = tree_key(sources)
+        return self.record_run(report, scope, status, timestamp=mtime, key=key)
+
+
+def _regression(kind: str, name: str, current: float, history: List[float],
+                tolerance: float, min_delta: float) -> Optional[TimingRegression]:
+    if len(history) < TIMING_MIN_SAMPLES:
+        return None
+    median = statistics.median(history)
+    if current - median >= min_delta and current > median * (1 + tolerance):
+        return TimingRegression(kind, name, current, median, len(history))
+    return None
+
+
+def print_timing_regressions(regressions: List[TimingRegression], limit: int = 10) -> None:
+    print(f"{YELLOW}⏱️  {len(regressions)} test(s)/suite(s) slower than their median "
+          f"of the last {TIMING_WINDOW} runs:{NC}")
+    for regression in regressions[:limit]:
+        print(f"  {regression.kind:5} {regression.name}: {regression.current * 1000:.0f} ms "
+              f"(median {regression.median * 1000:.0f} ms, {regression.ratio:.1f}x)")
+    if len(regressions) > limit:
+        print(f"  ... and {len(regressions) - limit} more")
+
+
+def print_slowest(db: "ResultsDatabase", limit: int) -> None:
+    slowest = db.slowest_tests(limit)
+    if not slowest:
+        print(f"{YELLOW}No recorded test timings{NC}")
+        return
+    print(f"{CYAN}Slowest {len(slowest)} test(s) (median of the last {TIMING_WINDOW} runs):{NC}")
+    for name, median, worst, samples in slowest:
+        print(f"  {median * 1000:8.1f} ms  (max {worst * 1000:.1f} ms, {samples} run(s))  {name}")
+    suites = sorted(db.suite_durations().items(), key=lambda entry: -entry[1])
+    total = sum(seconds for _, seconds in suites)
+    print(f"{CYAN}Suite total (medians): {total:.2f}s over {len(suites)} suite(s){NC}")
+
+
+def print_run(db: ResultsDatabase, run: RunSummary) -> None:
+    color = GREEN if run.status == "PASS" else RED
+    elapsed = f" in {run.elapsed:.1f}s" if run.elapsed else ""
+    print(f"{color}#{run.id} {run.when} {run.status}{NC} "
+          f"{run.passed}/{run.total} passed, {run.failed} failed, {run.pending} pending "
+          f"({run.scope}){elapsed}")
+    for failure in db.failures(run.id):
+        line = f" (line {failure['line']})" if failure["line"] is not None else ""
+        print(f"  {RED}✗{NC} {failure['suite']}::{failure['name']}{line}")
+        if failure["assertion"]:
+            print(f"      {failure['assertion']}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Show recorded GUT runs")
+    parser.add_argument('--runs', type=int, default=1, help='Number of recent runs to show')
+    parser.add_argument('--import', dest='import_path', type=Path, help='Record a JUnit report')
+    parser.add_argument('--slowest', type=int, metavar='N', help='Show the N slowest tests by median time')
+    args = parser.parse_args(argv)
+
+    with ResultsDatabase() as db:
+        if args.slowest:
+            db.import_report()
+            print_slowest(db, args.slowest)
+            return 0
+
+        if args.import_path:
+            run_id = db.import_report(args.import_path.resolve(), scope="import")
+            if run_id is None:
+                print(f"{YELLOW}⚠️  Nothing imported (missing, unreadable or already recorded){NC}")
+                return 1
+            print(f"{GREEN}✓ Imported {args.import_path} as run #{run_id}{NC}")
+            return 0
+
+        db.import_report()
+        runs = db.recent_runs(args.runs)
+        if not runs:
+            print(f"{YELLOW}No recorded test runs{NC}")
+            return 0
+        for run in runs:
+            print_run(db, run)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""
+GUT Failure Triage
+
+Classifies the failures of the latest test run against the failure index in
+the results database (test_results_db.py), so a failing hook can be triaged
+without grepping hundreds of KB of GUT output:
+
+- new:       failing now, never failed in an earlier recorded run
+- recurring: failing now and failed before (how often, since when, and
+             whether the assertion changed)
+- fixed:     failed the last time it ran, passes now
+- flaky:     flipped between pass and fail at least FLAKY_MIN_FLIPS times
+             within the last TRIAGE_WINDOW runs that included it
+
+Runs whose JUnit report is missing (Godot crashed or timed out) are indexed
+from the "Run Summary" section of GUT's console output instead; old console
+logs such as test_full_output.txt can be imported the same way.
+
+Usage:
+    python3 test_triage.py                              # Triage the latest run
+    python3 test_triage.py --import-log test_full_output.txt
+"""
+
+import argparse
+import re
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from test_results_db import ResultsDatabase, RunSummary, SuiteRecord, TestCaseRecord, TestReport
+
+# ANSI colors
+RED = '\033[0;31m'
+GREEN = '\033[0;32m'
+YELLOW = '\033[1;33m'
+CYAN = '\033[0;36m'
+NC = '\033[0m'
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+
+# Runs considered when looking for tests that flip between pass and fail
+TRIAGE_WINDOW = 20
+FLAKY_MIN_FLIPS = 2
+
+ANSI_PATTERN = re.compile(r'\x1b\[[0-9;]*m')
+SUMMARY_HEADING = "= Run Summary"
+SUMMARY_END = "Totals"
+
+TestKey = Tuple[str, str]   # (suite res:// path, test name)
+
+
+def parse_gut_stats(output: str) -> dict:
+    """Totals from GUT's console summary (fallback when no JUnit report was written)."""
+    # Parse GUT output for test statistics
+    # GUT prints totals section like:
+    # Tests               411
+    # Passing Tests       393
+    # Risky/Pending        18
+    stats = {"passed": 0, "failed": 0, "total": 0}
+
+    # Look for GUT's totals section
+    total_match = re.search(r'Tests\s+(\d+)', output)
+    passed_match = re.search(r'Passing Tests\s+(\d+)', output)
+    pending_match = re.search(r'Risky/Pending\s+(\d+)', output)
+
+    if total_match and passed_match:
+        stats["total"] = int(total_match.group(1))
+        stats["passed"] = int(passed_match.group(1))
+
+        # Calculate failed tests (exclude pending/risky tests)
+        # Failed = Total - Passing - Pending
+        pending = int(pending_match.group(1)) if pending_match else 0
+        stats["failed"] = stats["total"] - stats["passed"] - pending
+    elif passed_match:  # Fallback: only "Passing Tests" found
+        stats["passed"] = int(passed_match.group(1))
+        stats["total"] = stats["passed"]  # Assume all tests passed
+        stats["failed"] = 0
+
+    return stats
+
+
+def parse_gut_console(output: str) -> TestReport:
+    """
+    Failing and pending tests from the "Run Summary" section GUT prints at
+    the end of a run:
+
+        res://scripts/tests/entity_classes_test.gd
+        - test_player_initial_max_health_is_100
+            [Failed]:  Unexpected Errors:
+            ...
+                  at line 50
+    """
+    text = ANSI_PATTERN.sub("", output)
+    start = text.rfind(SUMMARY_HEADING)
+    suites: Dict[str, SuiteRecord] = {}
+    if start < 0:
+        return TestReport([])
+
+    suite: Optional[SuiteRecord] = None
+    case: Optional[TestCaseRecord] = None
+    details: List[str] = []
+    collecting = False      # Inside the first [Failed] text of the current test
+
+    def finish_case() -> None:
+        if case is not None and details:
+            case.message = "\n".join(details)
+        details.clear()
+
+    for raw in text[start + len(SUMMARY_HEADING):].splitlines():
+        line = raw.strip()
+        if line == SUMMARY_END:
+            break
+        if line.startswith("res://"):
+            finish_case()
+            case = None
+            collecting = False
+            suite = suites.setdefault(line, SuiteRecord(line, 0, 0, 0, 0.0))
+        elif line.startswith("- ") and suite is not None:
+            finish_case()
+            collecting = False
+            case = TestCaseRecord(suite.path, line[2:].strip(), "pass", 0.0, 0)
+            suite.cases.append(case)
+            suite.tests += 1
+        elif case is not None and line:
+            if line.startswith("[Failed]:"):
+                collecting = case.status != "fail"
+                if collecting:
+                    if case.status == "pending":
+                        suite.skipped -= 1
+                    details.clear()  # Keep the first failure, as the JUnit export does
+                    case.status = "fail"
+                    suite.failures += 1
+                    details.append(line[len("[Failed]:"):].strip())
+            elif line.startswith("[Pending]:"):
+                collecting = False
+                if case.status == "pass":
+                    case.status = "pending"
+                    suite.skipped += 1
+                    details.append(line[len("[Pending]:"):].strip())
+            elif collecting:
+                details.append(line)
+    finish_case()
+    return TestReport(sorted(suites.values(), key=lambda s: s.path))
+
+
+class Triage:
+    """The failures of one run, classified against the history."""
+    def __init__(self, run: RunSummary):
+        self.run = run
+        self.failures: List = []                     # Rows of the failures table
+        self.new: List[TestKey] = []
+        self.recurring: Dict[TestKey, Tuple[int, int, bool]] = {}  # -> (earlier failures, first run, same assertion)
+        self.fixed: List[TestKey] = []
+        self.flaky: Dict[TestKey, str] = {}          # -> status sequence, oldest first ("PPFPF")
+
+    def label(self, key: TestKey) -> str:
+        """Short classification of a failing test, for the runner's failure list."""
+        if key in self.recurring:
+            count, _, _ = self.recurring[key]
+            tag = f"recurring, failed in {count} earlier run(s)"
+        else:
+            tag = "new"
+        if key in self.flaky:
+            tag += ", flaky"
+        return tag
+
+
+def status_history(db: ResultsDatabase, run_id: int, window: int = TRIAGE_WINDOW) -> Dict[TestKey, List[str]]:
+    """
+    (suite, test) -> "pass"/"fail" in each of the last `window` runs up to
+    `run_id` that included it, oldest first. Console-indexed runs only know
+    their failures.
+    """
+    run_ids = [row["id"] for row in db.connection.execute(
+        "SELECT id FROM runs WHERE id <= ? ORDER BY id DESC LIMIT ?", (run_id, window))]
+    if not run_ids:
+        return {}
+    placeholders = ",".join("?" * len(run_ids))
+
+    statuses: Dict[TestKey, Dict[int, str]] = {}
+    for row in db.connection.execute(
+            f"SELECT run_id, suite, name, status FROM testcases WHERE run_id IN ({placeholders})"
+            " AND status IN ('pass', 'risky')", run_ids):
+        statuses.setdefault((row["suite"], row["name"]), {})[row["run_id"]] = "pass"
+    for row in db.connection.execute(
+            f"SELECT run_id, suite, name FROM failures WHERE run_id IN ({placeholders})", run_ids):
+        statuses.setdefault((row["suite"], row["name"]), {})[row["run_id"]] = "fail"
+
+    return {key: [by_run[r] for r in sorted(by_run)] for key, by_run in statuses.items()}
+
+
+def triage(db: ResultsDatabase, run: Optional[RunSummary] = None, window: int = TRIAGE_WINDOW) -> Optional[Triage]:
+    """Classify the failures of `run` (default: the latest run)."""
+    run = run or db.latest_run()
+    if run is None:
+        return None
+    result = Triage(run)
+    result.failures = db.failures(run.id)
+
+    earlier: Dict[TestKey, Tuple[int, int]] = {}
+    for row in db.connection.execute(
+            "SELECT suite, name, COUNT(*) AS count, MIN(run_id) AS first FROM failures"
+            " WHERE run_id < ? GROUP BY suite, name", (run.id,)):
+        earlier[(row["suite"], row["name"])] = (row["count"], row["first"])
+
+    for failure in result.failures:
+        key = (failure["suite"], failure["name"])
+        if key not in earlier:
+            result.new.append(key)
+            continue
+        count, first = earlier[key]
+        previous = db.connection.execute(
+            "SELECT assertion FROM failures WHERE suite = ? AND name = ? AND run_id < ?"
+            " ORDER BY run_id DESC LIMIT 1", (*key, run.id)).fetchone()
+        result.recurring[key] = (count, first, previous is not None and previous["assertion"] == failure["assertion"])
+
+    for key, statuses in status_history(db, run.id, window).items():
+        flips = sum(1 for a, b in zip(statuses, statuses[1:]) if a != b)
+        if flips >= FLAKY_MIN_FLIPS:
+            result.flaky[key] = "".join("F" if s == "fail" else "P" for s in statuses)
+        if len(statuses) >= 2 and statuses[-2:] == ["fail", "pass"] and key not in result.recurring:
+            current = db.connection.execute(
+                "SELECT 1 FROM testcases WHERE run_id = ? AND suite = ? AND name = ?", (run.id, *key)).fetchone()
+            if current is not None:
+                result.fixed.append(key)
+    return result
+
+
+def print_triage(result: Triage) -> None:
+    run = result.run
+    print(f"{CYAN}Triage of run #{run.id} ({run.when}, {run.scope}): "
+          f"{run.failed} failed of {run.total}{NC}")
+
+    by_key = {(f["suite"], f["name"]): f for f in result.failures}
+
+    def show(key: TestKey, note: str = "") -> None:
+        failure = by_key.get(key)
+        where = f" (line {failure['line']})" if failure is not None and failure["line"] is not None else ""
+        print(f"  {key[0]}::{key[1]}{where}{note}")
+        if failure is not None and failure["assertion"]:
+            print(f"      {failure['assertion']}")
+
+    if result.new:
+        print(f"\n{RED}New failures ({len(result.new)}):{NC}")
+        for key in result.new:
+            show(key)
+    if result.recurring:
+        print(f"\n{YELLOW}Recurring failures ({len(result.recurring)}):{NC}")
+        for key, (count, first, same) in result.recurring.items():
+            changed = "" if same else ", assertion changed"
+            show(key, f" - failed in {count} earlier run(s) since #{first}{changed}")
+    if result.flaky:
+        print(f"\n{YELLOW}Flaky - pass/fail flips in the last {TRIAGE_WINDOW} runs ({len(result.flaky)}):{NC}")
+        for key, sequence in sorted(result.flaky.items()):
+            print(f"  {key[0]}::{key[1]}  {sequence}")
+    if result.fixed:
+        print(f"\n{GREEN}Fixed since the previous run ({len(result.fixed)}):{NC}")
+        for key in sorted(result.fixed):
+            print(f"  {key[0]}::{key[1]}")
+    if not (result.failures or result.flaky or result.fixed):
+        print(f"{GREEN}✅ No failures to triage{NC}")
+
+
+def import_console_log(db: ResultsDatabase, path: Path, scope: str = "log") -> Optional[int]:
+    """Index the failures of a saved GUT console log; returns the run id."""
+    try:
+        output = path.read_text(encoding="utf-8", errors="replace")
+    except OSError:
+        return None
+    report = parse_gut_console(output)
+    stats = parse_gut_stats(ANSI_PATTERN.sub("", output))
+    if not report.suites and not stats["total"]:
+        return None
+    stats["pending"] = max(0, stats["total"] - stats["passed"] - stats["failed"])
+    status = "PASS" if stats["failed"] == 0 and not report.failures else "FAIL"
+    return db.record_run(report, scope, status, timestamp=path.stat().st_mtime, stats=stats, source="console")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Triage GUT test failures")
+    parser.add_argument('--import-log', type=Path, metavar='PATH',
+                        help='Index the failures of a saved GUT console log (e.g. test_full_output.txt)')
+    args = parser.parse_args(argv)
+
+    with ResultsDatabase() as db:
+        if args.import_log:
+            run_id = import_console_log(db, args.import_log.resolve())
+            if run_id is None:
+                print(f"{YELLOW}⚠️  No GUT results found in {args.import_log}{NC}")
+                return 1
+            print(f"{GREEN}✓ Indexed {args.import_log} as run #{run_id}{NC}")
+            return 0
+
+        db.import_report()
+        result = triage(db)
+        if result is None:
+            print(f"{YELLOW}No recorded test runs{NC}")
+            return 0
+        print_triage(result)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
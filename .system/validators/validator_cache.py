@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Validator Result Cache
+
+Persistent per-file cache of validator findings, stored under .system/cache/
+(one JSON file per validator, git-ignored). Most commits touch one or two
+scripts, so validators look up each file here first and only re-analyse
+files whose contents changed; cached AntiPattern/PerformanceIssue/... records
+are replayed as-is.
+
+Cache keys:
+- Entry key: SHA-256 of the file contents plus an optional dependency digest.
+  Cross-file validators pass the digest of every other file their result
+  depends on (test_method_validator: all service files; scene_node_path_validator:
+  the scene's attached script), so editing a dependency invalidates the entry.
+- Validator fingerprint: SHA-256 of the validator's own source plus the
+  shared modules it relies on. Editing a check discards that validator's
+  whole cache.
+
+Usage (inside a validator):
+    from validator_cache import ResultCache
+
+    cache = ResultCache("godot_performance_validator", Path(__file__))
+    issues = cache.lookup(source, PerformanceIssue)
+    if issues is None:
+        issues = validate_file(source)
+        cache.store(source, issues)
+    ...
+    cache.save()
+
+Set VALIDATOR_CACHE=0 (or pass --no-cache to the orchestrator) to bypass it.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from project_model import SourceFile
+
+VALIDATORS_DIR = Path(__file__).resolve().parent
+CACHE_DIR = VALIDATORS_DIR.parent / "cache"
+
+# Bump when the on-disk format changes
+CACHE_FORMAT = 1
+
+# Shared modules whose behaviour feeds every cached result
+SHARED_MODULES = ["project_model.py", "gdscript_parser.py", "validator_cache.py", "call_graph.py",
+                  "scene_parser.py"]
+
+
+def cache_enabled() -> bool:
+    """False when VALIDATOR_CACHE=0 is set in the environment."""
+    return os.environ.get("VALIDATOR_CACHE", "1") != "0"
+
+
+def dependency_digest(sources: Iterable[SourceFile]) -> str:
+    """Combined digest of the files a cached result depends on."""
+    hasher = hashlib.sha256()
+    for source in sorted(sources, key=lambda s: s.rel_path):
+        hasher.update(source.rel_path.as_posix().encode('utf-8'))
+        hasher.update(source.digest.encode('utf-8'))
+    return hasher.hexdigest()
+
+
+def _fingerprint(validator_file: Path) -> str:
+    hasher = hashlib.sha256(f"format={CACHE_FORMAT}".encode('utf-8'))
+    for path in [validator_file] + [VALIDATORS_DIR / name for name in SHARED_MODULES]:
+        try:
+            hasher.update(path.read_bytes())
+        except OSError:
+            hasher.update(path.name.encode('utf-8'))
+    return hasher.hexdigest()
+
+
+def _encode(record: Any) -> Any:
+    """Issue objects are stored as their attribute dicts."""
+    return vars(record) if hasattr(record, "__dict__") else record
+
+
+class ResultCache:
+    """On-disk per-file results for one validator."""
+    def __init__(self, validator: str, validator_file: Path, enabled: Optional[bool] = None):
+        self.validator = validator
+        self.path = CACHE_DIR / f"{validator}.json"
+        self.enabled = cache_enabled() if enabled is None else enabled
+        self.fingerprint = _fingerprint(Path(validator_file))
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.hits = 0
+        self.misses = 0
+        self._seen: set = set()
+        self._dirty = False
+        if self.enabled:
+            self._load()
+
+    def _load(self) -> None:
+        try:
+            data = json.loads(self.path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return
+        if data.get("fingerprint") == self.fingerprint:
+            self.entries = data.get("entries", {})
+
+    def _key(self, source: SourceFile, deps: str) -> str:
+        if not deps:
+            return source.digest
+        return hashlib.sha256(f"{source.digest}:{deps}".encode('utf-8')).hexdigest()
+
+    def lookup(self, source: SourceFile, record_type: Optional[type] = None, deps: str = "") -> Optional[List[Any]]:
+        """
+        Cached records for `source`, or None on a miss.
+
+        With `record_type`, each stored dict is rebuilt as record_type(**dict).
+        """
+        rel = source.rel_path.as_posix()
+        self._seen.add(rel)
+        if not self.enabled:
+            return None
+
+        entry = self.entries.get(rel)
+        if entry is None or entry.get("key") != self._key(source, deps):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        records = entry["records"]
+        if record_type is not None:
+            return [record_type(**record) for record in records]
+        return list(records)
+
+    def store(self, source: SourceFile, records: List[Any], deps: str = "") -> None:
+        """Remember the records produced for `source`."""
+        if not self.enabled:
+            return
+        rel = source.rel_path.as_posix()
+        self._seen.add(rel)
+        self.entries[rel] = {
+            "key": self._key(source, deps),
+            "records": [_encode(record) for record in records],
+        }
+        self._dirty = True
+
+    def save(self, prune: bool = True) -> None:
+        """
+        Write the cache. With `prune`, entries for files not seen this run are
+        dropped (pass False for partial runs, e.g. staged-files mode).
+        """
+        if not self.enabled:
+            return
+        stale = set(self.entries) - self._seen if prune else set()
+        for rel in stale:
+            del self.entries[rel]
+        if not self._dirty and not stale:
+            return
+
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            tmp_path.write_text(
+                json.dumps({"fingerprint": self.fingerprint, "entries": self.entries}, default=str),
+                encoding='utf-8'
+            )
+            os.replace(tmp_path, self.path)
+        except OSError:
+            # A cache that cannot be written is just a slower run
+            tmp_path.unlink(missing_ok=True)
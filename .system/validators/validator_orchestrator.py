@@ -0,0 +1,392 @@
+#!/usr/bin/env python3
+"""
+Validator Orchestrator
+
+Runs every pre-commit validator inside a single Python interpreter instead of
+launching a separate `python3 .system/validators/*.py` process per check.
+
+Each validator module is imported once and its main() is called directly, so
+interpreter startup and module imports are paid a single time per commit.
+Blocking validators fail the run when main() returns non-zero; non-blocking
+validators are informational and never fail the run (same semantics as the
+old per-validator blocks in .system/hooks/pre-commit).
+
+Shared project model:
+- The project's .gd/.tscn files are walked and read once (project_model.py)
+  and handed to every validator whose main() accepts a `model` argument.
+  Pool workers are seeded with the same model, so no validator re-reads the
+  tree.
+
+Staged-files mode:
+- By default the per-file validators only analyse the files staged for
+  commit plus their reverse dependencies (file_selection.py). Pass --full to
+  check the whole project, or explicit paths to check just those files.
+  The selection is computed once and handed to every validator whose main()
+  accepts a `selection` argument.
+
+Result cache:
+- Per-file validators replay cached findings for files whose content hash is
+  unchanged (validator_cache.py, stored in .system/cache/). --no-cache forces
+  a full re-analysis.
+
+Scheduling:
+- Static validators (regex scanners) run concurrently in a process pool.
+- Validators sharing a lock (e.g. the Godot binary validators, which cannot
+  share the editor lock) run one after another inside a single pool task.
+- Exclusive validators (scene load-time benchmarking) run alone once the
+  pool has drained, so their timings are not taken under contention.
+- Output is buffered per validator and printed in registry order, so the
+  terminal report reads the same as a serial run.
+
+Usage:
+    python3 .system/validators/validator_orchestrator.py           # Run all validators (staged files)
+    python3 .system/validators/validator_orchestrator.py --full    # Check the whole project
+    python3 .system/validators/validator_orchestrator.py scripts/ui/shop.gd  # Check given files
+    python3 .system/validators/validator_orchestrator.py --jobs 4  # Limit pool size
+    python3 .system/validators/validator_orchestrator.py --serial  # No pool, unbuffered output
+    python3 .system/validators/validator_orchestrator.py --list    # Show registered validators
+    python3 .system/validators/validator_orchestrator.py --no-cache  # Ignore cached results
+    python3 .system/validators/validator_orchestrator.py --only native_class_checker
+
+Exit Codes:
+  0 - All blocking validators passed
+  1 - One or more blocking validators failed
+"""
+
+import argparse
+import contextlib
+import importlib
+import inspect
+import io
+import os
+import subprocess
+import sys
+import time
+import traceback
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# ANSI colors
+RED = '\033[0;31m'
+GREEN = '\033[0;32m'
+YELLOW = '\033[1;33m'
+CYAN = '\033[0;36m'
+NC = '\033[0m'
+
+VALIDATORS_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = VALIDATORS_DIR.parent.parent
+
+if str(VALIDATORS_DIR) not in sys.path:
+    sys.path.insert(0, str(VALIDATORS_DIR))
+
+from project_model import ProjectModel, load_project_model, set_project_model
+from file_selection import FileSelection, add_selection_arguments, selection_from_args
+
+
+class ValidatorSpec:
+    """Describes one validator run by the orchestrator."""
+    def __init__(self, name: str, blocking: bool = True, kind: str = "python", lock: Optional[str] = None,
+                 exclusive: bool = False):
+        self.name = name
+        self.blocking = blocking
+        self.kind = kind  # "python" (imported module) or "shell" (bash script)
+        self.lock = lock  # Validators sharing a lock never run concurrently
+        self.exclusive = exclusive  # Runs alone after every other validator has finished
+
+    @property
+    def path(self) -> Path:
+        suffix = ".py" if self.kind == "python" else ".sh"
+        return VALIDATORS_DIR / f"{self.name}{suffix}"
+
+
+class ValidatorResult:
+    """Outcome of a single validator run."""
+    def __init__(self, spec: ValidatorSpec, exit_code: int, elapsed: float, output: str = ""):
+        self.spec = spec
+        self.exit_code = exit_code
+        self.elapsed = elapsed
+        self.output = output  # Buffered stdout/stderr (empty for unbuffered runs)
+
+    @property
+    def failed(self) -> bool:
+        return self.spec.blocking and self.exit_code != 0
+
+
+# File selection handed to validators that support staged-files mode
+# (set in main() and in each pool worker by init_worker())
+_selection: Optional[FileSelection] = None
+
+
+def init_worker(model: ProjectModel, selection: FileSelection) -> None:
+    """Seed a pool worker with the already-built model and file selection."""
+    global _selection
+    set_project_model(model)
+    _selection = selection
+
+
+# Lock shared by validators that launch the Godot binary against this project
+GODOT_LOCK = "godot"
+
+# Validators in the same order (and with the same blocking semantics) as the
+# original per-validator blocks in .system/hooks/pre-commit.
+VALIDATORS: List[ValidatorSpec] = [
+    ValidatorSpec("native_class_checker"),                        # Week 6 Day 1
+    ValidatorSpec("service_api_checker"),                         # Week 6 Day 2
+    ValidatorSpec("test_method_validator"),                       # Week 6 Day 3
+    ValidatorSpec("integration_test_checker", blocking=False),    # Reminder
+    ValidatorSpec("user_story_validator", blocking=False),        # Reminder
+    ValidatorSpec("test_naming_validator", blocking=False),       # Warning only
+    ValidatorSpec("godot_config_validator"),
+    ValidatorSpec("resource_validator"),
+    ValidatorSpec("scene_node_path_validator"),                   # Week 10 Phase 4
+    ValidatorSpec("scene_structure_validator"),                   # Week 15 Phase 3
+    ValidatorSpec("scene_instantiation_validator", lock=GODOT_LOCK, exclusive=True),  # Week 15 Phase 3
+    ValidatorSpec("component_usage_validator"),                   # Week 15 Phase 3
+    ValidatorSpec("refactor_verification_validator"),             # Skips in pre-commit
+    ValidatorSpec("documentation_validator"),
+    ValidatorSpec("godot_antipatterns_validator"),                # Week 6 Day 4
+    ValidatorSpec("godot_performance_validator"),                 # Week 6 Day 4
+    ValidatorSpec("service_architecture_validator"),              # Week 6 Day 5
+    ValidatorSpec("data_model_consistency_validator", blocking=False),
+    ValidatorSpec("test_patterns_validator", blocking=False),     # GUT migration info
+    ValidatorSpec("test_quality_validator"),
+    ValidatorSpec("check-patterns", blocking=False, kind="shell"),
+    ValidatorSpec("check-imports", kind="shell"),                 # Week 9
+    ValidatorSpec("godot_test_runner", lock=GODOT_LOCK),
+]
+
+
+def shared_arguments(main_func) -> Dict[str, object]:
+    """Shared state (project model, file selection) a validator's main() accepts."""
+    try:
+        parameters = inspect.signature(main_func).parameters
+    except (TypeError, ValueError):
+        return {}
+
+    kwargs: Dict[str, object] = {}
+    if "model" in parameters:
+        kwargs["model"] = load_project_model(PROJECT_ROOT)
+    if "selection" in parameters and _selection is not None:
+        kwargs["selection"] = _selection
+    return kwargs
+
+
+def run_python_validator(spec: ValidatorSpec) -> int:
+    """Import a validator module and call its main() in this interpreter."""
+    # Validators that parse arguments must see only their own script name
+    saved_argv = sys.argv
+    sys.argv = [str(spec.path)]
+    try:
+        module = importlib.import_module(spec.name)
+        exit_code = module.main(**shared_arguments(module.main))
+    except SystemExit as e:
+        exit_code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+    except Exception:
+        print(f"{RED}❌ {spec.name} crashed:{NC}")
+        traceback.print_exc(file=sys.stdout)
+        exit_code = 1
+    finally:
+        sys.argv = saved_argv
+        sys.stdout.flush()
+
+    return int(exit_code or 0)
+
+
+def run_shell_validator(spec: ValidatorSpec) -> int:
+    """Run a bash validator from the project root (they use relative paths)."""
+    sys.stdout.flush()
+    result = subprocess.run(
+        ["bash", str(spec.path)],
+        cwd=PROJECT_ROOT,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True
+    )
+    # Route through sys.stdout so buffered runs capture shell output too
+    sys.stdout.write(result.stdout)
+    return result.returncode
+
+
+def run_validator(spec: ValidatorSpec) -> Optional[ValidatorResult]:
+    """Run one validator and time it. Returns None if the validator is absent."""
+    if not spec.path.exists():
+        return None
+
+    start = time.perf_counter()
+    if spec.kind == "python":
+        exit_code = run_python_validator(spec)
+    else:
+        exit_code = run_shell_validator(spec)
+    elapsed = time.perf_counter() - start
+
+    return ValidatorResult(spec, exit_code, elapsed)
+
+
+def run_buffered(spec: ValidatorSpec) -> Optional[ValidatorResult]:
+    """Run one validator with stdout/stderr captured into the result."""
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer), contextlib.redirect_stderr(buffer):
+        result = run_validator(spec)
+    if result is not None:
+        result.output = buffer.getvalue()
+    return result
+
+
+def run_buffered_group(specs: List[ValidatorSpec]) -> List[Optional[ValidatorResult]]:
+    """Run validators sharing a lock one after another (single pool task)."""
+    return [run_buffered(spec) for spec in specs]
+
+
+def schedule(specs: List[ValidatorSpec]) -> List[List[ValidatorSpec]]:
+    """
+    Split validators into pool tasks.
+
+    Unlocked validators get a task each; validators sharing a lock are grouped
+    into one task that runs them serially in registry order.
+    """
+    tasks: List[List[ValidatorSpec]] = []
+    locked: Dict[str, List[ValidatorSpec]] = {}
+
+    for spec in specs:
+        if spec.lock is None:
+            tasks.append([spec])
+        elif spec.lock in locked:
+            locked[spec.lock].append(spec)
+        else:
+            locked[spec.lock] = [spec]
+            tasks.append(locked[spec.lock])
+
+    # Start the longest chains (e.g. Godot) first so they overlap the scanners
+    tasks.sort(key=len, reverse=True)
+    return tasks
+
+
+def run_parallel(specs: List[ValidatorSpec], jobs: int, model: ProjectModel,
+                 selection: FileSelection) -> List[ValidatorResult]:
+    """
+    Run validators in a process pool and print buffered output in order.
+
+    Exclusive validators are held back until the pool has shut down and then
+    run one at a time in this process; their output follows the pool's.
+    """
+    futures: Dict[str, Future] = {}
+    group_index: Dict[str, int] = {}
+    pooled = [spec for spec in specs if not spec.exclusive]
+    exclusive = [spec for spec in specs if spec.exclusive]
+
+    # Each worker starts with the already-built model instead of re-walking
+    with ProcessPoolExecutor(max_workers=jobs, initializer=init_worker, initargs=(model, selection)) as pool:
+        for task in schedule(pooled):
+            future = pool.submit(run_buffered_group, task)
+            for index, spec in enumerate(task):
+                futures[spec.name] = future
+                group_index[spec.name] = index
+
+        results: List[ValidatorResult] = []
+        for spec in pooled:
+            # Blocks only until this validator's task is done; later
+            # validators keep running in the pool meanwhile
+            result = futures[spec.name].result()[group_index[spec.name]]
+            if result is None:
+                continue
+            sys.stdout.write(result.output)
+            sys.stdout.flush()
+            results.append(result)
+
+    # The pool (and any Godot it launched) is gone: nothing competes for CPU
+    results.extend(run_serial(exclusive))
+    return results
+
+
+def run_serial(specs: List[ValidatorSpec]) -> List[ValidatorResult]:
+    """Run validators one after another with live (unbuffered) output."""
+    results: List[ValidatorResult] = []
+    for spec in specs:
+        result = run_validator(spec)
+        if result is not None:
+            results.append(result)
+    return results
+
+
+def print_timings(results: List[ValidatorResult], total_elapsed: float) -> None:
+    """Print per-validator wall time, slowest first."""
+    print()
+    print(f"{CYAN}⏱  Validator timings:{NC}")
+    for result in sorted(results, key=lambda r: r.elapsed, reverse=True):
+        if result.exit_code == 0:
+            status = f"{GREEN}ok{NC}"
+        elif result.spec.blocking:
+            status = f"{RED}FAILED{NC}"
+        else:
+            status = f"{YELLOW}warn{NC}"
+        mode = "" if result.spec.blocking else " (non-blocking)"
+        print(f"  {result.elapsed * 1000:8.1f} ms  {result.spec.name}{mode}  {status}")
+    print(f"  {total_elapsed * 1000:8.1f} ms  total")
+
+
+def main() -> int:
+    global _selection
+
+    parser = argparse.ArgumentParser(description="Run all project validators in one interpreter")
+    parser.add_argument('--list', action='store_true', help='List registered validators and exit')
+    parser.add_argument('--only', nargs='+', metavar='NAME', help='Run only the named validators')
+    parser.add_argument('--no-timings', action='store_true', help='Do not print the timing summary')
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1,
+                        help='Process pool size (default: CPU count)')
+    parser.add_argument('--serial', action='store_true',
+                        help='Run validators one at a time without a process pool')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Re-analyse every file instead of replaying cached results')
+    add_selection_arguments(parser)
+    args = parser.parse_args()
+
+    if args.list:
+        for spec in VALIDATORS:
+            mode = "blocking" if spec.blocking else "non-blocking"
+            if spec.exclusive:
+                mode += ", exclusive"
+            print(f"  {spec.name:<36} {spec.kind:<6} {mode}")
+        return 0
+
+    specs = VALIDATORS
+    if args.only:
+        unknown = set(args.only) - {spec.name for spec in VALIDATORS}
+        if unknown:
+            print(f"{RED}❌ Unknown validator(s): {', '.join(sorted(unknown))}{NC}")
+            return 1
+        specs = [spec for spec in VALIDATORS if spec.name in args.only]
+
+    if args.no_cache:
+        # Read by validator_cache in this process and inherited by pool workers
+        os.environ["VALIDATOR_CACHE"] = "0"
+
+    run_start = time.perf_counter()
+
+    # Walk and read the project once for every validator
+    model = load_project_model(PROJECT_ROOT)
+    _selection = selection_from_args(model, args)
+    if not _selection.full:
+        print(f"{CYAN}🔎 Incremental mode: {_selection.describe()} (use --full to check everything){NC}")
+
+    if args.serial or args.jobs <= 1:
+        results = run_serial(specs)
+    else:
+        results = run_parallel(specs, args.jobs, model, _selection)
+
+    total_elapsed = time.perf_counter() - run_start
+
+    if not args.no_timings:
+        print_timings(results, total_elapsed)
+
+    failed = [r for r in results if r.failed]
+    if failed:
+        print()
+        print(f"{RED}❌ Blocking validator(s) failed: {', '.join(r.spec.name for r in failed)}{NC}")
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
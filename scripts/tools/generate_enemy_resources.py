@@ -7,11 +7,14 @@ in resources/enemies/ directory.
 
 Usage:
     python3 scripts/tools/generate_enemy_resources.py
+    python3 scripts/tools/generate_resources.py enemies   # Same, via the unified generator
 """
 
-import json
+import sys
 from pathlib import Path
 
+from resource_schema import EnemyRecord
+
 
 # Paths
 SCRIPT_DIR = Path(__file__).parent
@@ -41,12 +44,12 @@ def hex_to_godot_color(hex_color: str) -> str:
     return f"Color({r:.4f}, {g:.4f}, {b:.4f}, 1)"
 
 
-def create_tres_content(enemy: dict) -> str:
+def create_tres_content(enemy: EnemyRecord) -> str:
     """
     Create .tres file content for an enemy.
 
     Args:
-        enemy: Dictionary with enemy data from JSON
+        enemy: Schema-validated enemy record from JSON
 
     Returns:
         String content for .tres file
@@ -72,43 +75,11 @@ drop_chance = {enemy['drop_chance']}
 """
 
 
-def main():
-    print("=== Enemy Resource Generator ===")
-    print()
-
-    # Ensure output directory exists
-    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-
-    # Read enemies.json
-    print(f"Reading: {JSON_PATH}")
-    with open(JSON_PATH, 'r') as f:
-        enemies = json.load(f)
-
-    print(f"Found {len(enemies)} enemy types")
-    print()
-
-    # Generate .tres files
-    created_count = 0
-
-    for enemy in enemies:
-        enemy_id = enemy['id']
-        output_path = OUTPUT_DIR / f"{enemy_id}.tres"
-
-        # Create .tres content
-        tres_content = create_tres_content(enemy)
-
-        # Write file
-        with open(output_path, 'w') as f:
-            f.write(tres_content)
-
-        print(f"✓ Created: {enemy_id}.tres ({enemy['name']}, spawn_weight={enemy['spawn_weight']}%)")
-        created_count += 1
-
-    print()
-    print("=== Generation Complete ===")
-    print(f"Created: {created_count} enemy resources")
-    print(f"Output: {OUTPUT_DIR}")
+def main() -> int:
+    """Regenerate only the enemies whose .tres content changed (see generate_resources.py)."""
+    import generate_resources
+    return generate_resources.main(["enemies"])
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -8,11 +8,14 @@ and craftable weapons (with weapon-specific properties).
 
 Usage:
     python3 scripts/tools/generate_item_resources.py
+    python3 scripts/tools/generate_resources.py items   # Same, via the unified generator
 """
 
-import json
+import sys
 from pathlib import Path
 
+from resource_schema import ItemRecord
+
 
 # Paths
 SCRIPT_DIR = Path(__file__).parent
@@ -43,14 +46,14 @@ def format_dictionary(stats: dict) -> str:
     return "{" + ", ".join(pairs) + "}"
 
 
-def create_tres_content(item: dict) -> str:
+def create_tres_content(item: ItemRecord) -> str:
     """
     Create .tres file content for an item.
     
     Handles both upgrade/consumable items and craftable weapons.
     
     Args:
-        item: Dictionary with item data from JSON
+        item: Schema-validated item record from JSON
     
     Returns:
         String content for .tres file
@@ -88,68 +91,11 @@ base_value = {item['base_value']}
     return content
 
 
-def main():
-    print("=== Item Resource Generator ===")
-    print()
-    
-    # Ensure output directory exists
-    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-    
-    # Read items.json
-    print(f"Reading: {JSON_PATH}")
-    with open(JSON_PATH, 'r') as f:
-        items = json.load(f)
-    
-    print(f"Found {len(items)} items")
-    print()
-    
-    # Count by type
-    upgrades = [i for i in items if i['type'] == 'upgrade']
-    consumables = [i for i in items if i['type'] == 'item']
-    weapons = [i for i in items if i['type'] == 'weapon']
-    
-    print(f"  Upgrades: {len(upgrades)}")
-    print(f"  Consumables: {len(consumables)}")
-    print(f"  Weapons: {len(weapons)}")
-    print()
-    
-    # Generate .tres files
-    created_count = 0
-    
-    for item in items:
-        item_id = item['id']
-        output_path = OUTPUT_DIR / f"{item_id}.tres"
-        
-        # Create .tres content
-        tres_content = create_tres_content(item)
-        
-        # Write file
-        with open(output_path, 'w') as f:
-            f.write(tres_content)
-        
-        # Display progress with relevant info
-        item_type = item['type']
-        rarity = item['rarity']
-        
-        if item_type == 'weapon':
-            print(f"✓ Created: {item_id}.tres ({item['name']}, {rarity} weapon, dmg={item['base_damage']})")
-        else:
-            stats = item.get('stats', {})
-            stat_summary = ", ".join([f"{k}={v}" for k, v in list(stats.items())[:2]])
-            if len(stats) > 2:
-                stat_summary += "..."
-            print(f"✓ Created: {item_id}.tres ({item['name']}, {rarity} {item_type}, {stat_summary})")
-        
-        created_count += 1
-    
-    print()
-    print("=== Generation Complete ===")
-    print(f"Created: {created_count} item resources")
-    print(f"  Upgrades: {len(upgrades)}")
-    print(f"  Consumables: {len(consumables)}")
-    print(f"  Weapons: {len(weapons)}")
-    print(f"Output: {OUTPUT_DIR}")
+def main() -> int:
+    """Regenerate only the items whose .tres content changed (see generate_resources.py)."""
+    import generate_resources
+    return generate_resources.main(["items"])
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
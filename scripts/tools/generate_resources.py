@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Generate Godot .tres resource files from resources/data/*.json
+
+One incremental generator for every data-driven resource type. Each type
+pairs a JSON source with the .tres template of its generator script
+(create_tres_content in generate_weapon_resources.py, generate_enemy_resources.py
+and generate_item_resources.py):
+
+    weapons   resources/data/weapons.json  -> resources/weapons/<id>.tres
+    enemies   resources/data/enemies.json  -> resources/enemies/<id>.tres
+    items     resources/data/items.json    -> resources/items/<id>.tres
+
+The desired output is compared with what is on disk and only files whose
+content differs are written, so unchanged resources keep their mtime and
+Godot does not reimport them. Generated .tres files whose record was removed
+from the JSON (orphans) are deleted; hand-made resources of another type in
+the same directory are left alone.
+
+Usage:
+    python3 scripts/tools/generate_resources.py              # All types
+    python3 scripts/tools/generate_resources.py weapons      # Just weapons
+    python3 scripts/tools/generate_resources.py --check      # Exit 1 if anything is stale
+    python3 scripts/tools/generate_resources.py --dry-run    # Show what would change
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+import generate_enemy_resources
+import generate_item_resources
+import generate_weapon_resources
+from resource_schema import SCHEMAS, DataSchema
+
+
+# Paths
+SCRIPT_DIR = Path(__file__).parent
+PROJECT_ROOT = SCRIPT_DIR.parent.parent
+
+
+class ResourceType:
+    """A JSON data file and the .tres template its records are rendered with."""
+    def __init__(self, name: str, resource_class: str, schema: DataSchema, json_path: Path, output_dir: Path,
+                 render: Callable[[dict], str], describe: Callable[[dict], str],
+                 breakdown: Optional[Callable[[List[dict]], List[str]]] = None):
+        self.name = name
+        self.resource_class = resource_class
+        self.schema = schema
+        self.json_path = json_path
+        self.output_dir = output_dir
+        self.render = render            # record -> .tres content
+        self.describe = describe        # record -> short summary for the log
+        self.breakdown = breakdown      # records -> extra summary lines
+
+    def is_generated(self, path: Path) -> bool:
+        """Whether an existing .tres file was produced from this type's template."""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                first_line = f.readline()
+        except OSError:
+            return False
+        return first_line.startswith(f'[gd_resource type="{self.resource_class}"')
+
+
+class GenerationPlan:
+    """What a run has to do to bring one output directory in line with its JSON."""
+    def __init__(self, resource_type: ResourceType, records: List[dict]):
+        self.resource_type = resource_type
+        self.records = records
+        self.created: List[Tuple[Path, str, dict]] = []   # (path, content, record)
+        self.updated: List[Tuple[Path, str, dict]] = []
+        self.unchanged: List[Path] = []
+        self.orphans: List[Path] = []
+
+
+def _breakdown_items(items: List[dict]) -> List[str]:
+    upgrades = [i for i in items if i['type'] == 'upgrade']
+    consumables = [i for i in items if i['type'] == 'item']
+    weapons = [i for i in items if i['type'] == 'weapon']
+    return [
+        f"  Upgrades: {len(upgrades)}",
+        f"  Consumables: {len(consumables)}",
+        f"  Weapons: {len(weapons)}",
+    ]
+
+
+def _describe_weapon(weapon: dict) -> str:
+    return f"{weapon['name']}, damage={weapon['damage']}"
+
+
+def _describe_enemy(enemy: dict) -> str:
+    return f"{enemy['name']}, spawn_weight={enemy['spawn_weight']}%"
+
+
+def _describe_item(item: dict) -> str:
+    if item['type'] == 'weapon':
+        return f"{item['name']}, {item['rarity']} weapon, dmg={item['base_damage']}"
+    stats = item.get('stats', {})
+    stat_summary = ", ".join([f"{k}={v}" for k, v in list(stats.items())[:2]])
+    if len(stats) > 2:
+        stat_summary += "..."
+    return f"{item['name']}, {item['rarity']} {item['type']}, {stat_summary}"
+
+
+RESOURCE_TYPES: Dict[str, ResourceType] = {
+    "weapons": ResourceType(
+        "weapons", "WeaponResource", SCHEMAS["weapons"],
+        generate_weapon_resources.JSON_PATH, generate_weapon_resources.OUTPUT_DIR,
+        generate_weapon_resources.create_tres_content, _describe_weapon),
+    "enemies": ResourceType(
+        "enemies", "EnemyResource", SCHEMAS["enemies"],
+        generate_enemy_resources.JSON_PATH, generate_enemy_resources.OUTPUT_DIR,
+        generate_enemy_resources.create_tres_content, _describe_enemy),
+    "items": ResourceType(
+        "items", "ItemResource", SCHEMAS["items"],
+        generate_item_resources.JSON_PATH, generate_item_resources.OUTPUT_DIR,
+        generate_item_resources.create_tres_content, _describe_item, _breakdown_items),
+}
+
+
+def _matches_disk(path: Path, content: str) -> bool:
+    """Compare rendered content with a file, checking the size before reading it."""
+    data = content.encode('utf-8')
+    try:
+        if path.stat().st_size != len(data):
+            return False
+        return path.read_bytes() == data
+    except OSError:
+        return False
+
+
+def plan(resource_type: ResourceType, records: List[dict]) -> GenerationPlan:
+    """Render every record and diff the result against the output directory."""
+    result = GenerationPlan(resource_type, records)
+    wanted = set()
+    for record in records:
+        path = resource_type.output_dir / f"{record['id']}.tres"
+        wanted.add(path.name)
+        content = resource_type.render(record)
+        if not path.exists():
+            result.created.append((path, content, record))
+        elif _matches_disk(path, content):
+            result.unchanged.append(path)
+        else:
+            result.updated.append((path, content, record))
+
+    if resource_type.output_dir.is_dir():
+        for path in sorted(resource_type.output_dir.glob("*.tres")):
+            if path.name not in wanted and resource_type.is_generated(path):
+                result.orphans.append(path)
+    return result
+
+
+def apply(generation: GenerationPlan, prune: bool = True) -> None:
+    """Write the created/updated files and delete orphans."""
+    generation.resource_type.output_dir.mkdir(parents=True, exist_ok=True)
+    for path, content, _ in generation.created + generation.updated:
+        # Godot resources use LF line endings on every platform
+        with open(path, 'w', encoding='utf-8', newline='\n') as f:
+            f.write(content)
+    if prune:
+        for path in generation.orphans:
+            path.unlink()
+
+
+def generate(resource_type: ResourceType, dry_run: bool = False, prune: bool = True) -> Optional[GenerationPlan]:
+    """
+    Bring one resource type's .tres files up to date, printing what changed.
+
+    Returns None without touching any file when the JSON fails its schema.
+    """
+    print(f"Reading: {resource_type.json_path}")
+    records, errors = resource_type.schema.load(resource_type.json_path)
+    if errors:
+        print(f"✗ {resource_type.json_path.name}: {len(errors)} schema error(s), nothing generated")
+        for error in errors:
+            print(f"  {error}")
+        print()
+        return None
+    print(f"Found {len(records)} {resource_type.name}")
+
+    generation = plan(resource_type, records)
+    if not dry_run:
+        apply(generation, prune)
+
+    verb = "Would " if dry_run else ""
+    for path, _, record in generation.created:
+        print(f"✓ {verb}{'create' if dry_run else 'Created'}: {path.name} ({resource_type.describe(record)})")
+    for path, _, record in generation.updated:
+        print(f"✓ {verb}{'update' if dry_run else 'Updated'}: {path.name} ({resource_type.describe(record)})")
+    if prune:
+        for path in generation.orphans:
+            print(f"✗ {verb}{'remove' if dry_run else 'Removed'}: {path.name} (not in {resource_type.json_path.name})")
+    else:
+        for path in generation.orphans:
+            print(f"⚠ Orphan: {path.name} (not in {resource_type.json_path.name})")
+
+    print(f"Created: {len(generation.created)}, updated: {len(generation.updated)}, "
+          f"unchanged: {len(generation.unchanged)}, removed: {len(generation.orphans) if prune else 0}")
+    if resource_type.breakdown:
+        for line in resource_type.breakdown(records):
+            print(line)
+    print(f"Output: {resource_type.output_dir}")
+    print()
+    return generation
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Generate .tres resources from resources/data/*.json")
+    parser.add_argument('types', nargs='*', metavar='TYPE',
+                        help=f"Resource types to generate ({', '.join(RESOURCE_TYPES)}; default: all)")
+    parser.add_argument('--dry-run', action='store_true', help='Show what would change without writing')
+    parser.add_argument('--check', action='store_true',
+                        help='Exit 1 if any .tres file is missing, stale or orphaned (implies --dry-run)')
+    parser.add_argument('--no-prune', action='store_true', help='Keep orphaned .tres files')
+    args = parser.parse_args(argv)
+    unknown = [name for name in args.types if name not in RESOURCE_TYPES]
+    if unknown:
+        parser.error(f"unknown resource type: {', '.join(unknown)} (choose from {', '.join(RESOURCE_TYPES)})")
+
+    print("=== Resource Generator ===")
+    print()
+
+    dry_run = args.dry_run or args.check
+    prune = not args.no_prune
+    changes = 0
+    invalid = []
+    for name in args.types or list(RESOURCE_TYPES):
+        generation = generate(RESOURCE_TYPES[name], dry_run=dry_run, prune=prune)
+        if generation is None:
+            invalid.append(RESOURCE_TYPES[name].json_path.name)
+            continue
+        changes += len(generation.created) + len(generation.updated) + (len(generation.orphans) if prune else 0)
+
+    print("=== Generation Complete ===")
+    if invalid:
+        print(f"Fix the schema errors in {', '.join(invalid)} and run again")
+        return 1
+    if changes == 0:
+        print("All resources up to date")
+    elif dry_run:
+        print(f"{changes} file(s) out of date")
+    if args.check and changes:
+        print("Run: python3 scripts/tools/generate_resources.py")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
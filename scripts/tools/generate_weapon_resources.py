@@ -7,12 +7,14 @@ in resources/weapons/ directory. The .tres format is Godot's text-based resource
 
 Usage:
     python3 scripts/tools/generate_weapon_resources.py
+    python3 scripts/tools/generate_resources.py weapons   # Same, via the unified generator
 """
 
-import json
-import os
+import sys
 from pathlib import Path
 
+from resource_schema import WeaponRecord
+
 
 # Paths
 SCRIPT_DIR = Path(__file__).parent
@@ -21,7 +23,7 @@ JSON_PATH = PROJECT_ROOT / "resources/data/weapons.json"
 OUTPUT_DIR = PROJECT_ROOT / "resources/weapons"
 
 
-def create_tres_content(weapon: dict) -> str:
+def create_tres_content(weapon: WeaponRecord) -> str:
     """
     Create .tres file content for a weapon.
 
@@ -29,7 +31,7 @@ def create_tres_content(weapon: dict) -> str:
     [gd_resource type="WeaponResource" ...]
 
     Args:
-        weapon: Dictionary with weapon data from JSON
+        weapon: Schema-validated weapon record from JSON
 
     Returns:
         String content for .tres file
@@ -52,43 +54,11 @@ sprite = "{weapon['sprite']}"
 """
 
 
-def main():
-    print("=== Weapon Resource Generator ===")
-    print()
-
-    # Ensure output directory exists
-    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-
-    # Read weapons.json
-    print(f"Reading: {JSON_PATH}")
-    with open(JSON_PATH, 'r') as f:
-        weapons = json.load(f)
-
-    print(f"Found {len(weapons)} weapons")
-    print()
-
-    # Generate .tres files
-    created_count = 0
-
-    for weapon in weapons:
-        weapon_id = weapon['id']
-        output_path = OUTPUT_DIR / f"{weapon_id}.tres"
-
-        # Create .tres content
-        tres_content = create_tres_content(weapon)
-
-        # Write file
-        with open(output_path, 'w') as f:
-            f.write(tres_content)
-
-        print(f"✓ Created: {weapon_id}.tres ({weapon['name']}, damage={weapon['damage']})")
-        created_count += 1
-
-    print()
-    print("=== Generation Complete ===")
-    print(f"Created: {created_count} weapon resources")
-    print(f"Output: {OUTPUT_DIR}")
+def main() -> int:
+    """Regenerate only the weapons whose .tres content changed (see generate_resources.py)."""
+    import generate_resources
+    return generate_resources.main(["weapons"])
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1,432 @@
+#!/usr/bin/env python3
+"""
+Schemas for resources/data/*.json
+
+Declares the shape of weapons.json, enemies.json, items.json and
+game_constants.json (types, required fields, ranges, enums, unique ids) and
+compiles each schema once into a tree of small check functions. Validation
+walks every record in a single pass and collects all errors, each with the
+JSON path of the offending value:
+
+    items.json[17].base_damage: expected int, got str ("12")
+    enemies.json[2].drop_chance: 1.5 is above the maximum 1
+    weapons.json[9].id: duplicate id "plasma_cutter" (first at [4])
+
+The generators (generate_resources.py) load their data through here and get
+records that match the TypedDicts below, so the .tres templates can index
+fields without guarding against KeyError. ResourceValidator runs the same
+checks on commit.
+
+Usage:
+    python3 scripts/tools/resource_schema.py                 # Validate every data file
+    python3 scripts/tools/resource_schema.py items enemies   # Just these
+"""
+
+import json
+import re
+import sys
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypedDict
+
+
+# Paths
+SCRIPT_DIR = Path(__file__).parent
+PROJECT_ROOT = SCRIPT_DIR.parent.parent
+DATA_DIR = PROJECT_ROOT / "resources/data"
+
+RARITIES = ("common", "uncommon", "rare", "epic", "legendary")
+ITEM_TYPES = ("upgrade", "item", "weapon")
+DAMAGE_TYPES = ("ranged", "melee")
+
+# Ids become .tres file names and Godot resource paths
+ID_PATTERN = r"^[a-z0-9_]+$"
+HEX_COLOR_PATTERN = r"^#[0-9a-fA-F]{6}$"
+STAT_NAME_PATTERN = r"^[a-z][A-Za-z]*$"
+
+
+class WeaponRecord(TypedDict):
+    id: str
+    name: str
+    damage: int
+    fire_rate: float
+    projectile_speed: int
+    range: int
+    is_premium: bool
+    rarity: str
+    sprite: str
+
+
+class EnemyRecord(TypedDict):
+    id: str
+    name: str
+    color: str
+    size: int
+    base_hp: int
+    base_speed: int
+    base_damage: int
+    base_value: int
+    spawn_weight: int
+    drop_chance: float
+
+
+class _ItemBase(TypedDict):
+    id: str
+    name: str
+    description: str
+    type: str
+    rarity: str
+    stats: Dict[str, int]
+
+
+class ItemRecord(_ItemBase, total=False):
+    # Present (and required) when type == "weapon"
+    base_damage: int
+    damage_type: str
+    fire_rate: float
+    projectile_speed: int
+    base_range: int
+    max_durability: int
+    max_fuse_tier: int
+    base_value: int
+
+
+class SchemaError:
+    """One schema violation, located by its JSON path."""
+    def __init__(self, path: str, message: str):
+        self.path = path
+        self.message = message
+
+    def __str__(self) -> str:
+        return f"{self.path}: {self.message}"
+
+
+class Field:
+    """
+    Constraint on one JSON value.
+
+    kind is "str", "int", "number", "bool", "object" (fixed `fields`),
+    "map" (free-form keys matching `keys`, each value checked by `values`)
+    or "array" (each element checked by `items`; `unique` names a field
+    that must not repeat across elements).
+    """
+    def __init__(self, kind: str, minimum: Optional[float] = None, maximum: Optional[float] = None,
+                 choices: Optional[Tuple] = None, pattern: Optional[str] = None,
+                 optional: bool = False, required_when: Optional[Tuple[str, Any]] = None,
+                 fields: Optional[Dict[str, "Field"]] = None, keys: Optional[str] = None,
+                 values: Optional["Field"] = None, items: Optional["Field"] = None,
+                 unique: Optional[str] = None):
+        self.kind = kind
+        self.minimum = minimum
+        self.maximum = maximum
+        self.choices = choices
+        self.pattern = pattern
+        self.optional = optional
+        self.required_when = required_when  # (sibling field, value) that makes this field required
+        self.fields = fields or {}
+        self.keys = keys
+        self.values = values
+        self.items = items
+        self.unique = unique
+
+
+# value, path -> appends to errors. Scalar checks receive the parent path and
+# key and only format the full path when they report something, which keeps
+# large arrays cheap to validate.
+Check = Callable[[Any, str, Any, List[SchemaError]], None]
+
+
+def _path(parent: str, key: Any) -> str:
+    return f"{parent}[{key}]" if isinstance(key, int) else f"{parent}.{key}"
+
+
+def _describe(value: Any) -> str:
+    text = json.dumps(value)
+    return text if len(text) <= 40 else text[:37] + "..."
+
+
+def _type_name(value: Any) -> str:
+    if value is None:
+        return "null"
+    return {bool: "bool", int: "int", float: "float", str: "str", list: "array", dict: "object"}.get(
+        type(value), type(value).__name__)
+
+
+# json.load only produces these exact types, so membership in a set of types
+# is both correct (bool is not accepted as int) and cheaper than isinstance().
+KIND_TYPES = {
+    "str": frozenset({str}),
+    "bool": frozenset({bool}),
+    "int": frozenset({int}),
+    "number": frozenset({int, float}),
+    "object": frozenset({dict}),
+    "map": frozenset({dict}),
+    "array": frozenset({list}),
+}
+
+
+def compile_field(field: Field) -> Check:
+    """Turn a Field into a check function (done once per schema)."""
+    if field.kind == "object":
+        return _compile_object(field)
+    if field.kind == "map":
+        return _compile_map(field)
+    if field.kind == "array":
+        return _compile_array(field)
+
+    types, constraints = _compile_scalar(field)
+    expected = field.kind
+
+    def check(value: Any, parent: str, key: Any, errors: List[SchemaError]) -> None:
+        if type(value) not in types:
+            errors.append(SchemaError(_path(parent, key),
+                                      f"expected {expected}, got {_type_name(value)} ({_describe(value)})"))
+            return
+        for constraint in constraints:
+            message = constraint(value)
+            if message is not None:
+                errors.append(SchemaError(_path(parent, key), message))
+
+    return check
+
+
+def _compile_scalar(field: Field) -> Tuple[frozenset, Tuple[Callable[[Any], Optional[str]], ...]]:
+    """Accepted types and the range/enum/pattern constraints of a scalar field."""
+    if field.kind not in KIND_TYPES:
+        raise ValueError(f"Unknown field kind: {field.kind}")
+    constraints: List[Callable[[Any], Optional[str]]] = []
+    if field.minimum is not None:
+        minimum = field.minimum
+        constraints.append(lambda v: None if v >= minimum else f"{v} is below the minimum {minimum}")
+    if field.maximum is not None:
+        maximum = field.maximum
+        constraints.append(lambda v: None if v <= maximum else f"{v} is above the maximum {maximum}")
+    if field.choices is not None:
+        choices = frozenset(field.choices)
+        allowed = " | ".join(field.choices)
+        constraints.append(lambda v: None if v in choices else f"{_describe(v)} is not one of {allowed}")
+    if field.pattern is not None:
+        regex = re.compile(field.pattern)
+        constraints.append(lambda v: None if regex.match(v) else f"{_describe(v)} does not match {regex.pattern}")
+    return KIND_TYPES[field.kind], tuple(constraints)
+
+
+def _compile_object(field: Field) -> Check:
+    # Scalar fields are checked inline; only nested containers get a call
+    scalars = {name: (*_compile_scalar(child), child.kind) for name, child in field.fields.items()
+               if child.kind not in ("object", "map", "array")}
+    containers = {name: compile_field(child) for name, child in field.fields.items() if name not in scalars}
+    required = frozenset(name for name, child in field.fields.items()
+                         if not child.optional and child.required_when is None)
+    conditional = [(name, child.required_when) for name, child in field.fields.items()
+                   if child.required_when is not None]
+
+    def check(value: Any, parent: str, key: Any, errors: List[SchemaError]) -> None:
+        path = _path(parent, key) if key is not None else parent
+        if type(value) is not dict:
+            errors.append(SchemaError(path, f"expected object, got {_type_name(value)}"))
+            return
+        if not required <= value.keys():
+            for name in sorted(required - value.keys()):
+                errors.append(SchemaError(f"{path}.{name}", "missing required field"))
+        for name, (sibling, sibling_value) in conditional:
+            if name not in value and value.get(sibling) == sibling_value:
+                errors.append(SchemaError(f"{path}.{name}",
+                                          f"missing (required when {sibling} is {_describe(sibling_value)})"))
+        for name, item in value.items():
+            scalar = scalars.get(name)
+            if scalar is not None:
+                types, constraints, expected = scalar
+                if type(item) not in types:
+                    errors.append(SchemaError(f"{path}.{name}",
+                                              f"expected {expected}, got {_type_name(item)} ({_describe(item)})"))
+                    continue
+                for constraint in constraints:
+                    message = constraint(item)
+                    if message is not None:
+                        errors.append(SchemaError(f"{path}.{name}", message))
+                continue
+            child = containers.get(name)
+            if child is None:
+                errors.append(SchemaError(f"{path}.{name}", "unknown field"))
+            else:
+                child(item, path, name, errors)
+
+    return check
+
+
+def _compile_map(field: Field) -> Check:
+    key_regex = re.compile(field.keys) if field.keys else None
+    value_check = compile_field(field.values) if field.values else None
+
+    def check(value: Any, parent: str, key: Any, errors: List[SchemaError]) -> None:
+        path = _path(parent, key) if key is not None else parent
+        if type(value) is not dict:
+            errors.append(SchemaError(path, f"expected object, got {_type_name(value)}"))
+            return
+        for name, item in value.items():
+            if key_regex is not None and not key_regex.match(name):
+                errors.append(SchemaError(f"{path}.{name}", f"key does not match {key_regex.pattern}"))
+            if value_check is not None:
+                value_check(item, path, name, errors)
+
+    return check
+
+
+def _compile_array(field: Field) -> Check:
+    item_check = compile_field(field.items) if field.items else None
+    unique = field.unique
+
+    def check(value: Any, parent: str, key: Any, errors: List[SchemaError]) -> None:
+        path = _path(parent, key) if key is not None else parent
+        if type(value) is not list:
+            errors.append(SchemaError(path, f"expected array, got {_type_name(value)}"))
+            return
+        seen: Dict[Any, int] = {}
+        for index, item in enumerate(value):
+            if item_check is not None:
+                item_check(item, path, index, errors)
+            if unique is not None and isinstance(item, dict):
+                identifier = item.get(unique)
+                if isinstance(identifier, (str, int)):
+                    if identifier in seen:
+                        errors.append(SchemaError(f"{path}[{index}].{unique}",
+                                                  f"duplicate {unique} {_describe(identifier)} "
+                                                  f"(first at [{seen[identifier]}])"))
+                    else:
+                        seen[identifier] = index
+
+    return check
+
+
+class DataSchema:
+    """A data file's schema, compiled on construction."""
+    def __init__(self, file_name: str, root: Field):
+        self.file_name = file_name
+        self.path = DATA_DIR / file_name
+        self._check = compile_field(root)
+
+    def validate(self, data: Any, label: Optional[str] = None) -> List[SchemaError]:
+        """Every schema error in `data` (an already parsed JSON document)."""
+        errors: List[SchemaError] = []
+        self._check(data, label or self.file_name, None, errors)
+        return errors
+
+    def load(self, path: Optional[Path] = None) -> Tuple[Any, List[SchemaError]]:
+        """Parse and validate a data file; returns (data, errors)."""
+        path = path or self.path
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except json.JSONDecodeError as e:
+            return None, [SchemaError(path.name, f"invalid JSON: {e.msg} (line {e.lineno}, column {e.colno})")]
+        except OSError as e:
+            return None, [SchemaError(path.name, f"cannot read: {e.strerror}")]
+        return data, self.validate(data, path.name)
+
+
+def _weapon_field(kind: str, minimum: Optional[float] = None) -> Field:
+    """Weapon-only item field: required on type == "weapon" items."""
+    return Field(kind, minimum=minimum, required_when=("type", "weapon"))
+
+
+def _duration() -> Field:
+    return Field("object", fields={"duration": Field("int", minimum=0)})
+
+
+SCHEMAS: Dict[str, DataSchema] = {
+    "weapons": DataSchema("weapons.json", Field("array", unique="id", items=Field("object", fields={
+        "id": Field("str", pattern=ID_PATTERN),
+        "name": Field("str"),
+        "damage": Field("int", minimum=0),
+        "fire_rate": Field("number", minimum=0),
+        "projectile_speed": Field("int", minimum=0),
+        "range": Field("int", minimum=0),
+        "is_premium": Field("bool"),
+        "rarity": Field("str", choices=RARITIES),
+        "sprite": Field("str"),
+    }))),
+    "enemies": DataSchema("enemies.json", Field("array", unique="id", items=Field("object", fields={
+        "id": Field("str", pattern=ID_PATTERN),
+        "name": Field("str"),
+        "color": Field("str", pattern=HEX_COLOR_PATTERN),
+        "size": Field("int", minimum=1),
+        "base_hp": Field("int", minimum=1),
+        "base_speed": Field("int", minimum=0),
+        "base_damage": Field("int", minimum=0),
+        "base_value": Field("int", minimum=0),
+        "spawn_weight": Field("int", minimum=0, maximum=100),
+        "drop_chance": Field("number", minimum=0, maximum=1),
+    }))),
+    "items": DataSchema("items.json", Field("array", unique="id", items=Field("object", fields={
+        "id": Field("str", pattern=ID_PATTERN),
+        "name": Field("str"),
+        "description": Field("str"),
+        "type": Field("str", choices=ITEM_TYPES),
+        "rarity": Field("str", choices=RARITIES),
+        # Stat modifiers may be negative (trade-offs)
+        "stats": Field("map", keys=STAT_NAME_PATTERN, values=Field("int")),
+        "base_damage": _weapon_field("int", minimum=0),
+        "damage_type": Field("str", choices=DAMAGE_TYPES, required_when=("type", "weapon")),
+        "fire_rate": _weapon_field("number", minimum=0),
+        "projectile_speed": _weapon_field("int", minimum=0),
+        "base_range": _weapon_field("int", minimum=0),
+        "max_durability": _weapon_field("int", minimum=0),
+        "max_fuse_tier": _weapon_field("int", minimum=1),
+        "base_value": _weapon_field("int", minimum=0),
+    }))),
+    "game_constants": DataSchema("game_constants.json", Field("object", fields={
+        "viewport": Field("object", fields={
+            "width": Field("int", minimum=1),
+            "height": Field("int", minimum=1),
+            "background_color": Field("str", pattern=HEX_COLOR_PATTERN),
+            "background_dark": Field("str", pattern=HEX_COLOR_PATTERN),
+        }),
+        "asset_config": Field("object", fields={
+            "sprite_size": Field("int", minimum=1),
+            "scale_factor": Field("number", minimum=0),
+            "texture_format": Field("str", choices=("png", "webp", "jpg")),
+            "enemy_texture_size": Field("int", minimum=1),
+            "player_texture_size": Field("int", minimum=1),
+        }),
+        "monetization": Field("object", fields={
+            "premium_price": Field("number", minimum=0),
+            "free_limits": Field("map", values=Field("int", minimum=0)),
+            "premium_previews": Field("map", values=_duration()),
+        }),
+        "game_balance": Field("object", fields={
+            "player": Field("map", values=Field("number", minimum=0)),
+            "enemies": Field("map", values=Field("number", minimum=0)),
+            "waves": Field("map", values=Field("number", minimum=0)),
+        }),
+    })),
+}
+
+
+def load_records(name: str, path: Optional[Path] = None) -> Tuple[Any, List[SchemaError]]:
+    """Load one data file by schema name ("weapons", "items", ...)."""
+    return SCHEMAS[name].load(path)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    names = (argv if argv is not None else sys.argv[1:]) or list(SCHEMAS)
+    unknown = [name for name in names if name not in SCHEMAS]
+    if unknown:
+        print(f"Unknown data file: {', '.join(unknown)} (choose from {', '.join(SCHEMAS)})")
+        return 2
+
+    failed = False
+    for name in names:
+        schema = SCHEMAS[name]
+        _, errors = schema.load()
+        if errors:
+            failed = True
+            print(f"✗ {schema.file_name}: {len(errors)} error(s)")
+            for error in errors:
+                print(f"  {error}")
+        else:
+            print(f"✓ {schema.file_name}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())